@@ -0,0 +1,120 @@
+"""
+Memory benchmark for store entries: free-form dicts versus slotted records.
+
+Builds the same entries for each store both ways and reports the bytes each
+entry's containers take (field values are created beforehand and shared, so
+only the per-entry overhead is compared).
+
+Usage:
+    python benchmarks/store_memory.py [--entries 100000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from livewire.stores import records  # noqa: E402
+
+
+def customer_values(i: int) -> Dict:
+    return {
+        "member_id": f"M{i:07d}",
+        "first_name": f"First{i}",
+        "last_name": f"Last{i}",
+        "email": f"member{i}@example.com",
+        "password": f"secret{i}",
+        "phone": f"+1555{i:07d}",
+        "display_name": f"Member {i}",
+        "job_title": "Engineer",
+        "company_name": "Example Inc",
+        "premium_member": True,
+    }
+
+
+def user_values(i: int) -> Dict:
+    return {
+        "password_hash": f"scrypt:32768:8:1$salt{i}$hash{i}",
+        "subscriber_id": f"sub-{i:08d}",
+        "display_name": f"User {i}",
+        "first_name": f"First{i}",
+        "last_name": f"Last{i}",
+    }
+
+
+def presence_values(i: int) -> Dict:
+    return {
+        "address": f"/private/user-{i:08d}",
+        "online": True,
+        "last_seen": datetime.now(UTC),
+    }
+
+
+def call_info_values(i: int) -> Dict:
+    now = time.time()
+    return {
+        "data": {"project_id": f"project-{i % 10}"},
+        "expires_at": now + 3600,
+        "last_access": now,
+    }
+
+
+# store: (values factory, dict layout, record layout)
+CASES = {
+    "customer_store": (customer_values, dict, records.CustomerRecord.from_dict),
+    "user_store": (user_values, dict, records.UserRecord.from_dict),
+    "active_subscribers_store": (
+        presence_values,
+        dict,
+        records.PresenceRecord.from_dict,
+    ),
+    "call_info_store": (call_info_values, dict, records.CallInfoEntry.from_dict),
+}
+
+
+def measure(values: List[Dict], build: Callable[[Dict], object]) -> float:
+    """
+    Measure the bytes allocated per entry by building every entry.
+
+    Args:
+        values (List[Dict]): Field values of each entry
+        build (Callable[[Dict], object]): Builds one entry from its values
+
+    Returns:
+        float: Bytes per entry
+    """
+    gc.collect()
+    tracemalloc.start()
+    entries = [build(v) for v in values]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Exclude the list holding the entries
+    size -= sys.getsizeof(entries)
+    del entries
+    return size / len(values)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{args.entries} entries per store")
+    print(f"{'store':<26}{'dict B/entry':>14}{'record B/entry':>16}{'saved':>8}")
+    for name, (make_values, as_dict, as_record) in CASES.items():
+        values = [make_values(i) for i in range(args.entries)]
+        # dict() copies only the top level, like the stores' dict entries did
+        before = measure(values, as_dict)
+        after = measure(values, as_record)
+        saved = 100 * (before - after) / before
+        print(f"{name:<26}{before:>14.0f}{after:>16.0f}{saved:>7.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark for building the /api/swml response.
+
+Issues calls at a fixed rate and reports the achieved rate, per-call latency
+and the share of wall time spent building responses, for:
+
+  uncached  read, format and YAML-parse main_swml.yaml, then jsonify
+  compiled  render the compiled template, then jsonify
+  cached    write the cached serialized bytes with their ETag
+
+Usage:
+    python benchmarks/swml_render.py [--rate 1000] [--seconds 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from flask import Flask, Response, jsonify  # noqa: E402
+
+from livewire.utils import swml_utils  # noqa: E402
+
+MAIN_SWML_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "src",
+    "livewire",
+    "routes",
+    "api",
+    "main_swml",
+    "main_swml.yaml",
+)
+PUBLIC_URL = "https://livewire.example.ngrok.app"
+
+
+def uncached() -> Response:
+    data = swml_utils._load_swml_uncached(MAIN_SWML_FILE, public_url=PUBLIC_URL)
+    return jsonify(data)
+
+
+def compiled() -> Response:
+    data = swml_utils.load_swml_with_vars(MAIN_SWML_FILE, public_url=PUBLIC_URL)
+    return jsonify(data)
+
+
+def cached() -> Response:
+    document = swml_utils.render_swml_json(MAIN_SWML_FILE, public_url=PUBLIC_URL)
+    response = Response(document.body, mimetype="application/json")
+    response.headers["Repr-Digest"] = f"sha-256=:{document.digest}:"
+    response.set_etag(document.etag)
+    return response
+
+
+def run(build: Callable[[], Response], rate: float, seconds: float) -> Dict:
+    """
+    Call build() at a fixed rate, or as fast as it goes if it can't keep up.
+
+    Args:
+        build (Callable[[], Response]): Builds one response
+        rate (float): Target calls per second
+        seconds (float): Duration
+
+    Returns:
+        Dict: Achieved rate, latency percentiles (us) and busy share
+    """
+    build()  # warm up caches
+    interval = 1.0 / rate
+    calls = int(rate * seconds)
+    latencies = []
+    started = time.perf_counter()
+    for i in range(calls):
+        delay = started + i * interval - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        t0 = time.perf_counter()
+        build()
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rate": calls / elapsed,
+        "p50": latencies[len(latencies) // 2] * 1e6,
+        "p99": latencies[int(len(latencies) * 0.99)] * 1e6,
+        "mean": statistics.fmean(latencies) * 1e6,
+        "busy": sum(latencies) / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rate", type=float, default=1000.0)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    print(f"Target: {args.rate:.0f} calls/s for {args.seconds:.0f}s")
+    print(
+        f"{'path':<10} {'calls/s':>9} {'p50 us':>9} {'p99 us':>9} "
+        f"{'mean us':>9} {'busy':>6}"
+    )
+    with app.app_context():
+        for name, build in (
+            ("uncached", uncached),
+            ("compiled", compiled),
+            ("cached", cached),
+        ):
+            result = run(build, args.rate, args.seconds)
+            print(
+                f"{name:<10} {result['rate']:>9.0f} {result['p50']:>9.1f} "
+                f"{result['p99']:>9.1f} {result['mean']:>9.1f} "
+                f"{result['busy']:>6.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ from flask import Flask, flash, redirect, request, url_for
 from ngrok import ngrok
 
 from livewire.routes import register_app_blueprints, swaig
+from livewire.stores.change_feed import serve_change_feed
+from livewire.stores.customer_io import import_customers, log_progress
 from livewire.utils.session_utils import (has_sw_credentials,
                                           is_subscriber_logged_in)
 
@@ -51,6 +53,21 @@ def create_app() -> Flask:
     # Register blueprints
     register_app_blueprints(app)
 
+    # Bulk-load existing members, e.g. from a CRM export
+    customer_import = os.environ.get("LIVEWIRE_CUSTOMER_IMPORT")
+    if customer_import:
+        try:
+            report = import_customers(customer_import, progress=log_progress)
+        except (OSError, ValueError) as e:
+            # Start with the default sample customer rather than not at all
+            logger.error(f"Skipping customer import from {customer_import}: {e}")
+        else:
+            for error in report["errors"]:
+                logger.warning(f"Rejected customer import row at {error}")
+
+    # Stream presence and call info changes to local processes if configured
+    serve_change_feed(os.environ.get("LIVEWIRE_CHANGE_FEED_SOCKET", ""))
+
     # Global middleware for authentication
     @app.before_request
     def auth_middleware() -> None:
@@ -7,6 +7,8 @@ from .call_status import *
 from .create_member import *
 from .create_sat import *
 from .main_swml import *
+from .metrics import *
+from .subscriber_heartbeat import *
 from .subscriber_offline import *
 from .swml_handler import *
 from .widget_config import *
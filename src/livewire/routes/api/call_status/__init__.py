@@ -7,7 +7,8 @@ import logging
 
 from flask import jsonify, request
 
-from livewire.stores.call_info_store import get_call_info_store, remove_call
+from livewire.stores.call_info_store import (get_call_ids, get_call_info,
+                                             remove_call)
 from livewire.utils.api_utils import (api_error, api_success,
                                       validate_json_request)
 
@@ -35,11 +36,7 @@ def call_status():
 
         # Process only if segment_id exists
         if segment_id:
-            # Get the call info store
-            call_info_store = get_call_info_store()
-            call_ids = list(call_info_store.keys())
-
-            call_info = call_info_store.get(segment_id)
+            call_info = get_call_info(segment_id)
             if call_info:
                 # Only remove call when it's in disconnected state
                 if connect_state == "disconnected":
@@ -50,7 +47,7 @@ def call_status():
                         )
             else:
                 logger.debug(
-                    f"Call {segment_id} not found in store. Available IDs: {call_ids}"
+                    f"Call {segment_id} not found in store. Available IDs: {get_call_ids()}"
                 )
         else:
             logger.info(
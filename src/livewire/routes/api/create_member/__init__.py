@@ -8,7 +8,7 @@ import random
 
 from flask import request
 
-from livewire.stores.call_info_store import get_call_info_store
+from livewire.stores.call_info_store import get_call_ids
 from livewire.stores.customer_store import add_customer, get_customer_store
 from livewire.utils.api_utils import (api_error, api_success, validate_email,
                                       validate_json_request)
@@ -41,9 +41,7 @@ def get_current_call_id_from_sources():
 
     # Try from call_info_store as last resort
     if not call_id:
-        call_info_store = get_call_info_store()
-        if call_info_store:
-            call_id = next(iter(call_info_store.keys()), None)
+        call_id = next(iter(get_call_ids()), None)
 
     return call_id
 
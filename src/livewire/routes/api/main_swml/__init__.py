@@ -1,11 +1,11 @@
 import logging
 import os
 
-from flask import current_app, jsonify, request
+from flask import Response, current_app, request
 
 from livewire.stores.call_info_store import set_call_context
 from livewire.utils.api_utils import api_error, validate_json_request
-from livewire.utils.swml_utils import load_swml_with_vars
+from livewire.utils.swml_utils import render_swml_json
 
 from .. import api_bp
 
@@ -32,7 +32,8 @@ def swml():
     Generate SWML for incoming calls and set call context.
 
     Returns:
-        tuple: SWML JSON response or error
+        tuple: SWML JSON response, 304 if the caller's If-None-Match has
+        the document's ETag, or error
     """
     try:
         # Extract call context from the incoming request
@@ -44,13 +45,22 @@ def swml():
         set_call_context(call_id, project_id)
         logger.info(f"Set call context for call_id={call_id}, project_id={project_id}")
 
-        # Generate SWML with variables
+        # Generate SWML with variables; the serialized document is cached
+        # for as long as the template and PUBLIC_URL stay the same
         public_url = current_app.config["PUBLIC_URL"]
-        swml_data = load_swml_with_vars(swml_file=main_swml_file, public_url=public_url)
+        document = render_swml_json(swml_file=main_swml_file, public_url=public_url)
+        if document is None:
+            return api_error("Could not generate SWML", 500)
         logger.info(f"Generated SWML for call_id={call_id}")
 
-        # Return SWML as a direct JSON response (special case for SignalWire's expected format)
-        return jsonify(swml_data), 200
+        if request.if_none_match.contains(document.etag):
+            response = Response(status=304)
+        else:
+            # Return SWML as a direct JSON response (special case for SignalWire's expected format)
+            response = Response(document.body, mimetype="application/json")
+            response.headers["Repr-Digest"] = f"sha-256=:{document.digest}:"
+        response.set_etag(document.etag)
+        return response
 
     except Exception as e:
         logger.exception(f"Error generating SWML: {e}")
@@ -0,0 +1,52 @@
+"""
+Metrics API endpoint.
+Reports connection, client, rate limiting, circuit breaker, and cache
+counters for capacity tuning.
+"""
+
+import logging
+
+from livewire.routes.api import api_bp
+from livewire.stores.active_subscribers_store import get_presence_stats
+from livewire.stores.backends import get_journal_stats
+from livewire.stores.call_info_store import get_call_info_stats
+from livewire.stores.change_feed import get_change_feed_stats
+from livewire.utils.api_utils import api_success
+from livewire.utils.circuit_breaker import get_circuit_breaker_stats
+from livewire.utils.client_registry import get_registry_stats
+from livewire.utils.connection_pool import get_pool_stats
+from livewire.utils.guest_token_cache import get_guest_token_stats
+from livewire.utils.handler_address_cache import get_handler_address_stats
+from livewire.utils.rate_limiter import get_rate_limiter_stats
+from livewire.utils.single_flight import get_single_flight_stats
+from livewire.utils.subscriber_index import get_subscriber_index_stats
+from livewire.utils.swml_utils import get_swml_template_stats
+
+logger = logging.getLogger(__name__)
+
+
+@api_bp.route("/api/metrics", methods=["GET"])
+def metrics() -> tuple:
+    """
+    Get in-process performance counters.
+
+    Returns:
+        tuple: (JSON response, HTTP status code)
+    """
+    return api_success(
+        {
+            "connection_pools": get_pool_stats(),
+            "client_registry": get_registry_stats(),
+            "rate_limiters": get_rate_limiter_stats(),
+            "circuit_breakers": get_circuit_breaker_stats(),
+            "coalesced_reads": get_single_flight_stats(),
+            "guest_tokens": get_guest_token_stats(),
+            "call_info_store": get_call_info_stats(),
+            "presence": get_presence_stats(),
+            "change_feed": get_change_feed_stats(),
+            "store_journals": get_journal_stats(),
+            "handler_addresses": get_handler_address_stats(),
+            "subscriber_indexes": get_subscriber_index_stats(),
+            "swml_templates": get_swml_template_stats(),
+        }
+    )
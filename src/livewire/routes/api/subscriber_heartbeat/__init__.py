@@ -0,0 +1,67 @@
+"""
+Subscriber Heartbeat API endpoint.
+Keeps a subscriber online while their dashboard is open. Subscribers that stop
+sending heartbeats (closed laptop, lost network) are marked offline
+automatically after SUBSCRIBER_PRESENCE_TIMEOUT seconds.
+"""
+
+import logging
+
+from livewire.routes.api import api_bp
+from livewire.stores.active_subscribers_store import (
+    SUBSCRIBER_HEARTBEAT_INTERVAL, SUBSCRIBER_PRESENCE_TIMEOUT,
+    heartbeat_subscriber, set_active_subscriber)
+from livewire.utils.api_utils import (api_error, api_success,
+                                      validate_json_request)
+from livewire.utils.session_utils import get_rest_client
+from livewire.utils.signalwire_client import SignalWireAPIError
+
+logger = logging.getLogger(__name__)
+
+
+@api_bp.route("/api/subscriber_heartbeat/<subscriber_id>", methods=["POST"])
+@validate_json_request(
+    required_fields=[],  # No specific fields required
+    field_types={},  # No field type validation needed
+)
+def subscriber_heartbeat(subscriber_id):
+    """
+    Record a heartbeat from a subscriber's dashboard.
+    If the subscriber is unknown (e.g. the server restarted), their address is
+    fetched again and they are marked active.
+
+    Args:
+        subscriber_id: The ID of the subscriber sending the heartbeat
+
+    Returns:
+        tuple: JSON response with the heartbeat interval and timeout in seconds
+    """
+    # Validate subscriber_id parameter
+    if not subscriber_id or subscriber_id in ("null", "undefined"):
+        return api_error("No valid subscriber_id provided", 400)
+
+    timing = {
+        "interval": SUBSCRIBER_HEARTBEAT_INTERVAL,
+        "timeout": SUBSCRIBER_PRESENCE_TIMEOUT,
+    }
+    try:
+        if heartbeat_subscriber(subscriber_id):
+            return api_success(timing)
+
+        client = get_rest_client()
+        if not client:
+            return api_error("SignalWire client not initialized", 400)
+        address = client.fetch_subscriber_address(subscriber_id)
+        if not address:
+            return api_error("Subscriber address not found", 404)
+        set_active_subscriber(subscriber_id, address)
+        logger.info(f"Marked subscriber {subscriber_id} as active from heartbeat")
+        return api_success(timing, "Subscriber marked as online")
+    except SignalWireAPIError as e:
+        logger.warning(f"Error fetching subscriber address: {e.message}")
+        return api_error("Failed to fetch subscriber address", 502)
+    except Exception as e:
+        logger.exception(
+            f"Error recording heartbeat for subscriber {subscriber_id}: {e}"
+        )
+        return api_error(f"Failed to record heartbeat: {str(e)}", 500)
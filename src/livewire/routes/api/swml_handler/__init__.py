@@ -10,10 +10,12 @@ from flask import current_app, request
 from livewire.routes.api import api_bp
 from livewire.utils.api_utils import (api_error, api_success,
                                       validate_json_request)
+from livewire.utils.client_registry import get_client
+from livewire.utils.handler_address_cache import get_handler_address_info
+from livewire.utils.pipeline import PipelineStep
 from livewire.utils.session_utils import (get_session_vars,
                                           set_swml_handler_info)
-from livewire.utils.signalwire_client import (SignalWireAPIError,
-                                              SignalWireClient)
+from livewire.utils.signalwire_client import SignalWireAPIError
 
 logger = logging.getLogger(__name__)
 
@@ -38,17 +40,30 @@ def create_or_update_handler(
     Returns:
         tuple: (handler_id, destination, created_flag) or (None, None, None) on error
     """
-    client = SignalWireClient(project_id, auth_token, space_name)
+    client = get_client(project_id, auth_token, space_name)
     request_url = f"{public_url.rstrip('/')}/api/swml"
 
     try:
         # Try to update first if we have an ID
         if swml_id:
             try:
-                client.update_swml_handler(swml_id, "LiveWire", request_url)
-                addresses = client.get_handler_addresses(swml_id)
-                destination = client.extract_audio_destination(addresses)
-                return swml_id, destination, False  # Updated
+                # The handler's addresses don't depend on the update, so
+                # fetch them while the update is in flight
+                result = client.run_pipeline(
+                    [
+                        PipelineStep(
+                            "update",
+                            lambda: client.update_swml_handler(
+                                swml_id, "LiveWire", request_url
+                            ),
+                        ),
+                        PipelineStep(
+                            "addresses",
+                            lambda: get_handler_address_info(client, swml_id),
+                        ),
+                    ]
+                )
+                return swml_id, result["addresses"]["destination"], False  # Updated
             except SignalWireAPIError as e:
                 logger.warning(
                     f"Failed to update SWML handler {swml_id}, will try to create new. Details: {e.message}"
@@ -58,9 +73,9 @@ def create_or_update_handler(
         # Create new handler
         response = client.create_swml_handler("LiveWire", request_url)
         new_swml_id = response.get("id")
-        addresses = client.get_handler_addresses(new_swml_id)
-        destination = client.extract_audio_destination(addresses)
-        return new_swml_id, destination, True  # Created
+        # Addresses can only be fetched once the handler ID is known
+        addresses = get_handler_address_info(client, new_swml_id)
+        return new_swml_id, addresses["destination"], True  # Created
 
     except SignalWireAPIError as e:
         logger.error(f"SignalWire API error: {e.message}")
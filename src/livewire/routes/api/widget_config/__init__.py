@@ -8,6 +8,8 @@ import logging
 from livewire.routes.api import api_bp
 from livewire.utils.api_utils import (api_error, api_success,
                                       validate_json_request)
+from livewire.utils.guest_token_cache import get_guest_token
+from livewire.utils.handler_address_cache import get_handler_address_info
 from livewire.utils.session_utils import get_rest_client, get_session_vars
 from livewire.utils.signalwire_client import SignalWireAPIError
 
@@ -41,30 +43,21 @@ def get_widget_config() -> tuple:
         return api_error("SignalWire client not initialized", 400)
 
     try:
-        # Fetch addresses from handler
-        addresses_response = client.get_handler_addresses(swml_id)
-        destination = client.extract_audio_destination(addresses_response)
+        # Get the handler's destination and address, cached between requests
+        address_info = get_handler_address_info(client, swml_id)
+        destination = address_info["destination"]
 
         if not destination:
             return api_error(
                 "Failed to extract audio destination from SWML handler", 500
             )
 
-        # Get address ID from the first address
-        data = addresses_response.get("data", [])
-        if not data:
-            return api_error("No addresses found for SWML handler", 500)
-
-        address_id = data[0].get("id")
+        address_id = address_info["address_id"]
         if not address_id:
             return api_error("No address ID found in SWML handler response", 500)
 
-        # Request guest token
-        token_response = client.create_guest_token(address_id)
-        guest_token = token_response.get("token")
-
-        if not guest_token:
-            return api_error("Failed to get guest token from response", 500)
+        # Get a cached or pre-minted guest token, minting one only if needed
+        guest_token = get_guest_token(client, address_id)
 
         # Return successful response with config
         return api_success({"guest_token": guest_token, "destination": destination})
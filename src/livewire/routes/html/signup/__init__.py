@@ -9,7 +9,7 @@ from flask import flash, redirect, render_template, request, url_for
 from werkzeug.security import generate_password_hash
 
 from livewire.routes.html import html_bp
-from livewire.stores.user_store import get_user_store
+from livewire.stores.user_store import add_user, get_user_store
 from livewire.utils.form_utils import (build_subscriber_update_fields,
                                        build_user_store_entry,
                                        extract_signup_fields)
@@ -109,9 +109,7 @@ def signup() -> str:
                     }
                 if subscriber_id:
                     # Store user in local store
-                    get_user_store()[email] = build_user_store_entry(
-                        form_data, subscriber_id
-                    )
+                    add_user(email, build_user_store_entry(form_data, subscriber_id))
                     # Redirect to login with email prefilled
                     return redirect(url_for("html.login", prefill_email=email))
             except Exception as e:
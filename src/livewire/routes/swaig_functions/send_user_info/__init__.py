@@ -6,13 +6,11 @@ Transfers the call to available subscriber agents with user information.
 import logging
 import os
 
-import yaml
 from flask import current_app
 from signalwire_swaig import SWAIGArgument, SWAIGFunctionProperties
 
 from livewire.routes import swaig
-from livewire.stores.active_subscribers_store import \
-    get_active_subscribers_by_project
+from livewire.stores.active_subscribers_store import get_online_addresses
 from livewire.stores.call_info_store import get_call_context, set_call_info
 from livewire.utils.swml_utils import load_swml_with_vars
 
@@ -70,15 +68,8 @@ def send_user_info(first_name: str, last_name: str, summary: str, **kwargs):
                 logger.info(
                     f"[send_user_info] Looking for active subscribers in project: {project_id}"
                 )
-                active_subs = get_active_subscribers_by_project(project_id)
-                logger.info(
-                    f"[send_user_info] Found {len(active_subs)} active subscribers: {active_subs}"
-                )
-
-                # Extract addresses from active subscribers
-                addresses = [
-                    v["address"] for v in active_subs.values() if v.get("address")
-                ]
+                # Addresses come precomputed from the online subscriber index
+                addresses = get_online_addresses(project_id)
                 logger.info(
                     f"[send_user_info] Found {len(addresses)} subscriber addresses for transfer: {addresses}"
                 )
@@ -91,15 +82,10 @@ def send_user_info(first_name: str, last_name: str, summary: str, **kwargs):
                 "[send_user_info] No project_id found in call context, cannot find subscribers for transfer"
             )
 
-        # Build parallel transfer block for SWML
-        try:
-            parallel_block = yaml.dump(
-                [{"to": addr} for addr in addresses], default_flow_style=True
-            ).strip()
-            logger.info(f"[send_user_info] Parallel block for SWML: {parallel_block}")
-        except Exception as e:
-            logger.exception(f"[send_user_info] Error building parallel block: {e}")
-            parallel_block = ""
+        # Build parallel transfer block for SWML; the compiled template inserts
+        # the list as is, without a YAML round trip
+        parallel_block = [{"to": addr} for addr in addresses]
+        logger.info(f"[send_user_info] Parallel block for SWML: {parallel_block}")
 
         # Load and populate SWML template
         try:
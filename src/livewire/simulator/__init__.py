@@ -0,0 +1,500 @@
+"""
+Local SignalWire API simulator for the LiveWire demo app.
+Serves the subset of the SignalWire REST API used by SignalWireClient from
+memory, with configurable latency, injected errors and 429s, and paginated
+list responses, so LiveWire can be load tested without a real space.
+
+Run it with ``python -m livewire.simulator`` and point the app at it with
+SIGNALWIRE_API_BASE_URL=http://localhost:<port>/api.
+"""
+
+import logging
+import random
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import Flask, jsonify, request
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE: int = 50
+MAX_PAGE_SIZE: int = 1000
+
+
+def parse_latency(spec: str) -> Callable[[], float]:
+    """
+    Parse a latency distribution spec into a sampler returning seconds.
+
+    Supported specs (all values in seconds):
+        "0" or "fixed:0.05"        - constant latency
+        "uniform:0.02,0.2"         - uniform between two bounds
+        "normal:0.05,0.01"         - normal with mean and standard deviation
+        "lognormal:0.05,0.5"       - lognormal with median and sigma (long tail)
+        "exponential:0.05"         - exponential with the given mean
+
+    Args:
+        spec (str): The latency spec
+
+    Returns:
+        Callable[[], float]: Function sampling a non-negative latency
+
+    Raises:
+        ValueError: If the spec is not recognized
+    """
+    kind, _, args = spec.partition(":")
+    if not args:
+        kind, args = "fixed", kind
+    try:
+        values = [float(v) for v in args.split(",")]
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec}")
+
+    samplers: Dict[Tuple[str, int], Callable[[], float]] = {
+        ("fixed", 1): lambda: values[0],
+        ("uniform", 2): lambda: random.uniform(values[0], values[1]),
+        ("normal", 2): lambda: random.gauss(values[0], values[1]),
+        ("lognormal", 2): lambda: values[0] * random.lognormvariate(0, values[1]),
+        ("exponential", 1): lambda: random.expovariate(1 / values[0]),
+    }
+    sampler = samplers.get((kind, len(values)))
+    if sampler is None:
+        raise ValueError(f"Invalid latency spec: {spec}")
+    return lambda: max(sampler(), 0.0)
+
+
+class SimulatorConfig:
+    """
+    Runtime behavior of the simulator. Can be changed while it runs through
+    ``POST /__simulator/config``.
+    """
+
+    def __init__(
+        self,
+        latency: str = "0",
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: Optional[float] = 1.0,
+        default_page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> None:
+        """
+        Initialize the simulator configuration.
+
+        Args:
+            latency (str): Latency distribution spec (see parse_latency)
+            error_rate (float): Fraction of requests failing with a 500/502/503
+            rate_limit_rate (float): Fraction of requests rejected with a 429
+            retry_after (Optional[float]): Retry-After seconds sent with 429s, or None to omit
+            default_page_size (int): Page size used when a request sends none
+        """
+        self.set_latency(latency)
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.default_page_size = default_page_size
+
+    def set_latency(self, spec: str) -> None:
+        """
+        Change the latency distribution.
+
+        Args:
+            spec (str): Latency distribution spec (see parse_latency)
+
+        Raises:
+            ValueError: If the spec is not recognized
+        """
+        self.sample_latency = parse_latency(spec)
+        self.latency = spec
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """
+        Apply settings from a config update request.
+
+        Args:
+            values (Dict[str, Any]): Settings to change, keyed by attribute name
+
+        Raises:
+            ValueError: If a setting is unknown or invalid
+        """
+        for key, value in values.items():
+            if key == "latency":
+                self.set_latency(str(value))
+            elif key in ("error_rate", "rate_limit_rate"):
+                setattr(self, key, float(value))
+            elif key == "retry_after":
+                self.retry_after = None if value is None else float(value)
+            elif key == "default_page_size":
+                self.default_page_size = int(value)
+            else:
+                raise ValueError(f"Unknown simulator setting: {key}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the current settings.
+
+        Returns:
+            Dict[str, Any]: Current settings
+        """
+        return {
+            "latency": self.latency,
+            "error_rate": self.error_rate,
+            "rate_limit_rate": self.rate_limit_rate,
+            "retry_after": self.retry_after,
+            "default_page_size": self.default_page_size,
+        }
+
+
+class SimulatorState:
+    """
+    In-memory resources served by the simulator.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize empty state.
+        """
+        self.lock = threading.Lock()
+        self.handlers: Dict[str, Dict[str, Any]] = {}
+        self.subscribers: Dict[str, Dict[str, Any]] = {}
+        self.addresses: Dict[str, List[Dict[str, Any]]] = {}
+        self.requests = 0
+        self.injected: Dict[str, int] = {"errors": 0, "rate_limited": 0}
+        self.commands: Dict[str, int] = {}
+
+    def add_address(self, resource_id: str, name: str, kind: str) -> None:
+        """
+        Give a resource an address with audio and video channels.
+        Must be called with the lock held.
+
+        Args:
+            resource_id (str): The handler or subscriber ID
+            name (str): Address name, used in the channel paths
+            kind (str): Resource type reported on the address
+        """
+        path = f"/public/{name}"
+        self.addresses.setdefault(resource_id, []).append(
+            {
+                "id": str(uuid.uuid4()),
+                "resource_id": resource_id,
+                "name": name,
+                "display_name": name,
+                "type": kind,
+                "channels": {
+                    "audio": f"{path}?channel=audio",
+                    "video": f"{path}?channel=video",
+                },
+            }
+        )
+
+    def add_subscriber(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a subscriber resource with one address.
+        Must be called with the lock held.
+
+        Args:
+            fields (Dict[str, Any]): Subscriber fields
+
+        Returns:
+            Dict[str, Any]: The subscriber resource
+        """
+        subscriber_id = str(uuid.uuid4())
+        subscriber = {k: v for k, v in fields.items() if k != "password"}
+        subscriber["id"] = subscriber_id
+        resource = {
+            "id": subscriber_id,
+            "type": "subscriber",
+            "display_name": subscriber.get("display_name")
+            or subscriber.get("email", ""),
+            "subscriber": subscriber,
+        }
+        self.subscribers[subscriber_id] = resource
+        self.add_address(subscriber_id, f"subscriber-{subscriber_id[:8]}", "subscriber")
+        return resource
+
+
+def _paginate(items: List[Dict[str, Any]], default_page_size: int) -> Tuple[Any, int]:
+    """
+    Build one page of a list response with SignalWire-style cursor links.
+
+    Args:
+        items (List[Dict[str, Any]]): The full list
+        default_page_size (int): Page size when the request sends none
+
+    Returns:
+        Tuple[Any, int]: ({"data": [...], "links": {...}}, 200), or a 400
+            response if page_size is not a positive integer
+    """
+    try:
+        page_size = int(request.args.get("page_size", default_page_size))
+    except ValueError:
+        page_size = 0
+    if page_size < 1:
+        return _bad_request("page_size must be a positive integer")
+    page_size = min(page_size, MAX_PAGE_SIZE)
+    try:
+        offset = int(request.args.get("page_token", "PA0")[2:])
+    except ValueError:
+        offset = 0
+
+    def link(token_offset: int) -> str:
+        return f"{request.base_url}?page_size={page_size}&page_token=PA{token_offset}"
+
+    links = {"self": link(offset), "first": link(0)}
+    if offset + page_size < len(items):
+        links["next"] = link(offset + page_size)
+    if offset > 0:
+        links["prev"] = link(max(offset - page_size, 0))
+    return jsonify({"data": items[offset : offset + page_size], "links": links}), 200
+
+
+def _bad_request(message: str) -> Tuple[Any, int]:
+    """
+    Build a SignalWire-style 400 response.
+
+    Args:
+        message (str): What was wrong with the request
+
+    Returns:
+        Tuple[Any, int]: (response_json, status_code)
+    """
+    return jsonify({"message": message}), 400
+
+
+def _not_found(kind: str) -> Tuple[Any, int]:
+    """
+    Build a SignalWire-style 404 response.
+
+    Args:
+        kind (str): The missing resource type
+
+    Returns:
+        Tuple[Any, int]: (response_json, status_code)
+    """
+    return jsonify({"message": f"{kind} not found"}), 404
+
+
+def create_simulator_app(
+    config: Optional[SimulatorConfig] = None, subscribers: int = 0
+) -> Flask:
+    """
+    Create the simulator Flask application.
+
+    Args:
+        config (Optional[SimulatorConfig]): Initial behavior (defaults to no latency or faults)
+        subscribers (int): Number of subscribers to pre-populate
+
+    Returns:
+        Flask: The simulator application
+    """
+    app = Flask(__name__)
+    config = config or SimulatorConfig()
+    state = SimulatorState()
+    app.config["SIMULATOR_CONFIG"] = config
+    app.config["SIMULATOR_STATE"] = state
+
+    with state.lock:
+        for i in range(subscribers):
+            state.add_subscriber(
+                {
+                    "email": f"user{i}@example.com",
+                    "first_name": "Sim",
+                    "last_name": f"User{i}",
+                }
+            )
+
+    @app.before_request
+    def simulate_network() -> Optional[Tuple[Any, int]]:
+        """
+        Apply latency and fault injection to every API request.
+        """
+        if request.path.startswith("/__simulator"):
+            return None
+        if not request.headers.get("Authorization"):
+            return jsonify({"message": "Unauthorized"}), 401
+
+        with state.lock:
+            state.requests += 1
+
+        time.sleep(config.sample_latency())
+
+        roll = random.random()
+        if roll < config.rate_limit_rate:
+            with state.lock:
+                state.injected["rate_limited"] += 1
+            response = jsonify({"message": "Too Many Requests"})
+            response.status_code = 429
+            if config.retry_after is not None:
+                response.headers["Retry-After"] = f"{config.retry_after:g}"
+            return response
+        if roll < config.rate_limit_rate + config.error_rate:
+            with state.lock:
+                state.injected["errors"] += 1
+            return jsonify({"message": "Injected server error"}), random.choice(
+                (500, 502, 503)
+            )
+        return None
+
+    # SWML handlers
+
+    handlers_path = "/api/fabric/resources/external_swml_handlers"
+
+    @app.route(handlers_path, methods=["GET"])
+    def list_handlers():
+        with state.lock:
+            items = list(state.handlers.values())
+        return _paginate(items, config.default_page_size)
+
+    @app.route(handlers_path, methods=["POST"])
+    def create_handler():
+        body = request.get_json(silent=True) or {}
+        handler_id = str(uuid.uuid4())
+        handler = {
+            "id": handler_id,
+            "type": "external_swml_handler",
+            "display_name": body.get("name", ""),
+            "external_swml_handler": {
+                "id": handler_id,
+                "name": body.get("name", ""),
+                "primary_request_url": body.get("primary_request_url", ""),
+            },
+        }
+        with state.lock:
+            state.handlers[handler_id] = handler
+            state.add_address(
+                handler_id,
+                f"{body.get('name', 'handler').lower()}-{handler_id[:8]}",
+                "app",
+            )
+        return jsonify(handler), 201
+
+    @app.route(f"{handlers_path}/<handler_id>", methods=["GET"])
+    def get_handler(handler_id: str):
+        with state.lock:
+            handler = state.handlers.get(handler_id)
+        return jsonify(handler) if handler else _not_found("Handler")
+
+    @app.route(f"{handlers_path}/<handler_id>", methods=["PATCH", "PUT"])
+    def update_handler(handler_id: str):
+        body = request.get_json(silent=True) or {}
+        with state.lock:
+            handler = state.handlers.get(handler_id)
+            if not handler:
+                return _not_found("Handler")
+            handler["external_swml_handler"].update(body)
+            handler["display_name"] = handler["external_swml_handler"].get("name", "")
+            return jsonify(handler)
+
+    @app.route(f"{handlers_path}/<handler_id>/addresses", methods=["GET"])
+    def get_handler_addresses(handler_id: str):
+        with state.lock:
+            if handler_id not in state.handlers:
+                return _not_found("Handler")
+            items = list(state.addresses.get(handler_id, []))
+        return _paginate(items, config.default_page_size)
+
+    # Subscribers
+
+    subscribers_path = "/api/fabric/resources/subscribers"
+
+    @app.route(subscribers_path, methods=["GET"])
+    def list_subscribers():
+        with state.lock:
+            items = list(state.subscribers.values())
+        return _paginate(items, config.default_page_size)
+
+    @app.route(subscribers_path, methods=["POST"])
+    def create_subscriber():
+        body = request.get_json(silent=True) or {}
+        if not body.get("email"):
+            return jsonify({"message": "email is required"}), 422
+        with state.lock:
+            email = body["email"].lower()
+            if any(
+                s["subscriber"].get("email", "").lower() == email
+                for s in state.subscribers.values()
+            ):
+                return jsonify({"message": "email has already been taken"}), 422
+            resource = state.add_subscriber(body)
+        return jsonify(resource), 201
+
+    @app.route(f"{subscribers_path}/<subscriber_id>", methods=["GET"])
+    def get_subscriber(subscriber_id: str):
+        with state.lock:
+            resource = state.subscribers.get(subscriber_id)
+        return jsonify(resource) if resource else _not_found("Subscriber")
+
+    @app.route(f"{subscribers_path}/<subscriber_id>", methods=["PUT", "PATCH"])
+    def update_subscriber(subscriber_id: str):
+        body = request.get_json(silent=True) or {}
+        with state.lock:
+            resource = state.subscribers.get(subscriber_id)
+            if not resource:
+                return _not_found("Subscriber")
+            resource["subscriber"].update(
+                {k: v for k, v in body.items() if k != "password"}
+            )
+            return jsonify(resource)
+
+    @app.route(f"{subscribers_path}/<subscriber_id>/addresses", methods=["GET"])
+    def get_subscriber_addresses(subscriber_id: str):
+        with state.lock:
+            if subscriber_id not in state.subscribers:
+                return _not_found("Subscriber")
+            items = list(state.addresses.get(subscriber_id, []))
+        return _paginate(items, config.default_page_size)
+
+    # Tokens
+
+    @app.route("/api/fabric/subscribers/tokens", methods=["POST"])
+    def create_subscriber_token():
+        body = request.get_json(silent=True) or {}
+        if not body.get("reference"):
+            return jsonify({"message": "reference is required"}), 422
+        return jsonify({"token": f"sim-sat-{uuid.uuid4().hex}"}), 201
+
+    @app.route("/api/fabric/guests/tokens", methods=["POST"])
+    def create_guest_token():
+        body = request.get_json(silent=True) or {}
+        if not body.get("allowed_address"):
+            return jsonify({"message": "allowed_address is required"}), 422
+        return jsonify({"token": f"sim-guest-{uuid.uuid4().hex}"}), 201
+
+    # Call control
+
+    @app.route("/api/calling/calls", methods=["POST"])
+    def call_command():
+        body = request.get_json(silent=True) or {}
+        command = body.get("command")
+        if not body.get("id") or not command:
+            return jsonify({"message": "id and command are required"}), 422
+        with state.lock:
+            state.commands[command] = state.commands.get(command, 0) + 1
+        return jsonify({"id": body["id"], "command": command, "status": "ok"})
+
+    # Simulator control
+
+    @app.route("/__simulator/config", methods=["GET", "POST"])
+    def simulator_config():
+        if request.method == "POST":
+            try:
+                config.update(request.get_json(silent=True) or {})
+            except (TypeError, ValueError) as e:
+                return jsonify({"message": str(e)}), 400
+            logger.info(f"Simulator config updated: {config.to_dict()}")
+        return jsonify(config.to_dict())
+
+    @app.route("/__simulator/stats", methods=["GET"])
+    def simulator_stats():
+        with state.lock:
+            return jsonify(
+                {
+                    "requests": state.requests,
+                    "injected": dict(state.injected),
+                    "commands": dict(state.commands),
+                    "handlers": len(state.handlers),
+                    "subscribers": len(state.subscribers),
+                }
+            )
+
+    return app
@@ -0,0 +1,80 @@
+"""
+Command line entry point for the local SignalWire API simulator.
+
+Example:
+    python -m livewire.simulator --port 8090 --latency lognormal:0.08,0.4 \
+        --rate-limit-rate 0.02 --subscribers 5000
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+from livewire.simulator import (DEFAULT_PAGE_SIZE, SimulatorConfig,
+                                create_simulator_app)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """
+    Parse arguments and run the simulator until interrupted.
+    """
+    parser = argparse.ArgumentParser(description="Local SignalWire API simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument(
+        "--port", type=int, default=int(os.environ.get("SIMULATOR_PORT", 8090))
+    )
+    parser.add_argument(
+        "--latency",
+        default=os.environ.get("SIMULATOR_LATENCY", "0"),
+        help="Latency spec, e.g. fixed:0.05, uniform:0.02,0.2, lognormal:0.05,0.5",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=float(os.environ.get("SIMULATOR_ERROR_RATE", 0)),
+        help="Fraction of requests failing with a 5xx",
+    )
+    parser.add_argument(
+        "--rate-limit-rate",
+        type=float,
+        default=float(os.environ.get("SIMULATOR_RATE_LIMIT_RATE", 0)),
+        help="Fraction of requests rejected with a 429",
+    )
+    parser.add_argument(
+        "--retry-after",
+        type=float,
+        default=1.0,
+        help="Retry-After seconds sent with injected 429s",
+    )
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument(
+        "--subscribers", type=int, default=0, help="Subscribers to pre-populate"
+    )
+    args = parser.parse_args()
+
+    config = SimulatorConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        default_page_size=args.page_size,
+    )
+    app = create_simulator_app(config, subscribers=args.subscribers)
+
+    logger.info(
+        f"SignalWire simulator on http://{args.host}:{args.port} - "
+        f"set SIGNALWIRE_API_BASE_URL=http://{args.host}:{args.port}/api"
+    )
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,56 @@
 # stores/__init__.py
 """
 Store module for LiveWire demo app.
-Provides a consistent interface for in-memory stores used throughout the application.
+Provides a consistent interface for the stores used throughout the application.
+Stores live in process memory by default; set LIVEWIRE_STORE_BACKEND=sqlite to
+share them between local worker processes, or =journal to keep them across
+restarts (see stores/backends.py).
 """
 import logging
 import os
+import threading
 from typing import Any, Callable, Dict
 
+from .backends import STORE_BACKEND, StoreBackend, create_backend
+
 logger = logging.getLogger(__name__)
 
 # Define standard store names to prevent typos and ensure consistency
 CUSTOMER_STORE: str = "customers"
+CUSTOMER_INDEX_STORE: str = "customer_index"
 CALL_INFO_STORE: str = "call_info"
 USER_STORE: str = "users"
 ACTIVE_SUBSCRIBERS_STORE: str = "active_subscribers"
+ONLINE_SUBSCRIBERS_STORE: str = "online_subscribers"
 
 # Store registry to track all stores in the application
-_stores: Dict[str, Dict[str, Any]] = {}
+_stores: Dict[str, StoreBackend] = {}
+_stores_lock = threading.Lock()
 
 
-def get_store(store_name: str) -> Dict[str, Any]:
+def get_store(store_name: str) -> StoreBackend:
     """
-    Get or create an in-memory store by name.
-    Returns the same dictionary instance for a given name across the application.
+    Get or create a store by name, using the configured backend.
+    Returns the same store instance for a given name across the application.
 
     Args:
         store_name (str): Name of the store to get or create
 
     Returns:
-        Dict[str, Any]: The in-memory store instance
+        StoreBackend: The store instance (a mutable mapping)
     """
-    if store_name not in _stores:
-        _stores[store_name] = {}
-        logger.debug(f"Created new store: {store_name}")
-    return _stores[store_name]
+    store = _stores.get(store_name)
+    if store is not None:
+        return store
+    # Only one caller creates a store: two sqlite connections or journal writers
+    # on the same file would lose one instance's writes
+    with _stores_lock:
+        store = _stores.get(store_name)
+        if store is None:
+            store = create_backend(store_name)
+            _stores[store_name] = store
+            logger.debug(f"Created new {STORE_BACKEND} store: {store_name}")
+        return store
 
 
 # Simple decorator for error handling in store operations
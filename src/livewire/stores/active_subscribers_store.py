@@ -1,19 +1,290 @@
 # active_subscribers_store.py
 # Global in-memory store for tracking online subscribers and their addresses, namespaced by project_id only
-# Structure: {project_id: {subscriber_id: {address: str, online: bool, last_seen: datetime}}}
-
+# Structure: {"project_id/subscriber_id": PresenceRecord(address: str, online: bool, last_seen: datetime, expires_at: float)}
+# One key per subscriber keeps heartbeats O(1): each one rewrites (and, with the
+# sqlite and journal backends, persists) a single small record.
+#
+# Online subscribers must heartbeat (heartbeat_subscriber) at least every
+# SUBSCRIBER_PRESENCE_TIMEOUT seconds or they are marked offline. Deadlines are
+# kept in a min-heap, so expiring subscribers costs O(expired) instead of a scan;
+# expiry runs lazily whenever presence is read or refreshed. The heap only lives
+# in this process, so it is rebuilt from the store on first use (entries left
+# by a previous run or another worker), and reads also skip expired entries.
+#
+# A second store, online_subscribers_store, indexes who is online per project:
+# {project_id: OnlineSet(members={subscriber_id: address}, addresses=(...))}
+# so reads cost O(online subscribers) and the address tuple is reused as is.
+
+import heapq
 import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
 from datetime import UTC, datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from flask import session as flask_session
 
 from livewire.utils.session_utils import get_session_vars
 
-from . import ACTIVE_SUBSCRIBERS_STORE, get_store, store_operation
+from . import (ACTIVE_SUBSCRIBERS_STORE, ONLINE_SUBSCRIBERS_STORE, get_store,
+               store_operation)
+from .backends import DELETE_ITEM, StoreBackend
+from .change_feed import PRESENCE_TOPIC, publish_change
+from .records import OnlineSet, PresenceRecord
 
 logger = logging.getLogger(__name__)
 
+# Seconds without a heartbeat before an online subscriber is marked offline
+SUBSCRIBER_PRESENCE_TIMEOUT: float = float(
+    os.environ.get("SUBSCRIBER_PRESENCE_TIMEOUT", 90)
+)
+# Seconds between heartbeats the dashboard is asked to send
+SUBSCRIBER_HEARTBEAT_INTERVAL: float = float(
+    os.environ.get("SUBSCRIBER_HEARTBEAT_INTERVAL", 30)
+)
+
+# Expiry heap of (deadline, project_id, subscriber_id). A subscriber's entries
+# are superseded by later heartbeats; only the deadline in _deadlines is live.
+_expiry_lock = threading.Lock()
+_expiry_heap: List[Tuple[float, str, str]] = []
+_deadlines: Dict[Tuple[str, str], float] = {}
+_expiry_loaded = False
+_presence_stats: Dict[str, int] = {"heartbeats": 0, "expired": 0}
+
+
+def _presence_key(project_id: str, subscriber_id: str) -> str:
+    """
+    Build a subscriber's key in the active subscribers store.
+
+    Args:
+        project_id (str): The project ID
+        subscriber_id (str): The subscriber ID
+
+    Returns:
+        str: The store key
+    """
+    return f"{project_id}/{subscriber_id}"
+
+
+def _schedule_expiry(project_id: str, subscriber_id: str, deadline: float) -> None:
+    """
+    Set the time at which a subscriber expires unless it heartbeats again.
+
+    Args:
+        project_id (str): The project ID
+        subscriber_id (str): The subscriber ID
+        deadline (float): Wall-clock expiry time
+    """
+    with _expiry_lock:
+        _deadlines[(project_id, subscriber_id)] = deadline
+        heapq.heappush(_expiry_heap, (deadline, project_id, subscriber_id))
+
+
+def _load_expiry() -> None:
+    """
+    Schedule the expiry of every online subscriber in the store, once per
+    process, so subscribers that stopped heartbeating before a restart or in
+    another worker are expired too.
+    """
+    global _expiry_loaded
+
+    with _expiry_lock:
+        if _expiry_loaded:
+            return
+        _expiry_loaded = True
+
+    loaded = 0
+    for key, entry in get_active_subscribers_store().iter_items():
+        project_id, _, subscriber_id = key.rpartition("/")
+        if not project_id or not isinstance(entry, Mapping):
+            continue
+        expires_at = entry.get("expires_at")
+        if entry.get("online", False) and expires_at is not None:
+            member = (project_id, subscriber_id)
+            with _expiry_lock:
+                # A heartbeat since startup has already scheduled a later deadline
+                if member not in _deadlines:
+                    _deadlines[member] = expires_at
+                    heapq.heappush(_expiry_heap, (expires_at, *member))
+                    loaded += 1
+    if loaded:
+        logger.info(f"Scheduled expiry of {loaded} online subscribers from the store")
+
+
+def _cancel_expiry(project_id: str, subscriber_id: str) -> None:
+    """
+    Stop tracking a subscriber's expiry; its heap entries become stale.
+
+    Args:
+        project_id (str): The project ID
+        subscriber_id (str): The subscriber ID
+    """
+    with _expiry_lock:
+        _deadlines.pop((project_id, subscriber_id), None)
+
+
+def _is_live(entry: Any, now: float) -> bool:
+    """
+    Check whether a presence entry is online and not past its expiry.
+
+    Args:
+        entry (Any): Presence entry
+        now (float): Current wall-clock time
+
+    Returns:
+        bool: True if the subscriber counts as online
+    """
+    if not entry.get("online", False):
+        return False
+    expires_at = entry.get("expires_at")
+    return expires_at is None or expires_at > now
+
+
+def _sync_online(project_id: str, subscriber_id: str) -> None:
+    """
+    Bring a subscriber's entry in the online index in line with its presence,
+    publishing an "online" or "offline" change when it changes.
+
+    The presence entry is read inside the index update, so whichever sync runs
+    last reflects the latest presence even when updates race.
+
+    Args:
+        project_id (str): The project ID
+        subscriber_id (str): The subscriber ID
+    """
+    active_subscribers = get_active_subscribers_store()
+    online_subscribers = get_store(ONLINE_SUBSCRIBERS_STORE)
+    presence_key = _presence_key(project_id, subscriber_id)
+
+    def current_address() -> Optional[str]:
+        entry = active_subscribers.get(presence_key)
+        if entry is None or not entry.get("online", False):
+            return None
+        return entry.get("address")
+
+    def in_sync(online: Optional[OnlineSet], address: Optional[str]) -> bool:
+        members = online.members if online is not None else None
+        return (members or {}).get(subscriber_id) == address
+
+    # Heartbeats rarely change membership; skip the write when nothing changed
+    if in_sync(online_subscribers.get(project_id), current_address()):
+        return
+
+    changed = False
+    address = None
+
+    def update(online: Optional[OnlineSet]) -> Any:
+        nonlocal changed, address
+        address = current_address()
+        changed = not in_sync(online, address)
+        if not changed:
+            return online if online is not None else DELETE_ITEM
+        members = dict(online.members or {}) if online is not None else {}
+        if address:
+            members[subscriber_id] = address
+        else:
+            members.pop(subscriber_id, None)
+        if not members:
+            return DELETE_ITEM
+        return OnlineSet(members=members, addresses=tuple(members.values()))
+
+    online_subscribers.update_item(project_id, update)
+    if changed:
+        publish_change(
+            PRESENCE_TOPIC,
+            presence_key,
+            "online" if address else "offline",
+            {
+                "project_id": project_id,
+                "subscriber_id": subscriber_id,
+                "address": address,
+            },
+        )
+
+
+def _mark_offline(
+    project_id: str, subscriber_id: str, expired_at: Optional[float] = None
+) -> bool:
+    """
+    Mark a subscriber offline in one atomic update of its entry.
+
+    Args:
+        project_id (str): The project ID
+        subscriber_id (str): The subscriber ID
+        expired_at (Optional[float]): If given, only mark the subscriber
+            offline if it is online and expired at this time, so a heartbeat
+            that raced the expiry (possibly in another process) wins
+
+    Returns:
+        bool: True if the subscriber was marked offline
+    """
+    active_subscribers = get_active_subscribers_store()
+    presence_key = _presence_key(project_id, subscriber_id)
+    changed = False
+
+    def mark_offline(entry: Optional[PresenceRecord]) -> Any:
+        nonlocal changed
+        if entry is None:
+            return DELETE_ITEM
+        changed = expired_at is None or (
+            entry.get("online", False) and not _is_live(entry, expired_at)
+        )
+        if not changed:
+            return entry
+        return PresenceRecord.from_dict(entry).updated(
+            online=False, last_seen=datetime.now(UTC)
+        )
+
+    if presence_key in active_subscribers:
+        active_subscribers.update_item(presence_key, mark_offline)
+    if changed:
+        _sync_online(project_id, subscriber_id)
+    return changed
+
+
+@store_operation
+def expire_subscribers(now: Optional[float] = None) -> int:
+    """
+    Mark subscribers whose heartbeats stopped as offline.
+
+    Args:
+        now (Optional[float]): Current wall-clock time (defaults to time.time())
+
+    Returns:
+        int: Number of subscribers marked offline
+    """
+    _load_expiry()
+    now = time.time() if now is None else now
+    due = []
+    with _expiry_lock:
+        while _expiry_heap and _expiry_heap[0][0] <= now:
+            deadline, project_id, subscriber_id = heapq.heappop(_expiry_heap)
+            if _deadlines.get((project_id, subscriber_id)) == deadline:
+                del _deadlines[(project_id, subscriber_id)]
+                due.append((project_id, subscriber_id))
+
+    active_subscribers = get_active_subscribers_store()
+    expired = 0
+    for project_id, subscriber_id in due:
+        if _mark_offline(project_id, subscriber_id, expired_at=now):
+            expired += 1
+            logger.info(
+                f"Subscriber {subscriber_id} in project {project_id} missed its "
+                f"heartbeats; marked offline"
+            )
+            continue
+        # Still live: it heartbeated through another worker, so keep watching
+        # the deadline that worker stored
+        entry = active_subscribers.get(_presence_key(project_id, subscriber_id))
+        if entry is not None and _is_live(entry, now) and entry.get("expires_at"):
+            _schedule_expiry(project_id, subscriber_id, entry["expires_at"])
+    if expired:
+        with _expiry_lock:
+            _presence_stats["expired"] += expired
+    return expired
+
 
 @store_operation
 def get_project_key(session_obj: Optional[dict] = None) -> str:
@@ -42,12 +313,12 @@ def get_project_key(session_obj: Optional[dict] = None) -> str:
 
 
 @store_operation
-def get_active_subscribers_store() -> dict:
+def get_active_subscribers_store() -> StoreBackend:
     """
     Get the active subscribers store instance.
 
     Returns:
-        dict: The active subscribers store instance
+        StoreBackend: The active subscribers store instance
     """
     return get_store(ACTIVE_SUBSCRIBERS_STORE)
 
@@ -75,16 +346,17 @@ def set_active_subscriber(
         # Get the active subscribers store
         active_subscribers = get_active_subscribers_store()
 
-        # Initialize project namespace if needed
-        if key not in active_subscribers:
-            active_subscribers[key] = {}
-
         # Set subscriber as active
-        active_subscribers[key][subscriber_id] = {
-            "address": address,
-            "online": True,
-            "last_seen": datetime.now(UTC),
-        }
+        expires_at = time.time() + SUBSCRIBER_PRESENCE_TIMEOUT
+        entry = PresenceRecord(
+            address=address,
+            online=True,
+            last_seen=datetime.now(UTC),
+            expires_at=expires_at,
+        )
+        active_subscribers[_presence_key(key, subscriber_id)] = entry
+        _sync_online(key, subscriber_id)
+        _schedule_expiry(key, subscriber_id, expires_at)
         return True
     except Exception as e:
         logger.exception(f"Error setting active subscriber: {e}")
@@ -109,13 +381,9 @@ def set_inactive_subscriber(
         # Get namespace key from session
         key = get_project_key(session_obj)
 
-        # Get the active subscribers store
-        active_subscribers = get_active_subscribers_store()
-
         # If subscriber exists in store, mark as inactive
-        if key in active_subscribers and subscriber_id in active_subscribers[key]:
-            active_subscribers[key][subscriber_id]["online"] = False
-            active_subscribers[key][subscriber_id]["last_seen"] = datetime.now(UTC)
+        _cancel_expiry(key, subscriber_id)
+        if _mark_offline(key, subscriber_id):
             logger.info(
                 f"Marked subscriber {subscriber_id} as inactive in project {key}"
             )
@@ -126,6 +394,113 @@ def set_inactive_subscriber(
         return False
 
 
+@store_operation
+def heartbeat_subscriber(
+    subscriber_id: str, session_obj: Optional[dict] = None
+) -> bool:
+    """
+    Record a heartbeat from a subscriber, keeping it online for another
+    SUBSCRIBER_PRESENCE_TIMEOUT seconds. Brings back a subscriber that was
+    marked offline, using its last known address.
+
+    Args:
+        subscriber_id (str): The subscriber ID
+        session_obj (Optional[dict]): Optional session object. Uses current Flask session if None.
+
+    Returns:
+        bool: True if the subscriber is known, False if it must be activated
+        with set_active_subscriber first
+    """
+    key = get_project_key(session_obj)
+    presence_key = _presence_key(key, subscriber_id)
+    active_subscribers = get_active_subscribers_store()
+    expires_at = time.time() + SUBSCRIBER_PRESENCE_TIMEOUT
+    found = False
+    revived = False
+
+    def refresh(entry: Optional[PresenceRecord]) -> Any:
+        nonlocal found, revived
+        found = entry is not None and bool(entry.get("address"))
+        if not found:
+            return entry if entry is not None else DELETE_ITEM
+        revived = not entry.get("online", False)
+        return PresenceRecord.from_dict(entry).updated(
+            online=True, last_seen=datetime.now(UTC), expires_at=expires_at
+        )
+
+    if presence_key in active_subscribers:
+        active_subscribers.update_item(presence_key, refresh)
+    if not found:
+        return False
+
+    _sync_online(key, subscriber_id)
+    _schedule_expiry(key, subscriber_id, expires_at)
+    with _expiry_lock:
+        _presence_stats["heartbeats"] += 1
+    if revived:
+        logger.info(f"Subscriber {subscriber_id} in project {key} is back online")
+    expire_subscribers()
+    return True
+
+
+def _online_subscribers(
+    project_id: str,
+) -> Tuple[Optional[OnlineSet], Dict[str, Any]]:
+    """
+    Get a project's online subscribers through the online index.
+
+    Index members whose presence has expired without this process noticing
+    (e.g. they were left by another worker) are skipped and marked offline.
+
+    Args:
+        project_id (str): The project ID
+
+    Returns:
+        Tuple[Optional[OnlineSet], Dict[str, Any]]: The online index entry and
+        the presence entries of live subscribers, by subscriber ID
+    """
+    expire_subscribers()
+    online = get_store(ONLINE_SUBSCRIBERS_STORE).get(project_id)
+    if not online or not online.members:
+        return online, {}
+
+    active_subscribers = get_active_subscribers_store()
+    now = time.time()
+    result = {}
+    for subscriber_id in online.members:
+        entry = active_subscribers.get(_presence_key(project_id, subscriber_id))
+        if entry is not None and _is_live(entry, now):
+            result[subscriber_id] = entry
+        elif not _mark_offline(project_id, subscriber_id, expired_at=now):
+            # Already offline or gone; drop it from the index
+            _sync_online(project_id, subscriber_id)
+    return online, result
+
+
+@store_operation
+def get_online_addresses(project_id: str) -> Tuple[str, ...]:
+    """
+    Get the addresses of a project's online subscribers, e.g. to build a
+    parallel transfer. The tuple is shared; don't try to modify it.
+
+    Args:
+        project_id (str): The project ID
+
+    Returns:
+        Tuple[str, ...]: Online subscriber addresses
+    """
+    try:
+        online, live = _online_subscribers(project_id)
+        if not live:
+            return ()
+        if len(live) == len(online.members):
+            return online.addresses
+        return tuple(entry["address"] for entry in live.values())
+    except Exception as e:
+        logger.exception(f"Error getting online addresses by project: {e}")
+        return ()
+
+
 @store_operation
 def get_active_subscribers(session_obj: Optional[dict] = None) -> dict:
     """
@@ -140,17 +515,7 @@ def get_active_subscribers(session_obj: Optional[dict] = None) -> dict:
     try:
         # Get namespace key from session
         key = get_project_key(session_obj)
-
-        # Get the active subscribers store
-        active_subscribers = get_active_subscribers_store()
-
-        # Return only active subscribers for this project
-        if key not in active_subscribers:
-            return {}
-
-        return {
-            k: v for k, v in active_subscribers[key].items() if v.get("online", False)
-        }
+        return _online_subscribers(key)[1]
     except Exception as e:
         logger.exception(f"Error getting active subscribers: {e}")
         return {}
@@ -178,7 +543,8 @@ def get_subscriber_address(
         active_subscribers = get_active_subscribers_store()
 
         # Return address if found
-        return active_subscribers.get(key, {}).get(subscriber_id, {}).get("address")
+        entry = active_subscribers.get(_presence_key(key, subscriber_id))
+        return entry.get("address") if entry is not None else None
     except Exception as e:
         logger.exception(f"Error getting subscriber address: {e}")
         return None
@@ -196,18 +562,22 @@ def get_active_subscribers_by_project(project_id: str) -> dict:
         dict: Dictionary of active subscribers and their data
     """
     try:
-        # Get the active subscribers store
-        active_subscribers = get_active_subscribers_store()
+        return _online_subscribers(project_id)[1]
+    except Exception as e:
+        logger.exception(f"Error getting active subscribers by project: {e}")
+        return {}
 
-        # Return only active subscribers for this project
-        if project_id not in active_subscribers:
-            return {}
 
+def get_presence_stats() -> Dict[str, int]:
+    """
+    Report heartbeat and expiry counters.
+
+    Returns:
+        Dict[str, int]: Presence metrics
+    """
+    with _expiry_lock:
         return {
-            k: v
-            for k, v in active_subscribers[project_id].items()
-            if v.get("online", False)
+            "tracked": len(_deadlines),
+            "heap_entries": len(_expiry_heap),
+            **_presence_stats,
         }
-    except Exception as e:
-        logger.exception(f"Error getting active subscribers by project: {e}")
-        return {}
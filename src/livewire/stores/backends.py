@@ -0,0 +1,912 @@
+"""
+Store backends for LiveWire demo app.
+Each store is a mutable mapping from string keys to values. The memory backend
+keeps values in a per-process dict; the SQLite backend keeps them in a shared
+WAL-mode database file so several local worker processes see the same data.
+The journal backend is the memory backend made durable: every change is
+appended to a log, which is periodically compacted into a snapshot, and both
+are replayed when the process restarts.
+
+Values are only persisted when a key is assigned, so code must write changed
+values back (``store[key] = value``) instead of mutating nested objects in place.
+Read-modify-write sequences should go through ``update_item``, which is atomic
+per key: the memory backend stripes locks by key hash, so unrelated keys never
+contend, and the SQLite backend runs the update in an immediate transaction.
+"""
+
+import atexit
+import logging
+import mmap
+import os
+import pickle
+import shutil
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from abc import abstractmethod
+from collections.abc import MutableMapping
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Tuple)
+
+logger = logging.getLogger(__name__)
+
+# Backend names accepted in LIVEWIRE_STORE_BACKEND
+MEMORY_BACKEND: str = "memory"
+SQLITE_BACKEND: str = "sqlite"
+JOURNAL_BACKEND: str = "journal"
+
+# fsync policies accepted in LIVEWIRE_STORE_FSYNC, from most to least durable:
+# fsync every change before returning, fsync in the background every
+# STORE_FSYNC_INTERVAL seconds, or leave flushing to the OS. All three survive
+# a process crash; they differ in how much an OS crash or power loss can lose.
+FSYNC_ALWAYS: str = "always"
+FSYNC_INTERVAL: str = "interval"
+FSYNC_NEVER: str = "never"
+
+STORE_BACKEND: str = os.environ.get("LIVEWIRE_STORE_BACKEND", MEMORY_BACKEND).lower()
+STORE_PATH: str = os.environ.get("LIVEWIRE_STORE_PATH", "livewire_stores.db")
+SQLITE_BUSY_TIMEOUT_SECONDS: float = float(
+    os.environ.get("LIVEWIRE_STORE_BUSY_TIMEOUT", 5)
+)
+STORE_LOCK_STRIPES: int = int(os.environ.get("LIVEWIRE_STORE_LOCK_STRIPES", 64))
+STORE_DIR: str = os.environ.get("LIVEWIRE_STORE_DIR", "livewire_stores")
+STORE_FSYNC: str = os.environ.get("LIVEWIRE_STORE_FSYNC", FSYNC_INTERVAL).lower()
+STORE_FSYNC_INTERVAL: float = float(os.environ.get("LIVEWIRE_STORE_FSYNC_INTERVAL", 1))
+# Compact once the log reaches this size and is larger than the last snapshot
+STORE_COMPACT_BYTES: int = int(
+    os.environ.get("LIVEWIRE_STORE_COMPACT_BYTES", 64 * 1024 * 1024)
+)
+
+# Journal frame header: payload length and CRC32
+_FRAME_HEADER = struct.Struct(">II")
+
+_MISSING = object()
+
+# Returned from an update_item function to remove the key instead of storing a value
+DELETE_ITEM = object()
+
+
+class StoreBackend(MutableMapping):
+    """
+    Base class for store backends.
+
+    Subclasses implement the abstract mapping methods plus ``update_item``
+    and ``pop``; ``get``, ``in`` and friends come from MutableMapping.
+    ``keys``, ``values`` and ``items`` return snapshots, so they are safe to
+    use while other threads write to the store.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            name (str): Store name
+        """
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r} ({len(self)} keys)>"
+
+    @abstractmethod
+    def update_item(
+        self, key: str, fn: Callable[[Optional[Any]], Any], default: Any = None
+    ) -> Any:
+        """
+        Atomically replace a value with ``fn(current)``.
+
+        Args:
+            key (str): The key to update
+            fn (Callable[[Optional[Any]], Any]): Computes the new value from the
+                current one; must not modify the current value in place. Return
+                DELETE_ITEM to remove the key instead.
+            default (Any): Value passed to fn when the key is missing
+
+        Returns:
+            Any: The new value (None if the key was removed)
+        """
+
+    @abstractmethod
+    def pop(self, key: str, default: Any = _MISSING) -> Any:
+        """
+        Atomically remove a key and return its value.
+
+        Args:
+            key (str): The key to remove
+            default (Any): Value returned if the key is missing
+
+        Returns:
+            Any: The removed value, or default
+
+        Raises:
+            KeyError: If the key is missing and no default was given
+        """
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """
+        Atomically insert a value if the key is missing.
+
+        Args:
+            key (str): The key
+            default (Any): Value to insert if the key is missing
+
+        Returns:
+            Any: The existing or inserted value
+        """
+        return self.update_item(
+            key, lambda current: default if current is _MISSING else current, _MISSING
+        )
+
+    def set_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Store several values, as one transaction where the backend supports it.
+
+        Args:
+            items (Iterable[Tuple[str, Any]]): (key, value) pairs
+        """
+        for key, value in items:
+            self[key] = value
+
+    def iter_items(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream the store's contents without copying the values all at once.
+
+        Yields:
+            Tuple[str, Any]: (key, value) pairs
+        """
+        for key in self:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                yield key, value
+
+    def keys(self) -> List[str]:
+        return list(self)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return list(self.snapshot().items())
+
+    def values(self) -> List[Any]:
+        return list(self.snapshot().values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Copy the whole store.
+
+        Returns:
+            Dict[str, Any]: Shallow copy of the store's contents
+        """
+        result = {}
+        for key in self:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                result[key] = value
+        return result
+
+
+class MemoryBackend(StoreBackend):
+    """
+    In-process dict store. Fast, but private to the current process.
+    """
+
+    def __init__(self, name: str, stripes: int = STORE_LOCK_STRIPES) -> None:
+        """
+        Initialize an empty in-memory store.
+
+        Args:
+            name (str): Store name
+            stripes (int): Number of locks keys are spread over
+        """
+        super().__init__(name)
+        self._data: Dict[str, Any] = {}
+        self._locks = [threading.Lock() for _ in range(max(stripes, 1))]
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        """
+        Get the lock guarding a key.
+
+        Args:
+            key (str): The key
+
+        Returns:
+            threading.Lock: The key's stripe lock
+        """
+        return self._locks[hash(key) % len(self._locks)]
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock_for(key):
+            self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock_for(key):
+            del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        # list() copies the keys in one step, so concurrent writers can't
+        # change the dict's size mid-iteration
+        return iter(list(self._data))
+
+    def update_item(
+        self, key: str, fn: Callable[[Optional[Any]], Any], default: Any = None
+    ) -> Any:
+        with self._lock_for(key):
+            value = fn(self._data.get(key, default))
+            if value is DELETE_ITEM:
+                self._data.pop(key, None)
+                return None
+            self._data[key] = value
+            return value
+
+    def pop(self, key: str, default: Any = _MISSING) -> Any:
+        with self._lock_for(key):
+            if default is _MISSING:
+                return self._data.pop(key)
+            return self._data.pop(key, default)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return self._data.copy()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+
+class SQLiteBackend(StoreBackend):
+    """
+    Store kept in a table of a shared SQLite database in WAL mode, so local
+    processes can read concurrently while one writes. Values are pickled.
+
+    Each thread gets its own connection, as sqlite3 connections cannot be
+    shared across threads.
+    """
+
+    def __init__(self, name: str, path: str = STORE_PATH) -> None:
+        """
+        Open (and create if needed) the table backing a store.
+
+        Args:
+            name (str): Store name, used as the table name
+            path (str): Path of the SQLite database file
+        """
+        super().__init__(name)
+        self.path = path
+        self._table = f'"store_{name}"'
+        self._local = threading.local()
+        self._connection().execute(
+            f"CREATE TABLE IF NOT EXISTS {self._table} "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection, opening it on first use.
+
+        Returns:
+            sqlite3.Connection: The connection
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode; update_item opens its own immediate transaction
+            conn = sqlite3.connect(
+                self.path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def __getitem__(self, key: str) -> Any:
+        row = (
+            self._connection()
+            .execute(f"SELECT value FROM {self._table} WHERE key = ?", (key,))
+            .fetchone()
+        )
+        if row is None:
+            raise KeyError(key)
+        return pickle.loads(row[0])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._connection().execute(
+            f"INSERT OR REPLACE INTO {self._table} (key, value) VALUES (?, ?)",
+            (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)),
+        )
+
+    def __delitem__(self, key: str) -> None:
+        cursor = self._connection().execute(
+            f"DELETE FROM {self._table} WHERE key = ?", (key,)
+        )
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    def update_item(
+        self, key: str, fn: Callable[[Optional[Any]], Any], default: Any = None
+    ) -> Any:
+        conn = self._connection()
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent updates
+        # from other threads and processes queue instead of overwriting each other
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                f"SELECT value FROM {self._table} WHERE key = ?", (key,)
+            ).fetchone()
+            value = fn(pickle.loads(row[0]) if row is not None else default)
+            if value is DELETE_ITEM:
+                conn.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+            else:
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self._table} (key, value) VALUES (?, ?)",
+                    (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)),
+                )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return None if value is DELETE_ITEM else value
+
+    def pop(self, key: str, default: Any = _MISSING) -> Any:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                f"SELECT value FROM {self._table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        if row is not None:
+            return pickle.loads(row[0])
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def set_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self._table} (key, value) VALUES (?, ?)",
+                (
+                    (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+                    for key, value in items
+                ),
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def iter_items(self) -> Iterator[Tuple[str, Any]]:
+        # A dedicated connection keeps the read cursor independent of writes
+        # made by the consuming thread while it iterates
+        conn = sqlite3.connect(self.path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS)
+        try:
+            cursor = conn.execute(f"SELECT key, value FROM {self._table}")
+            while True:
+                rows = cursor.fetchmany(500)
+                if not rows:
+                    return
+                for key, value in rows:
+                    yield key, pickle.loads(value)
+        finally:
+            conn.close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        rows = (
+            self._connection()
+            .execute(f"SELECT key, value FROM {self._table}")
+            .fetchall()
+        )
+        return {key: pickle.loads(value) for key, value in rows}
+
+    def __iter__(self) -> Iterator[str]:
+        # Materialize so callers can write to the store while iterating
+        rows = self._connection().execute(f"SELECT key FROM {self._table}").fetchall()
+        return iter([row[0] for row in rows])
+
+    def __len__(self) -> int:
+        row = (
+            self._connection().execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()
+        )
+        return row[0]
+
+    def __contains__(self, key: object) -> bool:
+        return (
+            self._connection()
+            .execute(f"SELECT 1 FROM {self._table} WHERE key = ?", (key,))
+            .fetchone()
+            is not None
+        )
+
+
+def _frame(entry: Tuple[Any, ...]) -> bytes:
+    """
+    Encode a journal entry: (key, value) to set a key, (key,) to delete it.
+
+    Args:
+        entry (Tuple[Any, ...]): The entry
+
+    Returns:
+        bytes: Length- and checksum-prefixed pickled entry
+    """
+    payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+    return _FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _read_frames(path: str) -> Iterator[Tuple[Any, ...]]:
+    """
+    Decode the entries of a journal file, mapping it instead of reading it.
+
+    Stops at the first incomplete or corrupt frame, e.g. a write torn by a
+    crash; the generator's return value is the length of the valid prefix.
+
+    Args:
+        path (str): Snapshot or log file
+
+    Yields:
+        Tuple[Any, ...]: Journal entries in order
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return 0
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                offset = 0
+                while offset + _FRAME_HEADER.size <= size:
+                    length, crc = _FRAME_HEADER.unpack_from(view, offset)
+                    end = offset + _FRAME_HEADER.size + length
+                    if end > size:
+                        break
+                    payload = view[offset + _FRAME_HEADER.size : end]
+                    try:
+                        if zlib.crc32(payload) != crc:
+                            break
+                        entry = pickle.loads(payload)
+                    finally:
+                        payload.release()
+                    yield entry
+                    offset = end
+            finally:
+                view.release()
+    if offset < size:
+        logger.warning(
+            f"Ignoring {size - offset} bytes of incomplete or corrupt data at "
+            f"the end of {path}"
+        )
+    return offset
+
+
+def _fsync_dir(path: str) -> None:
+    """
+    Make renames in a directory durable. No-op where directories can't be opened.
+
+    Args:
+        path (str): The directory
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class JournalBackend(MemoryBackend):
+    """
+    Memory store made durable with an append-only log and compacted snapshots.
+
+    Every change is appended to ``<name>.log`` while the key's lock is held,
+    so the log order matches the order of changes to each key. Once the log
+    outgrows STORE_COMPACT_BYTES and the previous snapshot, a background
+    thread rotates it to ``<name>.log.compacting``, writes the store to a new
+    ``<name>.snapshot`` and deletes the rotated log. On startup the snapshot
+    and any logs are replayed (through mmap) in that order; replaying a
+    rotated log over a newer snapshot is harmless, because it only reapplies
+    values the snapshot already holds.
+
+    Only one process may use a store directory at a time.
+    """
+
+    def __init__(
+        self, name: str, directory: str = STORE_DIR, fsync: str = STORE_FSYNC
+    ) -> None:
+        """
+        Load a store from its snapshot and log, and open the log for appending.
+
+        Args:
+            name (str): Store name, used for the file names
+            directory (str): Directory holding the store files
+            fsync (str): FSYNC_ALWAYS, FSYNC_INTERVAL or FSYNC_NEVER
+
+        Raises:
+            ValueError: If the fsync policy is unknown
+        """
+        if fsync not in (FSYNC_ALWAYS, FSYNC_INTERVAL, FSYNC_NEVER):
+            raise ValueError(f"Unknown store fsync policy {fsync!r}")
+        super().__init__(name)
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.fsync = fsync
+        self._snapshot_path = os.path.join(directory, f"{name}.snapshot")
+        self._log_path = os.path.join(directory, f"{name}.log")
+        self._rotated_path = f"{self._log_path}.compacting"
+        # Guards the log file; taken after a key lock, never before
+        self._journal_lock = threading.Lock()
+        self._compacting = False
+        self._dirty = False
+        self._stats = {"compactions": 0, "load_seconds": 0.0, "loaded_entries": 0}
+
+        self._load()
+        self._log = open(self._log_path, "ab")
+        self._log_bytes = self._log.tell()
+        self._snapshot_bytes = self._file_size(self._snapshot_path)
+        _register_journal(self)
+
+    @staticmethod
+    def _file_size(path: str) -> int:
+        """
+        Get a file's size, or 0 if it doesn't exist.
+
+        Args:
+            path (str): File path
+
+        Returns:
+            int: Size in bytes
+        """
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    def _load(self) -> None:
+        """
+        Replay the snapshot and logs into memory, then fold a rotated log
+        left by an interrupted compaction into a fresh snapshot.
+        """
+        started = time.perf_counter()
+        entries = 0
+        for path in (self._snapshot_path, self._rotated_path, self._log_path):
+            frames = _read_frames(path)
+            while True:
+                try:
+                    entry = next(frames)
+                except StopIteration as stop:
+                    valid_bytes = stop.value
+                    break
+                if len(entry) == 2:
+                    self._data[entry[0]] = entry[1]
+                else:
+                    self._data.pop(entry[0], None)
+                entries += 1
+            if path == self._log_path and valid_bytes < self._file_size(path):
+                # Drop a torn tail so new entries aren't appended after garbage
+                os.truncate(path, valid_bytes)
+
+        if os.path.exists(self._rotated_path):
+            self._write_snapshot(self._data)
+            open(self._log_path, "wb").close()
+            os.remove(self._rotated_path)
+
+        seconds = time.perf_counter() - started
+        self._stats.update(load_seconds=round(seconds, 3), loaded_entries=entries)
+        if entries:
+            logger.info(
+                f"Loaded store {self.name}: {len(self._data)} keys from "
+                f"{entries} journal entries in {seconds:.2f}s"
+            )
+
+    def _write_snapshot(self, data: Dict[str, Any]) -> None:
+        """
+        Atomically replace the snapshot with the given contents.
+
+        Args:
+            data (Dict[str, Any]): Store contents
+        """
+        temp_path = f"{self._snapshot_path}.tmp"
+        with open(temp_path, "wb") as f:
+            for key, value in data.items():
+                f.write(_frame((key, value)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self._snapshot_path)
+        _fsync_dir(self.directory)
+
+    def _append(self, data: bytes) -> None:
+        """
+        Append encoded entries to the log, applying the fsync policy, and
+        start a compaction if the log has grown enough.
+
+        Args:
+            data (bytes): Encoded entries
+        """
+        with self._journal_lock:
+            self._log.write(data)
+            self._log.flush()
+            if self.fsync == FSYNC_ALWAYS:
+                os.fsync(self._log.fileno())
+            else:
+                self._dirty = True
+            self._log_bytes += len(data)
+            compact = (
+                not self._compacting
+                and self._log_bytes >= STORE_COMPACT_BYTES
+                and self._log_bytes > self._snapshot_bytes
+            )
+            if compact:
+                self._compacting = True
+        if compact:
+            threading.Thread(
+                target=self._compact, name=f"compact-{self.name}", daemon=True
+            ).start()
+
+    def _apply(self, changes: List[Tuple[str, Any]]) -> None:
+        """
+        Apply changes in memory, then log them; the caller holds the keys' locks.
+        Memory is restored if the log write fails.
+
+        Args:
+            changes (List[Tuple[str, Any]]): (key, value) pairs, with
+                DELETE_ITEM as the value to delete a key
+        """
+        data = b"".join(
+            _frame((key,) if value is DELETE_ITEM else (key, value))
+            for key, value in changes
+        )
+        previous = [(key, self._data.get(key, _MISSING)) for key, _ in changes]
+        for key, value in changes:
+            if value is DELETE_ITEM:
+                self._data.pop(key, None)
+            else:
+                self._data[key] = value
+        try:
+            self._append(data)
+        except BaseException:
+            for key, value in reversed(previous):
+                if value is _MISSING:
+                    self._data.pop(key, None)
+                else:
+                    self._data[key] = value
+            raise
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock_for(key):
+            self._apply([(key, value)])
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock_for(key):
+            if key not in self._data:
+                raise KeyError(key)
+            self._apply([(key, DELETE_ITEM)])
+
+    def update_item(
+        self, key: str, fn: Callable[[Optional[Any]], Any], default: Any = None
+    ) -> Any:
+        with self._lock_for(key):
+            value = fn(self._data.get(key, default))
+            if value is DELETE_ITEM:
+                if key in self._data:
+                    self._apply([(key, DELETE_ITEM)])
+                return None
+            self._apply([(key, value)])
+            return value
+
+    def pop(self, key: str, default: Any = _MISSING) -> Any:
+        with self._lock_for(key):
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                if default is _MISSING:
+                    raise KeyError(key)
+                return default
+            self._apply([(key, DELETE_ITEM)])
+            return value
+
+    def set_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        changes = list(items)
+        # Take every lock the batch needs, in a fixed order to avoid deadlocks,
+        # so the whole batch is one log write
+        locks = sorted({hash(key) % len(self._locks) for key, _ in changes})
+        for index in locks:
+            self._locks[index].acquire()
+        try:
+            self._apply(changes)
+        finally:
+            for index in reversed(locks):
+                self._locks[index].release()
+
+    def sync(self) -> None:
+        """
+        fsync the log if it has unsynced changes.
+        """
+        with self._journal_lock:
+            if self._dirty and not self._log.closed:
+                self._log.flush()
+                os.fsync(self._log.fileno())
+                self._dirty = False
+
+    def _compact(self) -> None:
+        """
+        Rotate the log and write a snapshot of the store, then drop the
+        rotated log. Runs in a background thread; writers only wait for the
+        rotation and the copy of the store.
+        """
+        try:
+            with self._journal_lock:
+                # Copying under the journal lock makes the copy hold every
+                # change logged so far. It may also hold changes applied in
+                # memory whose log write is still waiting for the lock; those
+                # go to the new log, and replaying them over the snapshot
+                # changes nothing
+                data = self._data.copy()
+                try:
+                    self._log.flush()
+                    os.fsync(self._log.fileno())
+                    self._log.close()
+                    if os.path.exists(self._rotated_path):
+                        # A previous compaction failed; its rotated log isn't
+                        # in any snapshot yet, so keep it and add to it
+                        with open(self._rotated_path, "ab") as rotated, open(
+                            self._log_path, "rb"
+                        ) as log:
+                            shutil.copyfileobj(log, rotated)
+                            rotated.flush()
+                            os.fsync(rotated.fileno())
+                        os.remove(self._log_path)
+                    else:
+                        os.replace(self._log_path, self._rotated_path)
+                    self._dirty = False
+                finally:
+                    # Writers must always find an open log, even if the
+                    # rotation failed and the old log is still in place
+                    if self._log.closed:
+                        self._log = open(self._log_path, "ab")
+                    self._log_bytes = self._log.tell()
+
+            started = time.perf_counter()
+            self._write_snapshot(data)
+            os.remove(self._rotated_path)
+            _fsync_dir(self.directory)
+            self._snapshot_bytes = self._file_size(self._snapshot_path)
+            self._stats["compactions"] += 1
+            logger.info(
+                f"Compacted store {self.name}: {len(data)} keys, "
+                f"{self._snapshot_bytes} bytes in {time.perf_counter() - started:.2f}s"
+            )
+        except Exception as e:
+            logger.exception(f"Failed to compact store {self.name}: {e}")
+        finally:
+            self._compacting = False
+
+    def close(self) -> None:
+        """
+        fsync and close the log.
+        """
+        with self._journal_lock:
+            if not self._log.closed:
+                self._log.flush()
+                os.fsync(self._log.fileno())
+                self._log.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report journal sizes and counters.
+
+        Returns:
+            Dict[str, Any]: Journal metrics
+        """
+        return {
+            "keys": len(self._data),
+            "fsync": self.fsync,
+            "log_bytes": self._log_bytes,
+            "snapshot_bytes": self._snapshot_bytes,
+            "compacting": self._compacting,
+            **self._stats,
+        }
+
+
+_journals: List[JournalBackend] = []
+_journals_lock = threading.Lock()
+_fsync_thread: Optional[threading.Thread] = None
+
+
+def _fsync_loop() -> None:
+    """
+    fsync journals using the interval policy, forever.
+    """
+    while True:
+        time.sleep(STORE_FSYNC_INTERVAL)
+        with _journals_lock:
+            journals = [j for j in _journals if j.fsync == FSYNC_INTERVAL]
+        for journal in journals:
+            try:
+                journal.sync()
+            except Exception as e:
+                logger.exception(f"Failed to fsync store {journal.name}: {e}")
+
+
+def _register_journal(journal: JournalBackend) -> None:
+    """
+    Track a journal for interval fsyncs, metrics and shutdown.
+
+    Args:
+        journal (JournalBackend): The journal
+    """
+    global _fsync_thread
+
+    with _journals_lock:
+        _journals.append(journal)
+        if journal.fsync == FSYNC_INTERVAL and _fsync_thread is None:
+            _fsync_thread = threading.Thread(
+                target=_fsync_loop, name="store-fsync", daemon=True
+            )
+            _fsync_thread.start()
+
+
+@atexit.register
+def _close_journals() -> None:
+    """
+    Flush every journal to disk on interpreter shutdown.
+    """
+    with _journals_lock:
+        journals = list(_journals)
+    for journal in journals:
+        journal.close()
+
+
+def get_journal_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Report metrics for every journal-backed store.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Journal metrics keyed by store name
+    """
+    with _journals_lock:
+        journals = list(_journals)
+    return {journal.name: journal.stats() for journal in journals}
+
+
+_BACKENDS = {
+    MEMORY_BACKEND: MemoryBackend,
+    SQLITE_BACKEND: SQLiteBackend,
+    JOURNAL_BACKEND: JournalBackend,
+}
+
+
+def create_backend(name: str, backend: str = STORE_BACKEND) -> StoreBackend:
+    """
+    Create the backend for a store.
+
+    Args:
+        name (str): Store name
+        backend (str): Backend name (MEMORY_BACKEND, SQLITE_BACKEND or
+            JOURNAL_BACKEND)
+
+    Returns:
+        StoreBackend: The new backend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend_class = _BACKENDS.get(backend)
+    if backend_class is None:
+        raise ValueError(
+            f"Unknown store backend {backend!r}, expected one of {sorted(_BACKENDS)}"
+        )
+    return backend_class(name)
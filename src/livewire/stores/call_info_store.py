@@ -1,41 +1,274 @@
 """
 Call info store module.
 Manages call context and information across requests.
+
+Each entry expires CALL_CONTEXT_TTL / CALL_INFO_TTL seconds after it was last
+set, so calls whose disconnect webhook never arrives don't leak. The store is
+also capped at CALL_INFO_MAX_ENTRIES; once over the cap, the least recently
+used calls are evicted down to CALL_INFO_EVICT_TO of the cap.
+Expired and excess entries are swept on the write path (amortized, at most
+every CALL_INFO_SWEEP_INTERVAL seconds unless the cap is exceeded).
+Structure: {call_id: CallInfoEntry(data={...}, expires_at: float, last_access: float)}
 """
 
 import logging
-from typing import Any, Dict
+import os
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Dict, Optional
 
 from . import CALL_INFO_STORE, get_store, store_operation
+from .backends import DELETE_ITEM, StoreBackend
+from .change_feed import CALL_INFO_TOPIC, publish_change
+from .records import CallInfoEntry
 
 logger = logging.getLogger(__name__)
 
+# Expiry and size tuning (overridable through the environment)
+CALL_CONTEXT_TTL: float = float(os.environ.get("CALL_CONTEXT_TTL", 4 * 3600))
+CALL_INFO_TTL: float = float(os.environ.get("CALL_INFO_TTL", 3600))
+CALL_INFO_MAX_ENTRIES: int = int(os.environ.get("CALL_INFO_MAX_ENTRIES", 10000))
+# Fraction of the cap to evict down to, so sweeps aren't triggered by every new call
+CALL_INFO_EVICT_TO: float = float(os.environ.get("CALL_INFO_EVICT_TO", 0.9))
+CALL_INFO_SWEEP_INTERVAL: float = float(os.environ.get("CALL_INFO_SWEEP_INTERVAL", 60))
+# Reads refresh an entry's LRU position at most this often, to bound write traffic
+CALL_INFO_TOUCH_INTERVAL: float = float(os.environ.get("CALL_INFO_TOUCH_INTERVAL", 5))
+
+_sweep_lock = threading.Lock()
+_last_sweep = 0.0
+_stats_lock = threading.Lock()
+_stats: Dict[str, int] = {"expired": 0, "evicted": 0, "sweeps": 0}
+
+
+def _count(**counts: int) -> None:
+    """
+    Add to the expiry/eviction counters.
+
+    Args:
+        **counts (int): Amount to add to each named counter
+    """
+    with _stats_lock:
+        for name, amount in counts.items():
+            _stats[name] += amount
+
+
+def _now() -> float:
+    """
+    Get the current wall-clock time, comparable across worker processes.
+
+    Returns:
+        float: Seconds since the epoch
+    """
+    return time.time()
+
+
+def _unwrap(entry: Any, now: float) -> Optional[Dict[str, Any]]:
+    """
+    Get an entry's data if it has not expired.
+
+    Args:
+        entry (Any): Stored entry
+        now (float): Current time
+
+    Returns:
+        Optional[Dict[str, Any]]: The call data, or None if missing or expired
+    """
+    if not isinstance(entry, Mapping) or entry.get("expires_at", 0) <= now:
+        return None
+    return entry["data"]
+
+
+def _write(call_id: str, info: Dict[str, Any], ttl: float, merge: bool) -> None:
+    """
+    Store call data with a refreshed expiry.
+
+    Args:
+        call_id (str): The call ID
+        info (Dict[str, Any]): Data to store
+        ttl (float): Seconds the entry should live from now
+        merge (bool): Merge into unexpired existing data instead of replacing it
+    """
+    store = get_call_info_store()
+    now = _now()
+    data = None
+
+    def update(entry: Any) -> CallInfoEntry:
+        nonlocal data
+        existing = _unwrap(entry, now)
+        data = {**existing, **info} if merge and existing is not None else info
+        # Never shorten a longer TTL already granted to the call
+        expires_at = now + ttl
+        if existing is not None:
+            expires_at = max(expires_at, entry["expires_at"])
+        return CallInfoEntry(data=data, expires_at=expires_at, last_access=now)
+
+    store.update_item(call_id, update)
+    publish_change(CALL_INFO_TOPIC, call_id, "updated", data)
+    _maybe_sweep(store, now)
+
+
+def _maybe_sweep(store: StoreBackend, now: float) -> None:
+    """
+    Sweep if the sweep interval has passed or the store is over its cap.
+    Only one thread sweeps at a time; others skip rather than wait.
+
+    Args:
+        store (StoreBackend): The call info store
+        now (float): Current time
+    """
+    global _last_sweep
+
+    due = now - _last_sweep >= CALL_INFO_SWEEP_INTERVAL
+    if not due and len(store) <= CALL_INFO_MAX_ENTRIES:
+        return
+    if not _sweep_lock.acquire(blocking=False):
+        return
+    try:
+        _last_sweep = now
+        sweep_call_info(now)
+    finally:
+        _sweep_lock.release()
+
+
+@store_operation
+def sweep_call_info(now: Optional[float] = None) -> int:
+    """
+    Remove expired calls, then evict least recently used calls over the cap.
+
+    Args:
+        now (Optional[float]): Current time (defaults to the wall clock)
+
+    Returns:
+        int: Number of entries removed
+    """
+    store = get_call_info_store()
+    now = _now() if now is None else now
+    live = []
+    expired = 0
+
+    for call_id, entry in store.items():
+        if _unwrap(entry, now) is None:
+            if _remove_if(store, call_id, lambda e: _unwrap(e, now) is None):
+                publish_change(CALL_INFO_TOPIC, call_id, "expired")
+                expired += 1
+        else:
+            live.append((entry["last_access"], call_id))
+
+    evicted = 0
+    excess = 0
+    if len(live) > CALL_INFO_MAX_ENTRIES:
+        excess = len(live) - int(CALL_INFO_MAX_ENTRIES * CALL_INFO_EVICT_TO)
+    if excess > 0:
+        live.sort()
+        for last_access, call_id in live[:excess]:
+            # Skip calls that were written or read since the snapshot
+            if _remove_if(
+                store,
+                call_id,
+                lambda e, seen=last_access: isinstance(e, Mapping)
+                and e["last_access"] <= seen,
+            ):
+                publish_change(CALL_INFO_TOPIC, call_id, "evicted")
+                evicted += 1
+
+    _count(expired=expired, evicted=evicted, sweeps=1)
+    if expired or evicted:
+        logger.info(
+            f"Swept call info store: {expired} expired, {evicted} evicted, "
+            f"{len(live) - evicted} remaining"
+        )
+    return expired + evicted
+
+
+def _remove_if(store: StoreBackend, call_id: str, predicate) -> bool:
+    """
+    Atomically remove a call if its current entry still matches a predicate,
+    so a concurrent write is never lost to a sweep based on a stale snapshot.
+
+    Args:
+        store (StoreBackend): The call info store
+        call_id (str): The call ID
+        predicate (Callable[[Any], bool]): Test applied to the current entry
+
+    Returns:
+        bool: True if the call was removed
+    """
+    removed = False
+
+    def update(entry: Any) -> Any:
+        nonlocal removed
+        if entry is None:
+            return DELETE_ITEM
+        removed = predicate(entry)
+        return DELETE_ITEM if removed else entry
+
+    store.update_item(call_id, update)
+    return removed
+
+
+def _read(call_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a call's data, refreshing its LRU position.
+
+    Args:
+        call_id (str): The call ID
+
+    Returns:
+        Optional[Dict[str, Any]]: The call data, or None if missing or expired
+    """
+    store = get_call_info_store()
+    now = _now()
+    entry = store.get(call_id)
+    data = _unwrap(entry, now)
+    if data is None:
+        if entry is not None and _remove_if(
+            store, call_id, lambda e: _unwrap(e, now) is None
+        ):
+            publish_change(CALL_INFO_TOPIC, call_id, "expired")
+            _count(expired=1)
+        return None
+
+    if now - entry["last_access"] >= CALL_INFO_TOUCH_INTERVAL:
+
+        def touch(current: Any) -> Any:
+            if _unwrap(current, now) is None:
+                return DELETE_ITEM if current is None else current
+            return CallInfoEntry(
+                data=current["data"], expires_at=current["expires_at"], last_access=now
+            )
+
+        store.update_item(call_id, touch)
+    return data
+
 
 @store_operation
-def get_call_info_store() -> Dict[str, Any]:
+def get_call_info_store() -> StoreBackend:
     """
     Get the call info store instance.
 
     Returns:
-        Dict[str, Any]: The call info store instance
+        StoreBackend: The call info store instance
     """
     return get_store(CALL_INFO_STORE)
 
 
 @store_operation
-def set_call_context(call_id: str, project_id: str) -> bool:
+def set_call_context(
+    call_id: str, project_id: str, ttl: float = CALL_CONTEXT_TTL
+) -> bool:
     """
     Set the call context for a given call ID.
 
     Args:
         call_id (str): The call ID
         project_id (str): The project ID
+        ttl (float): Seconds the call context should be kept
 
     Returns:
         bool: True if successful
     """
-    store = get_call_info_store()
-    store[call_id] = {"project_id": project_id}
+    _write(call_id, {"project_id": project_id}, ttl, merge=False)
     logger.info(f"Set call context for call_id={call_id}, project_id={project_id}")
     return True
 
@@ -51,27 +284,25 @@ def get_call_context(call_id):
     Returns:
         dict or None: Call context if found, None otherwise
     """
-    store = get_call_info_store()
-    return store.get(call_id)
+    return _read(call_id)
 
 
 @store_operation
-def set_call_info(call_id: str, info: Dict[str, Any]) -> bool:
+def set_call_info(
+    call_id: str, info: Dict[str, Any], ttl: float = CALL_INFO_TTL
+) -> bool:
     """
     Set call information for a specific call ID. Merges with existing info if present.
 
     Args:
         call_id (str): The call ID
         info (Dict[str, Any]): Information to store
+        ttl (float): Seconds the call information should be kept
 
     Returns:
         bool: True if successful
     """
-    store = get_call_info_store()
-    if call_id in store and isinstance(store[call_id], dict):
-        store[call_id].update(info)
-    else:
-        store[call_id] = info
+    _write(call_id, info, ttl, merge=True)
     logger.info(f"Set call info for call_id={call_id}")
     return True
 
@@ -87,8 +318,23 @@ def get_call_info(call_id: str) -> Any:
     Returns:
         Any: Call information if found, None otherwise
     """
-    store = get_call_info_store()
-    return store.get(call_id)
+    return _read(call_id)
+
+
+@store_operation
+def get_call_ids() -> list:
+    """
+    Get the IDs of all unexpired calls.
+
+    Returns:
+        list: Call IDs
+    """
+    now = _now()
+    return [
+        call_id
+        for call_id, entry in get_call_info_store().items()
+        if _unwrap(entry, now) is not None
+    ]
 
 
 @store_operation
@@ -103,9 +349,25 @@ def remove_call(call_id: str) -> bool:
         bool: True if successful, False otherwise
     """
     store = get_call_info_store()
-    if call_id in store:
-        del store[call_id]
+    if store.pop(call_id, None) is not None:
+        publish_change(CALL_INFO_TOPIC, call_id, "removed")
         logger.info(f"Removed call_id={call_id} from call info store")
         return True
     logger.warning(f"Attempted to remove non-existent call_id={call_id}")
     return False
+
+
+def get_call_info_stats() -> Dict[str, Any]:
+    """
+    Report the store size and expiry/eviction counters.
+
+    Returns:
+        Dict[str, Any]: Call info store metrics
+    """
+    with _stats_lock:
+        counters = dict(_stats)
+    return {
+        "size": len(get_call_info_store()),
+        "max_entries": CALL_INFO_MAX_ENTRIES,
+        **counters,
+    }
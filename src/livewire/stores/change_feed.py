@@ -0,0 +1,489 @@
+"""
+Change feed for the LiveWire stores.
+Publishes presence and call info changes to in-process subscribers, so
+consumers wait for changes instead of polling the stores.
+
+Each event has a sequence number. A subscriber that reconnects can pass the
+last number it saw to get the recent events it missed, replayed from a bounded
+history. Every subscriber has its own bounded queue. When a consumer falls
+behind, its oldest events are dropped and counted, and writers never block.
+
+Set LIVEWIRE_CHANGE_FEED_SOCKET to also stream events to other processes over
+a Unix socket as newline-delimited JSON (see serve_change_feed and
+iter_remote_changes). A "{pid}" in the path is replaced with the process ID,
+so each worker of a multi-process server gets its own socket.
+"""
+
+import json
+import logging
+import os
+import socket
+import stat
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import (Any, Deque, Dict, Iterable, Iterator, List, Optional, Set,
+                    Tuple)
+
+logger = logging.getLogger(__name__)
+
+# Topics
+PRESENCE_TOPIC = "presence"
+CALL_INFO_TOPIC = "call_info"
+
+CHANGE_FEED_QUEUE_SIZE: int = int(os.environ.get("LIVEWIRE_CHANGE_FEED_QUEUE", 1000))
+CHANGE_FEED_HISTORY: int = int(os.environ.get("LIVEWIRE_CHANGE_FEED_HISTORY", 10000))
+CHANGE_FEED_SOCKET: str = os.environ.get("LIVEWIRE_CHANGE_FEED_SOCKET", "")
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+    A change to a store entry.
+
+    Attributes:
+        seq (int): Position in the feed, increasing by one per event
+        feed_id (str): Identifies the feed; changes when the process restarts,
+            which resets the sequence numbers
+        topic (str): PRESENCE_TOPIC or CALL_INFO_TOPIC
+        key (str): The changed entry, e.g. "<project_id>/<subscriber_id>" or a call ID
+        change (str): What happened, e.g. "online", "offline", "updated", "removed"
+        data (Optional[Dict[str, Any]]): The entry's new data, if any
+        timestamp (float): Wall-clock time of the change
+    """
+
+    seq: int
+    feed_id: str
+    topic: str
+    key: str
+    change: str
+    data: Optional[Dict[str, Any]]
+    timestamp: float
+
+    def to_json(self) -> str:
+        """
+        Serialize the event as one line of JSON.
+
+        Returns:
+            str: The event as JSON
+        """
+        return json.dumps(asdict(self), default=str)
+
+
+class Subscription:
+    """
+    A consumer's bounded queue of events. When the queue is full, the oldest
+    event is dropped to make room for the new one.
+    """
+
+    def __init__(
+        self,
+        feed: "ChangeFeed",
+        topics: Optional[Iterable[str]],
+        max_queue: int,
+    ) -> None:
+        """
+        Initialize an empty subscription.
+
+        Args:
+            feed (ChangeFeed): The feed it belongs to
+            topics (Optional[Iterable[str]]): Topics to receive (all if None)
+            max_queue (int): Events buffered before the oldest are dropped
+        """
+        self._feed = feed
+        self.topics = frozenset(topics) if topics else None
+        self._queue: Deque[ChangeEvent] = deque(maxlen=max(max_queue, 1))
+        self._ready = threading.Condition()
+        self.dropped = 0
+        self.last_seq = 0
+        self.closed = False
+
+    def wants(self, event: ChangeEvent) -> bool:
+        """
+        Check whether the subscription receives an event's topic.
+
+        Args:
+            event (ChangeEvent): The event
+
+        Returns:
+            bool: True if the event matches the topic filter
+        """
+        return self.topics is None or event.topic in self.topics
+
+    def put(self, event: ChangeEvent) -> None:
+        """
+        Queue an event, dropping the oldest one if the queue is full.
+
+        Args:
+            event (ChangeEvent): The event
+        """
+        with self._ready:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+            self._queue.append(event)
+            self._ready.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ChangeEvent]:
+        """
+        Wait for the next event.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait (forever if None)
+
+        Returns:
+            Optional[ChangeEvent]: The event, or None on timeout or close
+        """
+        with self._ready:
+            if not self._ready.wait_for(
+                lambda: self._queue or self.closed, timeout=timeout
+            ):
+                return None
+            if not self._queue:
+                return None
+            event = self._queue.popleft()
+            self.last_seq = event.seq
+            return event
+
+    def __iter__(self) -> Iterator[ChangeEvent]:
+        while True:
+            event = self.get()
+            if event is None:
+                return
+            yield event
+
+    def close(self) -> None:
+        """
+        Stop receiving events and wake up any waiting consumer.
+        """
+        self._feed.unsubscribe(self)
+        with self._ready:
+            self.closed = True
+            self._queue.clear()
+            self._ready.notify_all()
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class ChangeFeed:
+    """
+    Thread-safe in-process publish/subscribe feed with sequence numbers and a
+    bounded history for resuming.
+    """
+
+    def __init__(self, history: int = CHANGE_FEED_HISTORY) -> None:
+        """
+        Initialize an empty feed.
+
+        Args:
+            history (int): Most recent events kept for resuming subscribers
+        """
+        self.feed_id = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._history: Deque[ChangeEvent] = deque(maxlen=max(history, 1))
+        self._subscriptions: Set[Subscription] = set()
+        self._published = 0
+
+    def publish(
+        self,
+        topic: str,
+        key: str,
+        change: str,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> ChangeEvent:
+        """
+        Publish a change to every matching subscriber. O(subscribers); never blocks.
+
+        Args:
+            topic (str): The event topic
+            key (str): The changed entry
+            change (str): What happened
+            data (Optional[Dict[str, Any]]): The entry's new data
+
+        Returns:
+            ChangeEvent: The published event
+        """
+        with self._lock:
+            self._seq += 1
+            event = ChangeEvent(
+                self._seq, self.feed_id, topic, key, change, data, time.time()
+            )
+            self._history.append(event)
+            self._published += 1
+            # Deliver under the lock so every subscriber sees events in seq order
+            for subscription in self._subscriptions:
+                if subscription.wants(event):
+                    subscription.put(event)
+        return event
+
+    def subscribe(
+        self,
+        topics: Optional[Iterable[str]] = None,
+        since: Optional[int] = None,
+        max_queue: int = CHANGE_FEED_QUEUE_SIZE,
+    ) -> Subscription:
+        """
+        Start receiving events.
+
+        Args:
+            topics (Optional[Iterable[str]]): Topics to receive (all if None)
+            since (Optional[int]): Replay retained events after this sequence
+                number first; events older than the history are lost, which
+                the caller can detect from the first event's seq
+            max_queue (int): Events buffered before the oldest are dropped
+
+        Returns:
+            Subscription: The subscription; close it when done
+        """
+        subscription = Subscription(self, topics, max_queue)
+        with self._lock:
+            if since is not None:
+                for event in self._history:
+                    if event.seq > since and subscription.wants(event):
+                        subscription.put(event)
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Stop delivering events to a subscription.
+
+        Args:
+            subscription (Subscription): The subscription
+        """
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report feed counters.
+
+        Returns:
+            Dict[str, Any]: Feed metrics
+        """
+        with self._lock:
+            return {
+                "feed_id": self.feed_id,
+                "seq": self._seq,
+                "published": self._published,
+                "subscribers": len(self._subscriptions),
+                "dropped": sum(s.dropped for s in self._subscriptions),
+            }
+
+
+_feed = ChangeFeed()
+
+
+def publish_change(
+    topic: str, key: str, change: str, data: Optional[Dict[str, Any]] = None
+) -> ChangeEvent:
+    """
+    Publish a change on the process-wide feed.
+
+    Args:
+        topic (str): The event topic
+        key (str): The changed entry
+        change (str): What happened
+        data (Optional[Dict[str, Any]]): The entry's new data
+
+    Returns:
+        ChangeEvent: The published event
+    """
+    return _feed.publish(topic, key, change, data)
+
+
+def subscribe_changes(
+    topics: Optional[Iterable[str]] = None,
+    since: Optional[int] = None,
+    max_queue: int = CHANGE_FEED_QUEUE_SIZE,
+) -> Subscription:
+    """
+    Subscribe to the process-wide feed.
+
+    Args:
+        topics (Optional[Iterable[str]]): Topics to receive (all if None)
+        since (Optional[int]): Replay retained events after this sequence number
+        max_queue (int): Events buffered before the oldest are dropped
+
+    Returns:
+        Subscription: The subscription; close it when done
+    """
+    return _feed.subscribe(topics, since, max_queue)
+
+
+_socket_servers: Dict[str, socket.socket] = {}
+_socket_clients = 0
+_socket_lock = threading.Lock()
+
+
+def _serve_client(conn: socket.socket) -> None:
+    """
+    Stream events to one socket client until it disconnects.
+
+    The client may first send one JSON line with "topics" and "since"
+    (resume point); events are then sent as one JSON object per line.
+
+    Args:
+        conn (socket.socket): The client connection
+    """
+    global _socket_clients
+
+    with _socket_lock:
+        _socket_clients += 1
+    subscription = None
+    try:
+        with conn, conn.makefile("rb") as reader:
+            conn.settimeout(1.0)
+            try:
+                request = json.loads(reader.readline() or b"{}")
+            except (socket.timeout, ValueError):
+                request = {}
+            conn.settimeout(None)
+            subscription = subscribe_changes(
+                request.get("topics"), request.get("since")
+            )
+            while True:
+                event = subscription.get()
+                if event is None:
+                    return
+                conn.sendall(event.to_json().encode() + b"\n")
+    except OSError:
+        # Client went away
+        pass
+    finally:
+        if subscription is not None:
+            subscription.close()
+        with _socket_lock:
+            _socket_clients -= 1
+
+
+def _accept_loop(server: socket.socket) -> None:
+    """
+    Accept socket clients, each served by its own thread.
+
+    Args:
+        server (socket.socket): The listening socket
+    """
+    while True:
+        try:
+            conn, _ = server.accept()
+        except OSError:
+            return
+        threading.Thread(
+            target=_serve_client, args=(conn,), name="change-feed-client", daemon=True
+        ).start()
+
+
+def _clear_stale_socket(path: str) -> bool:
+    """
+    Remove a socket file left by a previous run so the path can be bound.
+    Leaves anything that is not a socket, or a socket another process still
+    serves, in place.
+
+    Args:
+        path (str): Socket path
+
+    Returns:
+        bool: True if the path is free to bind
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return True
+    if not stat.S_ISSOCK(mode):
+        logger.error(f"Change feed socket path {path} exists and is not a socket")
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            pass  # Nobody is listening
+        else:
+            logger.error(f"Change feed socket {path} is served by another process")
+            return False
+    os.remove(path)
+    return True
+
+
+def serve_change_feed(path: str = CHANGE_FEED_SOCKET) -> Optional[str]:
+    """
+    Stream the process-wide feed to other local processes over a Unix socket.
+    Does nothing if no path is configured, the platform lacks Unix sockets,
+    or this process already serves the path. The socket is only accessible
+    to the user running the app.
+
+    Args:
+        path (str): Socket path; "{pid}" is replaced with the process ID
+
+    Returns:
+        Optional[str]: The socket path served, or None if not serving
+    """
+    if not path:
+        return None
+    if not hasattr(socket, "AF_UNIX"):
+        logger.warning("Unix sockets are not available; change feed socket disabled")
+        return None
+
+    path = path.replace("{pid}", str(os.getpid()))
+    with _socket_lock:
+        if path in _socket_servers:
+            return path
+        if not _clear_stale_socket(path):
+            return None
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        # Restrict access before listening, so no other user can connect
+        os.chmod(path, 0o600)
+        server.listen()
+        _socket_servers[path] = server
+    threading.Thread(
+        target=_accept_loop, args=(server,), name="change-feed-socket", daemon=True
+    ).start()
+    logger.info(f"Serving the change feed on {path}")
+    return path
+
+
+def iter_remote_changes(
+    path: str,
+    topics: Optional[List[str]] = None,
+    since: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Follow another process's change feed over its Unix socket.
+
+    Args:
+        path (str): Socket path served by serve_change_feed
+        topics (Optional[List[str]]): Topics to receive (all if None)
+        since (Optional[int]): Replay retained events after this sequence number
+
+    Yields:
+        Dict[str, Any]: Events, as dicts with the ChangeEvent fields
+
+    Raises:
+        OSError: If the socket cannot be reached
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(path)
+        conn.sendall(json.dumps({"topics": topics, "since": since}).encode() + b"\n")
+        with conn.makefile("rb") as reader:
+            for line in reader:
+                yield json.loads(line)
+
+
+def get_change_feed_stats() -> Dict[str, Any]:
+    """
+    Report counters for the process-wide feed and its socket clients.
+
+    Returns:
+        Dict[str, Any]: Change feed metrics
+    """
+    with _socket_lock:
+        sockets: Tuple[str, ...] = tuple(_socket_servers)
+        clients = _socket_clients
+    return {**_feed.stats(), "sockets": list(sockets), "socket_clients": clients}
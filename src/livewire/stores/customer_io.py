@@ -0,0 +1,365 @@
+"""
+Bulk customer import/export.
+Streams members between CSV or NDJSON files and the customer store, validating
+rows and writing them (and their index entries) in batches, so memory use
+stays flat regardless of file size.
+
+Example:
+    LIVEWIRE_STORE_BACKEND=sqlite python -m livewire.stores.customer_io \\
+        import members.csv
+    LIVEWIRE_STORE_BACKEND=sqlite python -m livewire.stores.customer_io \\
+        export members.ndjson
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from livewire.utils.api_utils import validate_email
+
+from .backends import MEMORY_BACKEND, STORE_BACKEND
+from .customer_store import add_customers, iter_customers
+
+logger = logging.getLogger(__name__)
+
+# File formats
+CSV_FORMAT = "csv"
+NDJSON_FORMAT = "ndjson"
+
+IMPORT_BATCH_SIZE: int = int(os.environ.get("CUSTOMER_IMPORT_BATCH_SIZE", 1000))
+# Rejected rows whose reasons are kept for the import report
+MAX_REPORTED_ERRORS = 100
+
+# Columns written by CSV exports, in order
+EXPORT_COLUMNS = [
+    "member_id",
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "display_name",
+    "job_title",
+    "company_name",
+    "premium_member",
+]
+# Fields never written to exports
+EXCLUDED_FIELDS = {"password", "confirm_password"}
+
+ProgressCallback = Callable[[int, int, int], None]
+
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    """
+    Work out a file's format from an explicit value or its extension.
+
+    Args:
+        path (str): File path
+        fmt (Optional[str]): Explicit format, "csv" or "ndjson"
+
+    Returns:
+        str: CSV_FORMAT or NDJSON_FORMAT
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt is None:
+        extension = os.path.splitext(path)[1].lower()
+        fmt = {
+            ".csv": CSV_FORMAT,
+            ".ndjson": NDJSON_FORMAT,
+            ".jsonl": NDJSON_FORMAT,
+        }.get(extension)
+    if fmt not in (CSV_FORMAT, NDJSON_FORMAT):
+        raise ValueError(f"Unknown customer file format for {path}: {fmt}")
+    return fmt
+
+
+def _read_rows(path: str, fmt: str) -> Iterator[Tuple[int, Any]]:
+    """
+    Stream raw rows from a customer file.
+
+    Args:
+        path (str): File path
+        fmt (str): CSV_FORMAT or NDJSON_FORMAT
+
+    Yields:
+        Tuple[int, Any]: (line number, row); NDJSON rows that fail to parse
+        are yielded as the ValueError raised
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == CSV_FORMAT:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as e:
+                yield line_number, e
+
+
+def _parse_bool(value: Any) -> bool:
+    """
+    Coerce a CSV/JSON flag to a bool.
+
+    Args:
+        value (Any): Raw value
+
+    Returns:
+        bool: The flag
+
+    Raises:
+        ValueError: If the value is not a recognizable boolean
+    """
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("true", "1", "yes", "y"):
+        return True
+    if text in ("false", "0", "no", "n", ""):
+        return False
+    raise ValueError(f"invalid premium_member value: {value!r}")
+
+
+def validate_customer(row: Any) -> Dict[str, Any]:
+    """
+    Turn a raw row into a customer record.
+
+    Strings are stripped and empty fields dropped, so CSV and NDJSON rows
+    produce the same record.
+
+    Args:
+        row (Any): Parsed CSV or NDJSON row
+
+    Returns:
+        Dict[str, Any]: The customer record
+
+    Raises:
+        ValueError: If the row is not a valid customer
+    """
+    if isinstance(row, ValueError):
+        raise ValueError(f"invalid JSON: {row}")
+    if not isinstance(row, dict):
+        raise ValueError("row is not an object")
+
+    record = {}
+    for field, value in row.items():
+        # CSV rows with more values than headers put the extras under None
+        if field is None or field in EXCLUDED_FIELDS:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+        if value in ("", None):
+            continue
+        record[field] = value
+
+    member_id = record.get("member_id")
+    if not isinstance(member_id, str):
+        raise ValueError("missing member_id")
+    if "email" in record:
+        valid, error = validate_email(record["email"])
+        if not valid:
+            raise ValueError(error)
+    if "phone" in record and not any(c.isdigit() for c in str(record["phone"])):
+        raise ValueError(f"invalid phone: {record['phone']!r}")
+    record["premium_member"] = _parse_bool(record.get("premium_member", False))
+    return record
+
+
+def import_customers(
+    path: str,
+    fmt: Optional[str] = None,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    progress: Optional[ProgressCallback] = None,
+) -> Dict[str, Any]:
+    """
+    Stream customers from a CSV or NDJSON file into the customer store.
+
+    Rows are validated as they are read; valid ones are written, with their
+    index entries, one batch at a time. Invalid rows are skipped and counted.
+
+    Args:
+        path (str): File to import
+        fmt (Optional[str]): "csv" or "ndjson" (defaults to the file extension)
+        batch_size (int): Rows written per batch
+        progress (Optional[ProgressCallback]): Called after each batch with
+            (rows processed, customers imported, rows rejected)
+
+    Returns:
+        Dict[str, Any]: Import report with processed, imported, rejected,
+        errors (the first MAX_REPORTED_ERRORS) and seconds
+
+    Raises:
+        ValueError: If the file format is unknown
+        OSError: If the file cannot be read
+    """
+    fmt = detect_format(path, fmt)
+    started = time.perf_counter()
+    processed = imported = rejected = 0
+    errors: List[str] = []
+    batch: List[Dict[str, Any]] = []
+
+    def flush() -> None:
+        nonlocal imported
+        imported += add_customers(batch)
+        batch.clear()
+        if progress:
+            progress(processed, imported, rejected)
+
+    for line_number, row in _read_rows(path, fmt):
+        processed += 1
+        try:
+            batch.append(validate_customer(row))
+        except ValueError as e:
+            rejected += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(f"line {line_number}: {e}")
+            continue
+        if len(batch) >= batch_size:
+            flush()
+    # Also reports the final counts when the last batch was already flushed
+    flush()
+
+    seconds = time.perf_counter() - started
+    logger.info(
+        f"Imported {imported} customers from {path} "
+        f"({rejected} rejected of {processed}) in {seconds:.2f}s"
+    )
+    return {
+        "processed": processed,
+        "imported": imported,
+        "rejected": rejected,
+        "errors": errors,
+        "seconds": seconds,
+    }
+
+
+def _export_record(customer: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drop fields that must not leave the store.
+
+    Args:
+        customer (Dict[str, Any]): Stored customer data
+
+    Returns:
+        Dict[str, Any]: Exportable customer data
+    """
+    return {k: v for k, v in customer.items() if k not in EXCLUDED_FIELDS}
+
+
+def export_customers(
+    path: str,
+    fmt: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+    progress_every: int = IMPORT_BATCH_SIZE,
+) -> int:
+    """
+    Stream every customer from the store to a CSV or NDJSON file.
+
+    CSV files have the EXPORT_COLUMNS; other fields are only kept by NDJSON.
+    Passwords are never exported.
+
+    Args:
+        path (str): File to write
+        fmt (Optional[str]): "csv" or "ndjson" (defaults to the file extension)
+        progress (Optional[ProgressCallback]): Called every ``progress_every``
+            customers and at the end with (exported, exported, 0)
+        progress_every (int): Customers between progress calls
+
+    Returns:
+        int: Number of customers exported
+
+    Raises:
+        ValueError: If the file format is unknown
+        OSError: If the file cannot be written
+    """
+    fmt = detect_format(path, fmt)
+    exported = 0
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = None
+        if fmt == CSV_FORMAT:
+            writer = csv.DictWriter(f, fieldnames=EXPORT_COLUMNS, extrasaction="ignore")
+            writer.writeheader()
+        for member_id, customer in iter_customers():
+            record = {"member_id": member_id, **_export_record(customer)}
+            if writer:
+                writer.writerow(record)
+            else:
+                f.write(json.dumps(record, default=str) + "\n")
+            exported += 1
+            if progress and exported % progress_every == 0:
+                progress(exported, exported, 0)
+
+    if progress:
+        progress(exported, exported, 0)
+    logger.info(f"Exported {exported} customers to {path}")
+    return exported
+
+
+def log_progress(processed: int, done: int, rejected: int) -> None:
+    """
+    Progress callback that logs each batch.
+
+    Args:
+        processed (int): Rows processed so far
+        done (int): Customers imported or exported so far
+        rejected (int): Rows rejected so far
+    """
+    logger.info(f"Customers: {processed} processed, {done} done, {rejected} rejected")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Args:
+        argv (Optional[List[str]]): Arguments (defaults to sys.argv)
+
+    Returns:
+        int: Exit status
+    """
+    parser = argparse.ArgumentParser(description="Bulk customer import/export")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command in ("import", "export"):
+        subparser = subparsers.add_parser(command)
+        subparser.add_argument("path")
+        subparser.add_argument("--format", choices=[CSV_FORMAT, NDJSON_FORMAT])
+    subparsers.choices["import"].add_argument(
+        "--batch-size", type=int, default=IMPORT_BATCH_SIZE
+    )
+    args = parser.parse_args(argv)
+
+    if STORE_BACKEND == MEMORY_BACKEND:
+        logger.warning(
+            "The memory store backend is per process; set "
+            "LIVEWIRE_STORE_BACKEND=sqlite to share the customers with the app"
+        )
+
+    if args.command == "import":
+        report = import_customers(
+            args.path, args.format, args.batch_size, progress=log_progress
+        )
+        for error in report["errors"]:
+            logger.warning(f"Rejected {error}")
+        return 1 if report["rejected"] and not report["imported"] else 0
+
+    export_customers(args.path, args.format, progress=log_progress)
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+    sys.exit(main())
@@ -6,45 +6,159 @@
 Customer/member store module.
 Provides functions to access and manipulate customer data.
 Structure: {member_id: {first_name, last_name, email, phone, premium_member, ...}}
+
+A companion index store maps normalized member IDs, emails, and phone numbers
+to member IDs, so lookups by any of them are constant time.
+Index structure: {"<field>:<normalized value>": member_id}
+
+Customers are stored as CustomerRecord instances, which read like dicts.
 """
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from . import CUSTOMER_STORE, get_store, store_operation
+from . import CUSTOMER_INDEX_STORE, CUSTOMER_STORE, get_store, store_operation
+from .backends import DELETE_ITEM, StoreBackend
+from .records import CustomerRecord
 
 logger = logging.getLogger(__name__)
 
+# Indexed customer fields and how their values are normalized
+_INDEXED_FIELDS = {
+    "member_id": lambda value: value.strip().lower(),
+    "email": lambda value: value.strip().lower(),
+    # Digits only, so "+1 (234) 567-890" and "+1234567890" match
+    "phone": lambda value: re.sub(r"\D", "", value),
+}
+
+# Sample data and the index are set up once per process, not on every lookup
+# (an emptiness check is a COUNT(*) on the sqlite backend)
+_store_initialized = False
+_store_init_lock = threading.Lock()
+
+
+def _index_keys(customer: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Compute the index keys of a customer record.
+
+    Args:
+        customer (Optional[Dict[str, Any]]): Customer data
+
+    Returns:
+        Dict[str, str]: Index key for each indexed field present on the record
+    """
+    keys = {}
+    for field, normalize in _INDEXED_FIELDS.items():
+        value = (customer or {}).get(field)
+        if isinstance(value, str) and normalize(value):
+            keys[field] = f"{field}:{normalize(value)}"
+    return keys
+
+
+def _index_customer(
+    member_id: str,
+    customer: Dict[str, Any],
+    previous: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Point a customer's index entries at it, dropping entries of its previous record.
+
+    Args:
+        member_id (str): The member ID (store key)
+        customer (Dict[str, Any]): The customer's current data
+        previous (Optional[Dict[str, Any]]): The data it replaced, if any
+    """
+    index = get_store(CUSTOMER_INDEX_STORE)
+    current_keys = set(_index_keys(customer).values())
+    for key in set(_index_keys(previous).values()) - current_keys:
+        # Only drop entries that still point at this member
+        index.update_item(
+            key, lambda owner: DELETE_ITEM if owner in (member_id, None) else owner
+        )
+    for key in current_keys:
+        index[key] = member_id
+
+
+def _ensure_index(store: StoreBackend) -> None:
+    """
+    Build the index from the store if it is empty but the store is not, e.g.
+    when a shared store was filled before indexing existed.
+
+    Args:
+        store (StoreBackend): The customer store
+    """
+    index = get_store(CUSTOMER_INDEX_STORE)
+    if not index and store:
+        for member_id, customer in store.items():
+            _index_customer(member_id, customer)
+        logger.info(f"Rebuilt customer index for {len(store)} customers")
+
+
+def _lookup(field: str, value: str) -> Optional[Dict[str, Any]]:
+    """
+    Find a customer through the index. An entry pointing at a customer
+    whose field no longer has that value is stale and counts as a miss.
+
+    Args:
+        field (str): Indexed field name
+        value (str): Value to look up (normalized before lookup)
+
+    Returns:
+        Optional[Dict[str, Any]]: Customer data if found, None otherwise
+    """
+    store = get_customer_store()
+    key = _index_keys({field: value}).get(field)
+    if key is None:
+        return None
+    member_id = get_store(CUSTOMER_INDEX_STORE).get(key)
+    customer = store.get(member_id) if member_id else None
+    if customer is None or _index_keys(customer).get(field) != key:
+        return None
+    return customer
+
 
 @store_operation
-def _initialize_store() -> Dict[str, Dict[str, Any]]:
+def _initialize_store() -> StoreBackend:
     """
-    Initialize the customer store with sample data for testing.
+    Initialize the customer store with sample data for testing, once per process.
 
     Returns:
-        Dict[str, Dict[str, Any]]: The customer store instance
+        StoreBackend: The customer store instance
     """
+    global _store_initialized
+
     store = get_store(CUSTOMER_STORE)
-    # Add sample customer only if store is empty
-    if not store:
-        store["AB12345"] = {
-            "member_id": "AB12345",
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john.doe@example.com",
-            "phone": "+1234567890",
-            "premium_member": True,
-        }
-        logger.info("Initialized customer store with sample customer: AB12345")
+    if _store_initialized:
+        return store
+    with _store_init_lock:
+        if _store_initialized:
+            return store
+        # Add sample customer only if store is empty
+        if not store:
+            sample = CustomerRecord(
+                member_id="AB12345",
+                first_name="John",
+                last_name="Doe",
+                email="john.doe@example.com",
+                phone="+1234567890",
+                premium_member=True,
+            )
+            store["AB12345"] = sample
+            _index_customer("AB12345", sample)
+            logger.info("Initialized customer store with sample customer: AB12345")
+        _ensure_index(store)
+        _store_initialized = True
     return store
 
 
 @store_operation
-def get_customer_store() -> Dict[str, Dict[str, Any]]:
+def get_customer_store() -> StoreBackend:
     """
     Get the customer store instance.
 
     Returns:
-        Dict[str, Dict[str, Any]]: The customer store instance
+        StoreBackend: The customer store instance
     """
     return _initialize_store()
 
@@ -60,19 +174,45 @@ def get_customer(member_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Optional[Dict[str, Any]]: Customer data if found, None otherwise
     """
-    store = get_customer_store()
+    # Exact match needs no index hop
+    customer = get_customer_store().get(member_id)
+    if customer is not None:
+        return customer
+    return _lookup("member_id", member_id)
 
-    # Case-insensitive lookup
-    for cid, customer in store.items():
-        if cid.lower() == member_id.lower():
-            return customer
-    return None
+
+@store_operation
+def get_customer_by_email(email: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a customer by email address (case-insensitive).
+
+    Args:
+        email (str): The email address to look up
+
+    Returns:
+        Optional[Dict[str, Any]]: Customer data if found, None otherwise
+    """
+    return _lookup("email", email)
+
+
+@store_operation
+def get_customer_by_phone(phone: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a customer by phone number, ignoring formatting characters.
+
+    Args:
+        phone (str): The phone number to look up
+
+    Returns:
+        Optional[Dict[str, Any]]: Customer data if found, None otherwise
+    """
+    return _lookup("phone", phone)
 
 
 @store_operation
 def add_customer(member_data: Dict[str, Any]) -> bool:
     """
-    Add a new customer to the store.
+    Add a new customer to the store and index it.
 
     Args:
         member_data (Dict): Customer data including member_id
@@ -86,9 +226,72 @@ def add_customer(member_data: Dict[str, Any]) -> bool:
         logger.warning("Attempted to add customer without member_id")
         return False
 
-    store[member_id] = member_data
+    customer = CustomerRecord.from_dict(member_data)
+    previous = None
+
+    def replace(current: Optional[Dict[str, Any]]) -> CustomerRecord:
+        nonlocal previous
+        previous = current
+        return customer
+
+    store.update_item(member_id, replace)
+    _index_customer(member_id, customer, previous)
     logger.info(f"Added customer with member_id: {member_id}")
     return True
 
 
+@store_operation
+def add_customers(records: List[Dict[str, Any]]) -> int:
+    """
+    Add a batch of customers, writing the store and the index in bulk.
+
+    Intended for imports: each batch costs one store write and one index write
+    instead of a write per customer. Later records win over earlier ones with
+    the same member_id.
+
+    Args:
+        records (List[Dict[str, Any]]): Customer data, each including member_id
+
+    Returns:
+        int: Number of customers written
+    """
+    store = get_customer_store()
+    batch = {}
+    for record in records:
+        member_id = record.get("member_id")
+        if member_id:
+            batch[member_id] = CustomerRecord.from_dict(record)
+    if not batch:
+        return 0
+
+    previous = {member_id: store.get(member_id) for member_id in batch}
+    store.set_many(batch.items())
+
+    index = get_store(CUSTOMER_INDEX_STORE)
+    entries = {}
+    for member_id, customer in batch.items():
+        current_keys = set(_index_keys(customer).values())
+        for key in set(_index_keys(previous[member_id]).values()) - current_keys:
+            index.update_item(
+                key,
+                lambda owner, member_id=member_id: (
+                    DELETE_ITEM if owner in (member_id, None) else owner
+                ),
+            )
+        for key in current_keys:
+            entries[key] = member_id
+    index.set_many(entries.items())
+    return len(batch)
+
+
+def iter_customers() -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Stream every customer without loading the whole store at once.
+
+    Yields:
+        Tuple[str, Dict[str, Any]]: (member_id, customer data) pairs
+    """
+    yield from get_customer_store().iter_items()
+
+
 # Remove update_customer and delete_customer as they are unused
@@ -0,0 +1,192 @@
+"""
+Compact record types for store entries.
+
+Store entries used to be free-form dicts, whose per-entry overhead dominates
+memory once a store holds hundreds of thousands of them. These records keep
+their known fields in slots instead, and any other fields in an ``extra``
+dict that only exists when needed.
+
+Records are read-only mappings, so existing callers keep working:
+``record["email"]``, ``record.get("phone")``, ``"phone" in record``,
+``dict(record)`` and ``{**record}`` all behave as they did with dicts.
+A field set to None is treated as absent. To change a record, build a new one
+with ``updated()``, the way the stores already replace entries atomically.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, TypeVar
+
+R = TypeVar("R", bound="Record")
+
+
+class Record(Mapping):
+    """
+    Base class giving slotted dataclasses a read-only dict interface.
+    """
+
+    __slots__ = ()
+
+    # Names of the slotted fields, set by the @record decorator
+    _FIELDS: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        elif self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self._FIELDS:
+            if getattr(self, name) is not None:
+                yield name
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __reduce__(self) -> Tuple[type, Tuple[Any, ...]]:
+        # Pickle as a constructor call on the field values: smaller and
+        # faster to load than the default slot state (stores pickle records)
+        return type(self), tuple(getattr(self, name) for name in self._FIELDS) + (
+            self.extra,
+        )
+
+    @classmethod
+    def from_dict(cls: Type[R], data: Mapping) -> R:
+        """
+        Build a record from a dict, keeping unknown fields in ``extra``.
+
+        Args:
+            data (Mapping): Entry data (returned as is if already a record)
+
+        Returns:
+            Record: The record
+        """
+        if isinstance(data, cls):
+            return data
+        known = {}
+        extra = {}
+        for key, value in data.items():
+            if key in cls._FIELDS:
+                known[key] = value
+            elif key != "extra":
+                extra[key] = value
+        return cls(**known, extra=extra or None)
+
+    def updated(self: R, **changes: Any) -> R:
+        """
+        Build a copy of the record with some fields changed.
+
+        Args:
+            **changes (Any): Field values to set
+
+        Returns:
+            Record: The new record
+        """
+        return self.from_dict({**self, **changes})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to a plain dict, e.g. for JSON.
+
+        Returns:
+            Dict[str, Any]: The record's fields
+        """
+        return dict(self)
+
+
+def record(cls: Type[R]) -> Type[R]:
+    """
+    Class decorator turning a Record subclass into a slotted dataclass.
+
+    Args:
+        cls (Type[Record]): The record class; must declare an ``extra`` field
+            as its last field
+
+    Returns:
+        Type[Record]: The slotted class
+    """
+    # eq=False keeps Mapping equality, so records compare equal to dicts
+    cls = dataclass(slots=True, eq=False)(cls)
+    cls._FIELDS = tuple(f.name for f in fields(cls) if f.name != "extra")
+    return cls
+
+
+@record
+class CustomerRecord(Record):
+    """
+    A customer_store entry.
+    """
+
+    member_id: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    premium_member: Optional[bool] = None
+    display_name: Optional[str] = None
+    job_title: Optional[str] = None
+    company_name: Optional[str] = None
+    # Kept out of repr() so records can be logged safely
+    password: Optional[str] = field(default=None, repr=False)
+    extra: Optional[Dict[str, Any]] = None
+
+
+@record
+class UserRecord(Record):
+    """
+    A user_store entry.
+    """
+
+    password_hash: Optional[str] = field(default=None, repr=False)
+    subscriber_id: Optional[str] = None
+    display_name: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    extra: Optional[Dict[str, Any]] = None
+
+
+@record
+class PresenceRecord(Record):
+    """
+    A subscriber's entry in active_subscribers_store.
+    """
+
+    address: Optional[str] = None
+    online: bool = False
+    last_seen: Optional[datetime] = None
+    # Wall-clock time after which the subscriber is considered gone
+    expires_at: Optional[float] = None
+    extra: Optional[Dict[str, Any]] = None
+
+
+@record
+class CallInfoEntry(Record):
+    """
+    A call_info_store entry: the call's free-form data plus its expiry
+    and LRU bookkeeping.
+    """
+
+    data: Optional[Dict[str, Any]] = None
+    expires_at: float = 0.0
+    last_access: float = 0.0
+    extra: Optional[Dict[str, Any]] = None
+
+
+@record
+class OnlineSet(Record):
+    """
+    A project's online subscribers in online_subscribers_store, with their
+    addresses precomputed for building transfer targets.
+    """
+
+    # subscriber_id -> address
+    members: Optional[Dict[str, str]] = None
+    addresses: Tuple[str, ...] = ()
+    extra: Optional[Dict[str, Any]] = None
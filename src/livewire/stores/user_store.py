@@ -1,6 +1,7 @@
 """
 User store module.
 Manages user authentication data and subscriber mapping.
+Structure: {email: UserRecord(password_hash, subscriber_id, display_name, ...)}
 """
 
 import logging
@@ -9,42 +10,44 @@ from typing import Any, Dict, Optional
 from werkzeug.security import generate_password_hash
 
 from . import USER_STORE, get_store, store_operation
+from .backends import StoreBackend
+from .records import UserRecord
 
 logger = logging.getLogger(__name__)
 
 
 @store_operation
-def _initialize_store() -> Dict[str, Dict[str, Any]]:
+def _initialize_store() -> StoreBackend:
     """
     Initialize the user store with sample data for testing.
 
     Returns:
-        Dict[str, Dict[str, Any]]: The user store instance
+        StoreBackend: The user store instance
     """
     store = get_store(USER_STORE)
 
     # Only add sample user if store is empty
     if not store:
         # Sample user for testing - email: test@example.com, password: testpassword
-        store["test@example.com"] = {
-            "password_hash": generate_password_hash("testpassword"),
-            "subscriber_id": "test-subscriber-id",
-            "display_name": "Test User",
-            "first_name": "Test",
-            "last_name": "User",
-        }
+        store["test@example.com"] = UserRecord(
+            password_hash=generate_password_hash("testpassword"),
+            subscriber_id="test-subscriber-id",
+            display_name="Test User",
+            first_name="Test",
+            last_name="User",
+        )
         logger.info("Initialized user store with sample test user: test@example.com")
 
     return store
 
 
 @store_operation
-def get_user_store() -> Dict[str, Dict[str, Any]]:
+def get_user_store() -> StoreBackend:
     """
     Get the user store instance.
 
     Returns:
-        Dict[str, Dict[str, Any]]: The user store instance
+        StoreBackend: The user store instance
     """
     return _initialize_store()
 
@@ -62,3 +65,15 @@ def get_user(email: str) -> Optional[Dict[str, Any]]:
     """
     store = get_user_store()
     return store.get(email.lower())
+
+
+@store_operation
+def add_user(email: str, user_data: Dict[str, Any]) -> None:
+    """
+    Add or replace a user.
+
+    Args:
+        email (str): Email address of the user (stored lowercased)
+        user_data (Dict[str, Any]): User data, e.g. from build_user_store_entry
+    """
+    get_user_store()[email.lower()] = UserRecord.from_dict(user_data)
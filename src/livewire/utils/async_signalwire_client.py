@@ -0,0 +1,590 @@
+"""
+Asyncio SignalWire API client for the LiveWire demo app.
+Mirrors SignalWireClient with non-blocking I/O, so one event loop can keep
+many outbound SignalWire calls in flight.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import weakref
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency, only needed for the async client
+    aiohttp = None
+
+from livewire.utils.circuit_breaker import get_circuit_breaker
+from livewire.utils.connection_pool import POOL_IDLE_TIMEOUT, POOL_MAXSIZE
+from livewire.utils.handler_address_cache import invalidate_handler_addresses
+from livewire.utils.retry_scheduler import parse_retry_after
+from livewire.utils.signalwire_client import (DEFAULT_CALL_TIMEOUT_SECONDS,
+                                              RATE_LIMIT_FAIL_FAST,
+                                              RATE_LIMIT_WAIT,
+                                              REQUEST_TIMEOUT_SECONDS,
+                                              BaseSignalWireClient,
+                                              SignalWireAPIError)
+from livewire.utils.subscriber_index import (SUBSCRIBER_INDEX_PAGE_SIZE,
+                                             SubscriberIndex,
+                                             get_subscriber_index)
+
+logger = logging.getLogger(__name__)
+
+# Per event loop, one lock per subscriber index serializing its scans
+_index_build_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_index_build_lock(index: SubscriberIndex) -> asyncio.Lock:
+    """
+    Get the running loop's build lock for a subscriber index. asyncio locks
+    can't be shared between loops, so each loop gets its own.
+
+    Args:
+        index (SubscriberIndex): The index to be scanned
+
+    Returns:
+        asyncio.Lock: The lock serializing the index's scans on this loop
+    """
+    locks = _index_build_locks.setdefault(asyncio.get_running_loop(), {})
+    lock = locks.get(index.name)
+    if lock is None:
+        lock = locks[index.name] = asyncio.Lock()
+    return lock
+
+
+class AsyncSignalWireClient(BaseSignalWireClient):
+    """
+    Asyncio client for interacting with SignalWire APIs.
+
+    Exposes the same methods as SignalWireClient, each returning an awaitable.
+    Backoff between retries (full jitter, honoring Retry-After, bounded by the
+    call deadline) uses ``asyncio.sleep`` so no thread is blocked,
+    and cancelling the awaiting task aborts the in-flight request.
+
+    The client owns an aiohttp session bound to the running event loop; use it
+    as an async context manager or call ``close()`` when done.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        auth_token: str,
+        space_name: str,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        call_timeout: float = DEFAULT_CALL_TIMEOUT_SECONDS,
+        rate_limit_mode: str = RATE_LIMIT_WAIT,
+        timeout: float = REQUEST_TIMEOUT_SECONDS,
+        base_url: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the async SignalWire client with credentials.
+
+        Args:
+            project_id (str): SignalWire project ID
+            auth_token (str): SignalWire auth token
+            space_name (str): SignalWire space name (domain part of the URL)
+            max_retries (int): Maximum number of retries for retryable errors
+            retry_delay (float): Base delay in seconds between retries (increases exponentially)
+            call_timeout (float): Total time budget in seconds for a call, including retries
+            rate_limit_mode (str): RATE_LIMIT_WAIT to wait for a rate limit token,
+                RATE_LIMIT_FAIL_FAST to raise immediately when none is available
+            timeout (float): Timeout in seconds for each attempt
+            base_url (Optional[str]): API base URL (defaults to SIGNALWIRE_API_BASE_URL,
+                then to the space's own URL)
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncSignalWireClient requires the 'aiohttp' package")
+
+        super().__init__(
+            project_id,
+            auth_token,
+            space_name,
+            max_retries,
+            retry_delay,
+            call_timeout,
+            rate_limit_mode,
+            base_url,
+        )
+        self.timeout = timeout
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    async def __aenter__(self) -> "AsyncSignalWireClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """
+        Get the keep-alive aiohttp session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: The client session
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=POOL_MAXSIZE,
+                keepalive_timeout=POOL_IDLE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the underlying aiohttp session and its connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _wait_for_rate_token(self, deadline: float) -> None:
+        """
+        Take a rate limit token, waiting for one if the client is in wait mode.
+
+        Args:
+            deadline (float): Monotonic time by which the call must finish
+
+        Raises:
+            SignalWireAPIError: If failing fast or no token is available before the deadline
+        """
+        while True:
+            wait = self._take_rate_token()
+            if wait <= 0:
+                return
+            if (
+                self.rate_limit_mode == RATE_LIMIT_FAIL_FAST
+                or time.monotonic() + wait >= deadline
+            ):
+                raise self._rate_limited_error(wait)
+            await asyncio.sleep(wait)
+
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        deadline: float,
+    ) -> Dict[str, Any]:
+        """
+        Make a single attempt at a SignalWire API request.
+
+        Args:
+            method (str): HTTP method (GET, POST, PATCH, etc.)
+            url (str): Absolute request URL
+            data (Optional[Dict[str, Any]]): Optional JSON payload
+            params (Optional[Dict[str, Any]]): Optional URL parameters
+            deadline (float): Monotonic time by which the call must finish
+
+        Returns:
+            Dict[str, Any]: Response data on success
+
+        Raises:
+            SignalWireAPIError: On API error, timeout, or connection failure
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise SignalWireAPIError("Call deadline exceeded", is_retryable=True)
+
+        try:
+            logger.debug(f"SignalWire API request: {method} {url}")
+
+            session = self._get_session()
+            async with session.request(
+                method,
+                url,
+                json=data,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=min(self.timeout, remaining)),
+            ) as response:
+                status_code = response.status
+                text = await response.text()
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+        except asyncio.TimeoutError as e:
+            # Handle timeout errors specifically
+            logger.error(f"SignalWire API timeout: {method} {url} - {str(e)}")
+            raise SignalWireAPIError(f"Request timed out: {str(e)}", is_retryable=True)
+
+        except aiohttp.ClientConnectionError as e:
+            # Handle connection errors
+            logger.error(f"SignalWire API connection error: {method} {url} - {str(e)}")
+            raise SignalWireAPIError(f"Connection error: {str(e)}", is_retryable=True)
+
+        except aiohttp.ClientError as e:
+            # Handle all other request errors
+            logger.exception(f"SignalWire request failed: {method} {url} - {str(e)}")
+            raise SignalWireAPIError(f"Request failed: {str(e)}")
+
+        # Return JSON data if present
+        if status_code < 400:
+            if not text:
+                return {"status": "success"}
+            try:
+                return json.loads(text)
+            except ValueError as e:
+                logger.error(f"SignalWire API invalid JSON: {method} {url} - {e}")
+                raise SignalWireAPIError(f"Request failed: invalid JSON: {e}")
+
+        # Parse error response
+        try:
+            error_msg = json.loads(text).get("message", text)
+        except (ValueError, AttributeError):
+            error_msg = text or f"HTTP {status_code}"
+
+        raise SignalWireAPIError(
+            error_msg, status_code, self._is_retryable_error(status_code), retry_after
+        )
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the SignalWire API with non-blocking retry logic.
+
+        Args:
+            method (str): HTTP method (GET, POST, PATCH, etc.)
+            endpoint (str): API endpoint path
+            data (Optional[Dict[str, Any]]): Optional JSON payload
+            params (Optional[Dict[str, Any]]): Optional URL parameters
+            timeout (Optional[float]): Total time budget in seconds (defaults to call_timeout)
+
+        Returns:
+            Dict[str, Any]: Response data on success
+
+        Raises:
+            SignalWireAPIError: On API error
+            asyncio.CancelledError: If the awaiting task is cancelled
+        """
+        url = self._build_url(endpoint)
+        deadline = time.monotonic() + (timeout or self.call_timeout)
+        breaker = get_circuit_breaker(self.space_name, endpoint)
+
+        attempt = 0
+        while True:
+            # Pace outbound traffic and fail fast while the endpoint family is
+            # down; neither is retried
+            await self._wait_for_rate_token(deadline)
+            self._guard_circuit(breaker)
+            recorded = False
+            try:
+                result = await self._send_once(method, url, data, params, deadline)
+                self._record_outcome(breaker)
+                recorded = True
+                return result
+            except SignalWireAPIError as e:
+                self._record_outcome(breaker, e)
+                recorded = True
+                backoff = self._retry_delay(e, attempt, deadline)
+                if backoff is None:
+                    if e.status_code:
+                        self._log_api_error(method, url, e.status_code, e.message)
+                    raise
+
+                logger.warning(
+                    f"Retryable error encountered: {e.status_code or e.message}. "
+                    f"Retrying in {backoff:.2f}s. Attempts left: {self.max_retries - attempt}"
+                )
+                await asyncio.sleep(backoff)
+                attempt += 1
+            finally:
+                # Cancelled or failed unexpectedly: no outcome to record, but
+                # a half-open probe slot must not stay claimed forever
+                if not recorded:
+                    breaker.release()
+
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch a paginated list lazily, one page at a time, following ``links.next``.
+
+        Args:
+            endpoint (str): API endpoint path of the list
+            params (Optional[Dict[str, Any]]): URL parameters for the first page
+            prefetch (bool): Fetch the next page in a task while the caller
+                consumes the current one (at most one page ahead)
+
+        Yields:
+            Dict[str, Any]: Each page of the list response
+
+        Raises:
+            SignalWireAPIError: If fetching a page fails
+        """
+        request: Tuple[str, Optional[Dict[str, Any]]] = (endpoint, params)
+        pending: Optional[asyncio.Task] = None
+        page = await self._request("GET", endpoint, params=params)
+        try:
+            while True:
+                next_request = self._next_page(page)
+                # Guard against a server that keeps returning the same link
+                if next_request == request:
+                    next_request = None
+                if next_request is not None and prefetch:
+                    pending = asyncio.ensure_future(
+                        self._request("GET", next_request[0], params=next_request[1])
+                    )
+
+                yield page
+
+                if next_request is None:
+                    return
+                request = next_request
+                if pending is not None:
+                    page, pending = await pending, None
+                else:
+                    page = await self._request("GET", request[0], params=request[1])
+        finally:
+            # The caller stopped early; drop the page nobody will read
+            if pending is not None:
+                pending.cancel()
+
+    # Subscriber methods
+
+    async def get_subscriber_by_email(self, email):
+        """
+        Find a subscriber by email.
+
+        Args:
+            email (str): Email address to search for (case-insensitive)
+
+        Returns:
+            tuple: (subscriber_data, subscriber_id) or (None, None) if not found
+        """
+        index = get_subscriber_index(self.space_name, self.project_id)
+        try:
+            if not index.is_built:
+                # Only one task builds the index; the others wait and reuse it
+                async with _get_index_build_lock(index):
+                    if not index.is_built:
+                        await self._scan_subscribers(index)
+
+            generation = index.scan_generation
+            subscriber, subscriber_id = index.lookup(email)
+            if subscriber_id is None:
+                # The subscriber may have been created elsewhere since the last
+                # scan, so scan again before reporting a miss
+                async with _get_index_build_lock(index):
+                    if index.scan_generation == generation:
+                        await self._scan_subscribers(index)
+                subscriber, subscriber_id = index.lookup(email)
+
+        except SignalWireAPIError as e:
+            logger.warning(f"Failed to look up subscriber by email: {e.message}")
+            return None, None
+
+        if index.claim_refresh():
+            asyncio.ensure_future(self._refresh_subscriber_index(index))
+
+        return subscriber, subscriber_id
+
+    async def _scan_subscribers(self, index: SubscriberIndex) -> None:
+        """
+        Rebuild a subscriber index from the paginated subscribers list.
+
+        Args:
+            index (SubscriberIndex): The index to fill
+
+        Raises:
+            SignalWireAPIError: If fetching a page fails
+        """
+        await index.scan_async(
+            self._iter_pages(
+                "fabric/resources/subscribers",
+                {"page_size": SUBSCRIBER_INDEX_PAGE_SIZE},
+                prefetch=True,
+            )
+        )
+
+    async def _refresh_subscriber_index(self, index: SubscriberIndex) -> None:
+        """
+        Refresh a subscriber index in the background, keeping the current
+        entries if the scan fails.
+
+        Args:
+            index (SubscriberIndex): The index to refresh
+        """
+        try:
+            async with _get_index_build_lock(index):
+                await self._scan_subscribers(index)
+        except SignalWireAPIError as e:
+            logger.warning(
+                f"Failed to refresh subscriber index {index.name}: {e.message}"
+            )
+
+    async def iter_subscribers(
+        self, page_size: Optional[int] = None, prefetch: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every subscriber, fetching pages lazily as they are needed.
+        Stopping early (breaking out of the loop) fetches no further pages.
+
+        Args:
+            page_size (Optional[int]): Page size hint sent to the API
+            prefetch (bool): Fetch the next page while the current one is consumed
+
+        Yields:
+            Dict[str, Any]: Each subscriber resource
+
+        Raises:
+            SignalWireAPIError: If fetching a page fails
+        """
+        params = {"page_size": page_size} if page_size else None
+        async for page in self._iter_pages(
+            "fabric/resources/subscribers", params, prefetch
+        ):
+            for item in page.get("data", []):
+                yield item
+
+    async def iter_handler_addresses(
+        self, handler_id: str, page_size: Optional[int] = None, prefetch: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every address of a SWML handler, fetching pages lazily.
+
+        Args:
+            handler_id (str): The ID of the SWML handler
+            page_size (Optional[int]): Page size hint sent to the API
+            prefetch (bool): Fetch the next page while the current one is consumed
+
+        Yields:
+            Dict[str, Any]: Each address resource
+
+        Raises:
+            SignalWireAPIError: If fetching a page fails
+        """
+        params = {"page_size": page_size} if page_size else None
+        async for page in self._iter_pages(
+            f"fabric/resources/external_swml_handlers/{handler_id}/addresses",
+            params,
+            prefetch,
+        ):
+            for item in page.get("data", []):
+                yield item
+
+    async def update_swml_handler(self, handler_id, name, request_url):
+        """
+        Update an existing SWML handler and drop its cached addresses.
+
+        Args:
+            handler_id (str): The ID of the SWML handler to update
+            name (str): New name for the SWML handler
+            request_url (str): New URL that SignalWire will send requests to
+
+        Returns:
+            dict: Updated handler details
+
+        Raises:
+            SignalWireAPIError: If update fails or handler doesn't exist
+        """
+        response = await super().update_swml_handler(handler_id, name, request_url)
+        invalidate_handler_addresses(self.space_name, self.project_id, handler_id)
+        return response
+
+    async def create_subscriber(self, subscriber_data):
+        """
+        Create a new subscriber and add it to the email index.
+
+        Args:
+            subscriber_data (dict): Subscriber fields, including email
+
+        Returns:
+            dict: The created subscriber resource
+        """
+        response = await super().create_subscriber(subscriber_data)
+        # Only the API's view is indexed; the submitted payload has the password
+        get_subscriber_index(self.space_name, self.project_id).record(
+            response.get("id"), response.get("subscriber")
+        )
+        return response
+
+    async def update_subscriber(self, subscriber_id, update_data):
+        """
+        Update an existing subscriber and apply the change to the email index.
+
+        Args:
+            subscriber_id (str): The subscriber ID to update
+            update_data (dict): Fields to update
+
+        Returns:
+            dict: Updated subscriber data
+        """
+        response = await super().update_subscriber(subscriber_id, update_data)
+        index = get_subscriber_index(self.space_name, self.project_id)
+        if response.get("subscriber"):
+            index.record(subscriber_id, response["subscriber"])
+        else:
+            index.merge(subscriber_id, update_data)
+        return response
+
+    async def create_subscriber_token(self, reference):
+        """
+        Create a subscriber authentication token.
+
+        Args:
+            reference (str): Reference string (typically email) for the token
+
+        Returns:
+            str: The subscriber token
+        """
+        payload = {"reference": reference}
+        response = await self._request(
+            "POST", "fabric/subscribers/tokens", data=payload
+        )
+        return response.get("token")
+
+    async def fetch_subscriber_address(self, subscriber_id: str) -> Optional[str]:
+        """
+        Fetch the address for a given subscriber ID.
+
+        Args:
+            subscriber_id (str): The subscriber's ID
+
+        Returns:
+            Optional[str]: The address if found, None otherwise
+        """
+        try:
+            addresses_response = await self.get_subscriber_addresses(subscriber_id)
+            return self._parse_subscriber_address(subscriber_id, addresses_response)
+
+        except SignalWireAPIError as e:
+            logger.warning(f"Error fetching subscriber address: {e.message}")
+            return None
+
+    # Call control methods
+
+    async def notify_ai_about_new_member(self, call_id, message_text):
+        """
+        Notify an AI agent about a new member and unhold the agent.
+
+        Args:
+            call_id (str): The ID of the active call
+            message_text (str): The message text to send to the AI agent
+
+        Returns:
+            dict: The response from the unhold request
+
+        Raises:
+            SignalWireAPIError: If either the message sending or unhold operation fails
+        """
+        # The message must land before the agent resumes
+        await self.send_ai_message(call_id, "system", message_text)
+        return await self.unhold_ai_agent(call_id)
@@ -0,0 +1,279 @@
+"""
+Circuit breakers for the LiveWire demo app.
+Tracks SignalWire API health per (space, endpoint family) and short-circuits
+calls while an endpoint family is failing, so overload degrades quickly.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Breaker states
+STATE_CLOSED: str = "closed"
+STATE_OPEN: str = "open"
+STATE_HALF_OPEN: str = "half_open"
+
+# Breaker tuning (overridable through the environment)
+BREAKER_FAILURE_RATE: float = float(
+    os.environ.get("SIGNALWIRE_BREAKER_FAILURE_RATE", 0.5)
+)
+BREAKER_WINDOW_SECONDS: float = float(
+    os.environ.get("SIGNALWIRE_BREAKER_WINDOW_SECONDS", 30)
+)
+BREAKER_MIN_CALLS: int = int(os.environ.get("SIGNALWIRE_BREAKER_MIN_CALLS", 10))
+BREAKER_OPEN_SECONDS: float = float(
+    os.environ.get("SIGNALWIRE_BREAKER_OPEN_SECONDS", 15)
+)
+BREAKER_HALF_OPEN_PROBES: int = int(
+    os.environ.get("SIGNALWIRE_BREAKER_HALF_OPEN_PROBES", 1)
+)
+
+# Endpoint families tracked by separate breakers
+FAMILY_FABRIC_RESOURCES: str = "fabric_resources"
+FAMILY_CALLING: str = "calling"
+FAMILY_TOKENS: str = "tokens"
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    Classify an API endpoint path into the family its breaker tracks.
+
+    Args:
+        endpoint (str): API endpoint path, e.g. "fabric/guests/tokens"
+
+    Returns:
+        str: The endpoint family name
+    """
+    parts = endpoint.strip("/").split("/")
+    if "tokens" in parts:
+        return FAMILY_TOKENS
+    if parts[:2] == ["fabric", "resources"]:
+        return FAMILY_FABRIC_RESOURCES
+    if parts[:2] == ["calling", "calls"]:
+        return FAMILY_CALLING
+    return parts[0]
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker over a sliding time window.
+
+    Closed: calls flow and outcomes are recorded. Once at least ``min_calls``
+    outcomes in the window fail at ``failure_rate`` or more, the breaker opens.
+    Open: calls are rejected until ``open_seconds`` pass.
+    Half-open: up to ``half_open_probes`` calls are let through; a success
+    closes the breaker, a failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = BREAKER_FAILURE_RATE,
+        window_seconds: float = BREAKER_WINDOW_SECONDS,
+        min_calls: int = BREAKER_MIN_CALLS,
+        open_seconds: float = BREAKER_OPEN_SECONDS,
+        half_open_probes: int = BREAKER_HALF_OPEN_PROBES,
+    ) -> None:
+        """
+        Initialize a closed breaker.
+
+        Args:
+            name (str): Name used in logs and metrics
+            failure_rate (float): Failure ratio that opens the breaker
+            window_seconds (float): Length of the sliding outcome window
+            min_calls (int): Minimum outcomes in the window before the rate is evaluated
+            open_seconds (float): How long the breaker stays open before probing
+            half_open_probes (int): Concurrent probe calls allowed while half-open
+        """
+        self.name = name
+        self.failure_rate = failure_rate
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures_in_window = 0
+        self._lock = threading.Lock()
+        self._rejected = 0
+        self._times_opened = 0
+
+    def _prune(self, now: float) -> None:
+        """
+        Drop outcomes older than the window. Must be called with the lock held.
+
+        Args:
+            now (float): Current monotonic time
+        """
+        cutoff = now - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            _, ok = self._outcomes.popleft()
+            if not ok:
+                self._failures_in_window -= 1
+
+    def _open(self, now: float) -> None:
+        """
+        Move to the open state. Must be called with the lock held.
+
+        Args:
+            now (float): Current monotonic time
+        """
+        self._state = STATE_OPEN
+        self._opened_at = now
+        self._probes_in_flight = 0
+        self._times_opened += 1
+        logger.warning(f"Circuit breaker {self.name} opened")
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may proceed, claiming a probe slot when half-open.
+
+        Returns:
+            bool: True if the call may proceed, False if it should fail fast
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._state == STATE_OPEN:
+                if now - self._opened_at < self.open_seconds:
+                    self._rejected += 1
+                    return False
+                self._state = STATE_HALF_OPEN
+                self._probes_in_flight = 0
+                logger.info(f"Circuit breaker {self.name} half-open, probing")
+
+            if self._state == STATE_HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_probes:
+                    self._rejected += 1
+                    return False
+                self._probes_in_flight += 1
+            return True
+
+    def release(self) -> None:
+        """
+        Give back a call allowed by allow_request without recording an outcome,
+        e.g. because it was cancelled, freeing its probe slot when half-open.
+        """
+        with self._lock:
+            if self._state == STATE_HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
+
+    def retry_after(self) -> float:
+        """
+        Get the seconds left before an open breaker starts probing.
+
+        Returns:
+            float: Seconds until the next probe is allowed (0 if not open)
+        """
+        with self._lock:
+            if self._state != STATE_OPEN:
+                return 0.0
+            return max(self.open_seconds - (time.monotonic() - self._opened_at), 0.0)
+
+    def record_success(self) -> None:
+        """
+        Record a successful call.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._state == STATE_HALF_OPEN:
+                self._state = STATE_CLOSED
+                self._outcomes.clear()
+                self._failures_in_window = 0
+                logger.info(f"Circuit breaker {self.name} closed")
+            self._outcomes.append((now, True))
+            self._prune(now)
+
+    def record_failure(self) -> None:
+        """
+        Record a failed call, opening the breaker if the failure rate is exceeded.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._state == STATE_HALF_OPEN:
+                self._open(now)
+                return
+            if self._state == STATE_OPEN:
+                return
+
+            self._outcomes.append((now, False))
+            self._failures_in_window += 1
+            self._prune(now)
+
+            total = len(self._outcomes)
+            if (
+                total >= self.min_calls
+                and self._failures_in_window / total >= self.failure_rate
+            ):
+                self._open(now)
+
+    @property
+    def state(self) -> str:
+        """
+        Get the current breaker state.
+
+        Returns:
+            str: STATE_CLOSED, STATE_OPEN, or STATE_HALF_OPEN
+        """
+        with self._lock:
+            return self._state
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the breaker state and counters.
+
+        Returns:
+            Dict[str, Any]: Breaker metrics
+        """
+        with self._lock:
+            self._prune(time.monotonic())
+            return {
+                "state": self._state,
+                "calls_in_window": len(self._outcomes),
+                "failures_in_window": self._failures_in_window,
+                "rejected": self._rejected,
+                "times_opened": self._times_opened,
+            }
+
+
+_breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(space_name: str, endpoint: str) -> CircuitBreaker:
+    """
+    Get the shared breaker for a space and the family of an endpoint.
+
+    Args:
+        space_name (str): SignalWire space name
+        endpoint (str): API endpoint path
+
+    Returns:
+        CircuitBreaker: The breaker guarding that endpoint family
+    """
+    key = (space_name, endpoint_family(endpoint))
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(f"{key[0]}:{key[1]}")
+            _breakers[key] = breaker
+        return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Report state and counters for every breaker.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Breaker metrics keyed by "space:family"
+    """
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.stats() for breaker in breakers}
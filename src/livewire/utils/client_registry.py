@@ -0,0 +1,167 @@
+"""
+SignalWire client registry for the LiveWire demo app.
+Keeps one warm SignalWireClient per set of credentials instead of rebuilding
+a client on every request.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from livewire.utils.signalwire_client import SignalWireClient
+
+logger = logging.getLogger(__name__)
+
+# Registry limits (overridable through the environment)
+CLIENT_REGISTRY_MAX_SIZE: int = int(os.environ.get("SIGNALWIRE_CLIENT_CACHE_SIZE", 128))
+CLIENT_REGISTRY_IDLE_TTL: float = float(
+    os.environ.get("SIGNALWIRE_CLIENT_IDLE_TTL", 1800)
+)
+
+# key -> (client, last_used), ordered from least to most recently used
+_clients: "OrderedDict[str, Tuple[SignalWireClient, float]]" = OrderedDict()
+_clients_lock = threading.Lock()
+_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+
+def credentials_key(project_id: str, space_name: str, auth_token: str) -> str:
+    """
+    Hash a set of credentials into a registry key so raw tokens are never
+    used as dictionary keys.
+
+    Args:
+        project_id (str): SignalWire project ID
+        space_name (str): SignalWire space name
+        auth_token (str): SignalWire auth token
+
+    Returns:
+        str: Hex digest identifying the credentials
+    """
+    material = "\x00".join((project_id, space_name, auth_token)).encode()
+    return hashlib.sha256(material).hexdigest()
+
+
+def _evict_expired(now: float) -> None:
+    """
+    Drop clients idle for longer than CLIENT_REGISTRY_IDLE_TTL.
+    Must be called with _clients_lock held.
+
+    Args:
+        now (float): Current monotonic time
+    """
+    # Entries are in LRU order, so stop at the first one still fresh
+    while _clients:
+        key, (_, last_used) = next(iter(_clients.items()))
+        if now - last_used <= CLIENT_REGISTRY_IDLE_TTL:
+            break
+        del _clients[key]
+        _stats["evictions"] += 1
+
+
+def get_client(project_id: str, auth_token: str, space_name: str) -> SignalWireClient:
+    """
+    Get the live SignalWireClient for a set of credentials, creating it if needed.
+
+    Args:
+        project_id (str): SignalWire project ID
+        auth_token (str): SignalWire auth token
+        space_name (str): SignalWire space name
+
+    Returns:
+        SignalWireClient: The shared client instance
+    """
+    key = credentials_key(project_id, space_name, auth_token)
+    now = time.monotonic()
+
+    with _clients_lock:
+        _evict_expired(now)
+
+        entry = _clients.get(key)
+        if entry is not None:
+            client = entry[0]
+            _clients[key] = (client, now)
+            _clients.move_to_end(key)
+            _stats["hits"] += 1
+            return client
+
+        client = SignalWireClient(project_id, auth_token, space_name)
+        _clients[key] = (client, now)
+        _stats["misses"] += 1
+
+        # Enforce the size bound by evicting the least recently used client
+        while len(_clients) > CLIENT_REGISTRY_MAX_SIZE:
+            _clients.popitem(last=False)
+            _stats["evictions"] += 1
+
+    logger.debug(f"Registered SignalWireClient for {project_id} in {space_name}")
+    return client
+
+
+def find_client(
+    project_id: str, auth_token: str, space_name: str
+) -> Optional[SignalWireClient]:
+    """
+    Get the registered client for a set of credentials without creating one
+    or counting as a use, e.g. for background work that should stop once the
+    client is invalidated or evicted.
+
+    Args:
+        project_id (str): SignalWire project ID
+        auth_token (str): SignalWire auth token
+        space_name (str): SignalWire space name
+
+    Returns:
+        Optional[SignalWireClient]: The live client, or None if none is registered
+    """
+    key = credentials_key(project_id, space_name, auth_token)
+    with _clients_lock:
+        entry = _clients.get(key)
+        if entry is None or time.monotonic() - entry[1] > CLIENT_REGISTRY_IDLE_TTL:
+            return None
+        return entry[0]
+
+
+def invalidate_client(project_id: str, auth_token: str, space_name: str) -> bool:
+    """
+    Remove the client for a set of credentials from the registry.
+
+    Args:
+        project_id (str): SignalWire project ID
+        auth_token (str): SignalWire auth token
+        space_name (str): SignalWire space name
+
+    Returns:
+        bool: True if a client was removed, False otherwise
+    """
+    key = credentials_key(project_id, space_name, auth_token)
+    with _clients_lock:
+        removed = _clients.pop(key, None) is not None
+        if removed:
+            _stats["invalidations"] += 1
+    if removed:
+        logger.debug(f"Invalidated SignalWireClient for {project_id} in {space_name}")
+    return removed
+
+
+def clear_clients() -> None:
+    """
+    Remove every client from the registry.
+    """
+    with _clients_lock:
+        _stats["invalidations"] += len(_clients)
+        _clients.clear()
+
+
+def get_registry_stats() -> Dict[str, Any]:
+    """
+    Report registry size and hit/miss/eviction counters.
+
+    Returns:
+        Dict[str, Any]: Registry counters
+    """
+    with _clients_lock:
+        return {"size": len(_clients), **_stats}
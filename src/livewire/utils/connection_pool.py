@@ -0,0 +1,215 @@
+"""
+HTTP connection pooling for the LiveWire demo app.
+Provides process-wide keep-alive sessions shared by every SignalWireClient.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+logger = logging.getLogger(__name__)
+
+# Pool tuning constants (overridable through the environment)
+POOL_CONNECTIONS: int = int(os.environ.get("SIGNALWIRE_POOL_CONNECTIONS", 4))
+POOL_MAXSIZE: int = int(os.environ.get("SIGNALWIRE_POOL_MAXSIZE", 20))
+POOL_BLOCK: bool = os.environ.get("SIGNALWIRE_POOL_BLOCK", "False").lower() == "true"
+POOL_IDLE_TIMEOUT: float = float(os.environ.get("SIGNALWIRE_POOL_IDLE_TIMEOUT", 300))
+TCP_KEEPALIVE: bool = (
+    os.environ.get("SIGNALWIRE_TCP_KEEPALIVE", "True").lower() == "true"
+)
+
+PoolKey = Tuple[str, str]
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTP adapter that enables TCP keep-alive on pooled connections so idle
+    sockets to SignalWire survive between requests.
+    """
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the urllib3 pool manager with keep-alive socket options.
+        """
+        if TCP_KEEPALIVE:
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+class _PoolEntry:
+    """
+    A pooled session for one (space, project) pair plus its usage counters.
+    """
+
+    def __init__(self, session: requests.Session, adapter: KeepAliveAdapter) -> None:
+        self.session = session
+        self.adapter = adapter
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.checkouts = 0
+
+    def connection_counts(self) -> Dict[str, int]:
+        """
+        Sum the urllib3 connection and request counters across all host pools.
+
+        Returns:
+            Dict[str, int]: Opened connections and requests sent on them
+        """
+        opened = 0
+        sent = 0
+        pools = self.adapter.poolmanager.pools
+        for pool_key in list(pools.keys()):
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+            opened += pool.num_connections
+            sent += pool.num_requests
+        return {"connections_opened": opened, "requests_sent": sent}
+
+
+_pools: Dict[PoolKey, _PoolEntry] = {}
+_pools_lock = threading.Lock()
+_evicted_count: int = 0
+
+
+def _create_entry() -> _PoolEntry:
+    """
+    Build a new keep-alive session with the configured pool sizes.
+
+    Returns:
+        _PoolEntry: The new pool entry
+    """
+    adapter = KeepAliveAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=POOL_BLOCK,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return _PoolEntry(session, adapter)
+
+
+def _evict_idle(now: float) -> None:
+    """
+    Close and drop sessions that have been idle longer than POOL_IDLE_TIMEOUT.
+    Must be called with _pools_lock held.
+
+    Args:
+        now (float): Current monotonic time
+    """
+    global _evicted_count
+
+    if POOL_IDLE_TIMEOUT <= 0:
+        return
+
+    for key in [k for k, e in _pools.items() if now - e.last_used > POOL_IDLE_TIMEOUT]:
+        entry = _pools.pop(key)
+        entry.session.close()
+        _evicted_count += 1
+        logger.debug(f"Evicted idle connection pool for space={key[0]}")
+
+
+def get_session(space_name: str, project_id: str) -> requests.Session:
+    """
+    Get the shared keep-alive session for a SignalWire space and project.
+    Sessions are created on first use and evicted after sitting idle.
+
+    Args:
+        space_name (str): SignalWire space name
+        project_id (str): SignalWire project ID
+
+    Returns:
+        requests.Session: The pooled session
+    """
+    key = (space_name, project_id)
+    now = time.monotonic()
+
+    with _pools_lock:
+        _evict_idle(now)
+        entry = _pools.get(key)
+        if entry is None:
+            entry = _create_entry()
+            _pools[key] = entry
+            logger.debug(f"Created connection pool for space={space_name}")
+        entry.last_used = now
+        entry.checkouts += 1
+        return entry.session
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Report connection reuse counters for every live pool.
+
+    Returns:
+        Dict[str, Any]: Per-pool and total counters
+    """
+    now = time.monotonic()
+    pools = {}
+    total_opened = 0
+    total_sent = 0
+
+    with _pools_lock:
+        entries = list(_pools.items())
+        evicted = _evicted_count
+
+    for (space_name, project_id), entry in entries:
+        counts = entry.connection_counts()
+        total_opened += counts["connections_opened"]
+        total_sent += counts["requests_sent"]
+        pools[f"{space_name}:{project_id}"] = {
+            **counts,
+            "connections_reused": max(
+                counts["requests_sent"] - counts["connections_opened"], 0
+            ),
+            "checkouts": entry.checkouts,
+            "idle_seconds": round(now - entry.last_used, 3),
+        }
+
+    return {
+        "pools": pools,
+        "connections_opened": total_opened,
+        "requests_sent": total_sent,
+        "connections_reused": max(total_sent - total_opened, 0),
+        "pools_evicted": evicted,
+    }
+
+
+def close_pool(space_name: str, project_id: str) -> bool:
+    """
+    Close the pooled session for a space and project, if any.
+
+    Args:
+        space_name (str): SignalWire space name
+        project_id (str): SignalWire project ID
+
+    Returns:
+        bool: True if a pool was closed, False otherwise
+    """
+    with _pools_lock:
+        entry: Optional[_PoolEntry] = _pools.pop((space_name, project_id), None)
+    if entry is None:
+        return False
+    entry.session.close()
+    return True
+
+
+def close_all_pools() -> None:
+    """
+    Close every pooled session (used at shutdown and in load tests).
+    """
+    with _pools_lock:
+        entries = list(_pools.values())
+        _pools.clear()
+    for entry in entries:
+        entry.session.close()
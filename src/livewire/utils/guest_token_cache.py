@@ -0,0 +1,220 @@
+"""
+Guest token cache for the LiveWire demo app.
+Reuses call widget guest tokens until shortly before they expire and keeps a
+small pool of pre-minted tokens per address, refilled in the background, so
+/api/widget_config can be served without outbound calls.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from livewire.utils.client_registry import find_client
+from livewire.utils.signalwire_client import (GUEST_TOKEN_EXPIRES_SECONDS,
+                                              SignalWireAPIError,
+                                              SignalWireClient)
+
+logger = logging.getLogger(__name__)
+
+# Cache tuning (overridable through the environment)
+GUEST_TOKEN_SAFETY_MARGIN: float = float(
+    os.environ.get("GUEST_TOKEN_SAFETY_MARGIN", 300)
+)
+GUEST_TOKEN_POOL_SIZE: int = int(os.environ.get("GUEST_TOKEN_POOL_SIZE", 2))
+GUEST_TOKEN_REFILL_INTERVAL: float = float(
+    os.environ.get("GUEST_TOKEN_REFILL_INTERVAL", 30)
+)
+GUEST_TOKEN_IDLE_SECONDS: float = float(
+    os.environ.get("GUEST_TOKEN_IDLE_SECONDS", 1800)
+)
+
+# (token, monotonic time after which the token must no longer be served)
+TokenEntry = Tuple[str, float]
+
+
+class _AddressPool:
+    """
+    Pre-minted tokens for one address, oldest first, plus the client last
+    used for it, whose credentials identify the registry client to refill with.
+    """
+
+    def __init__(self, client: SignalWireClient) -> None:
+        self.client = client
+        self.tokens: Deque[TokenEntry] = deque()
+        self.last_requested = time.monotonic()
+
+
+_pools: Dict[str, _AddressPool] = {}
+_pools_lock = threading.Lock()
+_refiller: Optional[threading.Thread] = None
+_stats: Dict[str, int] = {"hits": 0, "misses": 0, "minted": 0, "refill_errors": 0}
+
+
+def _prune(pool: _AddressPool, now: float) -> None:
+    """
+    Drop tokens that are inside the safety margin. Must be called with _pools_lock held.
+
+    Args:
+        pool (_AddressPool): The address pool to prune
+        now (float): Current monotonic time
+    """
+    while pool.tokens and pool.tokens[0][1] <= now:
+        pool.tokens.popleft()
+
+
+def _mint(client: SignalWireClient, address_id: str) -> TokenEntry:
+    """
+    Mint a new guest token for an address.
+
+    Args:
+        client (SignalWireClient): Client used to call the API
+        address_id (str): Address the token is allowed to connect to
+
+    Returns:
+        TokenEntry: The token and the time it stops being served
+
+    Raises:
+        SignalWireAPIError: If token creation fails or returns no token
+    """
+    minted_at = time.monotonic()
+    token = client.create_guest_token(address_id).get("token")
+    if not token:
+        raise SignalWireAPIError("Failed to get guest token from response")
+
+    with _pools_lock:
+        _stats["minted"] += 1
+    usable_until = minted_at + GUEST_TOKEN_EXPIRES_SECONDS - GUEST_TOKEN_SAFETY_MARGIN
+    return token, usable_until
+
+
+def _ensure_refiller() -> None:
+    """
+    Start the background refill thread if it is not running.
+    """
+    global _refiller
+
+    with _pools_lock:
+        if _refiller is not None and _refiller.is_alive():
+            return
+        _refiller = threading.Thread(
+            target=_refill_loop, name="guest-token-refiller", daemon=True
+        )
+        _refiller.start()
+
+
+def _refill_loop() -> None:
+    """
+    Periodically top up every active address pool to GUEST_TOKEN_POOL_SIZE tokens.
+    """
+    while True:
+        time.sleep(GUEST_TOKEN_REFILL_INTERVAL)
+        refill_pools()
+
+
+def refill_pools() -> None:
+    """
+    Top up every recently used address pool and forget idle ones.
+    """
+    now = time.monotonic()
+    with _pools_lock:
+        for address_id in [
+            a
+            for a, p in _pools.items()
+            if now - p.last_requested > GUEST_TOKEN_IDLE_SECONDS
+        ]:
+            del _pools[address_id]
+
+        wanted = []
+        for address_id, pool in _pools.items():
+            _prune(pool, now)
+            missing = GUEST_TOKEN_POOL_SIZE - len(pool.tokens)
+            if missing > 0:
+                wanted.append((address_id, pool.client, missing))
+
+    # Mint outside the lock so requests keep being served from memory
+    for address_id, client, missing in wanted:
+        # Refill with the registry's current client; if it was invalidated or
+        # evicted, wait for the next request to supply a fresh one
+        client = find_client(client.project_id, client.auth_token, client.space_name)
+        if client is None:
+            logger.debug(f"Not refilling guest tokens for {address_id}: no live client")
+            continue
+        for _ in range(missing):
+            try:
+                entry = _mint(client, address_id)
+            except SignalWireAPIError as e:
+                logger.warning(f"Failed to pre-mint guest token for {address_id}: {e}")
+                with _pools_lock:
+                    _stats["refill_errors"] += 1
+                break
+            with _pools_lock:
+                pool = _pools.get(address_id)
+                if pool is not None:
+                    pool.tokens.append(entry)
+
+
+def get_guest_token(client: SignalWireClient, address_id: str) -> str:
+    """
+    Get a guest token for an address, minting one only when no cached token
+    is usable. The oldest usable token is served so fresher ones last longer.
+
+    Args:
+        client (SignalWireClient): Client used if a token has to be minted
+        address_id (str): Address the token is allowed to connect to
+
+    Returns:
+        str: A guest token valid for at least GUEST_TOKEN_SAFETY_MARGIN seconds
+
+    Raises:
+        SignalWireAPIError: If a token has to be minted and creation fails
+    """
+    now = time.monotonic()
+    with _pools_lock:
+        pool = _pools.get(address_id)
+        if pool is None:
+            pool = _AddressPool(client)
+            _pools[address_id] = pool
+        pool.client = client
+        pool.last_requested = now
+        _prune(pool, now)
+        if pool.tokens:
+            _stats["hits"] += 1
+            return pool.tokens[0][0]
+        _stats["misses"] += 1
+
+    _ensure_refiller()
+
+    entry = _mint(client, address_id)
+    with _pools_lock:
+        pool.tokens.append(entry)
+    logger.debug(f"Minted guest token for address {address_id}")
+    return entry[0]
+
+
+def invalidate_guest_tokens(address_id: str) -> None:
+    """
+    Drop all cached tokens for an address.
+
+    Args:
+        address_id (str): The address whose tokens should be dropped
+    """
+    with _pools_lock:
+        _pools.pop(address_id, None)
+
+
+def get_guest_token_stats() -> Dict[str, Any]:
+    """
+    Report cache counters and pooled token counts.
+
+    Returns:
+        Dict[str, Any]: Guest token cache metrics
+    """
+    with _pools_lock:
+        return {
+            **_stats,
+            "addresses": len(_pools),
+            "pooled_tokens": sum(len(p.tokens) for p in _pools.values()),
+        }
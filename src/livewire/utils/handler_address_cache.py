@@ -0,0 +1,202 @@
+"""
+SWML handler address cache for the LiveWire demo app.
+Caches the parsed audio destination and address ID of each SWML handler,
+refreshing stale entries in the background while still serving them.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from livewire.utils.signalwire_client import SignalWireClient
+
+logger = logging.getLogger(__name__)
+
+# Cache tuning (overridable through the environment)
+HANDLER_ADDRESS_TTL: float = float(os.environ.get("HANDLER_ADDRESS_TTL", 300))
+HANDLER_ADDRESS_STALE_TTL: float = float(
+    os.environ.get("HANDLER_ADDRESS_STALE_TTL", 3600)
+)
+
+# (space_name, project_id, handler_id)
+CacheKey = Tuple[str, str, str]
+
+# key -> (info, fetched_at)
+_entries: Dict[CacheKey, Tuple[Dict[str, Optional[str]], float]] = {}
+_refreshing: Set[CacheKey] = set()
+# Bumped on invalidation so in-flight refreshes cannot restore dropped entries
+_generations: Dict[CacheKey, int] = {}
+_lock = threading.Lock()
+_stats: Dict[str, int] = {
+    "hits": 0,
+    "stale_hits": 0,
+    "misses": 0,
+    "refresh_errors": 0,
+    "invalidations": 0,
+}
+
+
+def _cache_key(client: "SignalWireClient", handler_id: str) -> CacheKey:
+    """
+    Build the cache key for a client's handler.
+
+    Args:
+        client (SignalWireClient): Client whose space and project scope the entry
+        handler_id (str): The SWML handler ID
+
+    Returns:
+        CacheKey: The cache key
+    """
+    return client.space_name, client.project_id, handler_id
+
+
+def _fetch(client: "SignalWireClient", handler_id: str) -> Dict[str, Optional[str]]:
+    """
+    Fetch and parse a handler's addresses from the API.
+
+    Args:
+        client (SignalWireClient): Client used to call the API
+        handler_id (str): The SWML handler ID
+
+    Returns:
+        Dict[str, Optional[str]]: The audio destination and first address ID
+
+    Raises:
+        SignalWireAPIError: If retrieval fails
+    """
+    addresses_response = client.get_handler_addresses(handler_id)
+    data = addresses_response.get("data", [])
+    return {
+        "destination": client.extract_audio_destination(addresses_response),
+        "address_id": data[0].get("id") if data else None,
+    }
+
+
+def _store(key: CacheKey, info: Dict[str, Optional[str]], generation: int) -> None:
+    """
+    Cache a complete result. Incomplete results (e.g. addresses still being
+    provisioned for a new handler) are not cached.
+
+    Args:
+        key (CacheKey): The cache key
+        info (Dict[str, Optional[str]]): Parsed handler address info
+        generation (int): Key generation observed before the fetch started
+    """
+    if info["destination"] and info["address_id"]:
+        with _lock:
+            if _generations.get(key, 0) == generation:
+                _entries[key] = (info, time.monotonic())
+
+
+def _refresh_in_background(
+    client: "SignalWireClient", handler_id: str, key: CacheKey, generation: int
+) -> None:
+    """
+    Re-fetch a stale entry on a background thread.
+
+    Args:
+        client (SignalWireClient): Client used to call the API
+        handler_id (str): The SWML handler ID
+        key (CacheKey): The cache key
+        generation (int): Key generation observed when the entry went stale
+    """
+
+    def refresh() -> None:
+        try:
+            _store(key, _fetch(client, handler_id), generation)
+        except Exception as e:
+            logger.warning(f"Failed to refresh addresses for handler {handler_id}: {e}")
+            with _lock:
+                _stats["refresh_errors"] += 1
+        finally:
+            with _lock:
+                _refreshing.discard(key)
+
+    threading.Thread(
+        target=refresh, name="handler-address-refresh", daemon=True
+    ).start()
+
+
+def get_handler_address_info(
+    client: "SignalWireClient", handler_id: str
+) -> Dict[str, Optional[str]]:
+    """
+    Get a handler's audio destination and address ID, reading through the cache.
+    Entries younger than HANDLER_ADDRESS_TTL are served directly; older ones
+    (up to HANDLER_ADDRESS_STALE_TTL) are served while a background refresh runs.
+
+    Args:
+        client (SignalWireClient): Client used on a cache miss
+        handler_id (str): The SWML handler ID
+
+    Returns:
+        Dict[str, Optional[str]]: {"destination": ..., "address_id": ...}
+
+    Raises:
+        SignalWireAPIError: If the addresses have to be fetched and retrieval fails
+    """
+    key = _cache_key(client, handler_id)
+    now = time.monotonic()
+
+    with _lock:
+        generation = _generations.get(key, 0)
+        entry = _entries.get(key)
+        age = now - entry[1] if entry is not None else None
+
+        if age is not None and age < HANDLER_ADDRESS_TTL:
+            _stats["hits"] += 1
+            return entry[0]
+
+        if age is not None and age < HANDLER_ADDRESS_STALE_TTL:
+            _stats["stale_hits"] += 1
+            stale_info = entry[0]
+            needs_refresh = key not in _refreshing
+            _refreshing.add(key)
+        else:
+            _stats["misses"] += 1
+            stale_info = None
+
+    if stale_info is None:
+        info = _fetch(client, handler_id)
+        _store(key, info, generation)
+        return info
+
+    if needs_refresh:
+        _refresh_in_background(client, handler_id, key, generation)
+    return stale_info
+
+
+def invalidate_handler_addresses(
+    space_name: str, project_id: str, handler_id: Optional[str] = None
+) -> None:
+    """
+    Drop cached addresses for one handler, or for every handler in a project.
+
+    Args:
+        space_name (str): SignalWire space name
+        project_id (str): SignalWire project ID
+        handler_id (Optional[str]): Handler to drop, or None for all handlers in the project
+    """
+    with _lock:
+        if handler_id is not None:
+            keys = [(space_name, project_id, handler_id)]
+        else:
+            keys = [k for k in _entries if k[:2] == (space_name, project_id)]
+        for key in keys:
+            _generations[key] = _generations.get(key, 0) + 1
+            if _entries.pop(key, None) is not None:
+                _stats["invalidations"] += 1
+
+
+def get_handler_address_stats() -> Dict[str, Any]:
+    """
+    Report cache size and hit/miss counters.
+
+    Returns:
+        Dict[str, Any]: Handler address cache metrics
+    """
+    with _lock:
+        return {"size": len(_entries), **_stats}
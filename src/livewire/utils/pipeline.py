@@ -0,0 +1,200 @@
+"""
+Pipelined execution of SignalWire API calls for the LiveWire demo app.
+Runs a small set of dependent steps with independent steps overlapped on a
+shared worker pool, and records how long each step took.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from livewire.utils.connection_pool import POOL_MAXSIZE
+
+logger = logging.getLogger(__name__)
+
+# Worker threads shared by every pipeline in the process. Each running step
+# holds one pooled connection, so by default there are as many workers as
+# keep-alive connections per space
+PIPELINE_WORKERS: int = int(os.environ.get("SIGNALWIRE_PIPELINE_WORKERS", POOL_MAXSIZE))
+
+
+class PipelineStep:
+    """
+    One call in a pipeline.
+
+    The step runs once every step named in ``after`` has succeeded, and its
+    callable receives their results positionally, in ``after`` order.
+    """
+
+    def __init__(
+        self, name: str, fn: Callable[..., Any], after: Sequence[str] = ()
+    ) -> None:
+        """
+        Initialize a step.
+
+        Args:
+            name (str): Unique step name, used for ordering and timings
+            fn (Callable[..., Any]): The call to make
+            after (Sequence[str]): Names of the steps that must finish first
+        """
+        self.name = name
+        self.fn = fn
+        self.after = tuple(after)
+
+
+class PipelineResult:
+    """
+    Results and per-step wall-clock timings of a finished pipeline.
+    """
+
+    def __init__(
+        self, results: Dict[str, Any], timings: Dict[str, float], total: float
+    ) -> None:
+        """
+        Initialize a result.
+
+        Args:
+            results (Dict[str, Any]): Return value of each step, by name
+            timings (Dict[str, float]): Seconds each step took, by name
+            total (float): Seconds the whole pipeline took
+        """
+        self.results = results
+        self.timings = timings
+        self.total = total
+
+    def __getitem__(self, name: str) -> Any:
+        return self.results[name]
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared pipeline worker pool, creating it on first use.
+
+    Returns:
+        ThreadPoolExecutor: The worker pool
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=PIPELINE_WORKERS, thread_name_prefix="signalwire-pipeline"
+            )
+        return _executor
+
+
+def run_pipeline(steps: List[PipelineStep]) -> PipelineResult:
+    """
+    Run steps as soon as their dependencies finish, overlapping independent ones.
+
+    A step is only submitted once its dependencies are done, so no worker ever
+    blocks waiting on another step. If a step fails, steps that depend on it
+    are skipped, the rest run to completion, and the first failure in
+    declaration order is raised.
+
+    Args:
+        steps (List[PipelineStep]): The steps; dependencies must be declared earlier
+
+    Returns:
+        PipelineResult: Step results and timings
+
+    Raises:
+        ValueError: If a step names an unknown or later dependency
+        Exception: The first error raised by a step
+    """
+    names = set()
+    for step in steps:
+        unknown = [dep for dep in step.after if dep not in names]
+        if unknown:
+            raise ValueError(
+                f"Pipeline step {step.name} depends on unknown steps {unknown}"
+            )
+        names.add(step.name)
+
+    executor = _get_executor()
+    lock = threading.Lock()
+    finished = threading.Event()
+    waiting_on = {step.name: set(step.after) for step in steps}
+    dependents: Dict[str, List[PipelineStep]] = {step.name: [] for step in steps}
+    for step in steps:
+        for dep in step.after:
+            dependents[dep].append(step)
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, BaseException] = {}
+    timings: Dict[str, float] = {}
+    outstanding = [len(steps)]
+    started = time.monotonic()
+
+    def call(step: PipelineStep) -> Any:
+        step_started = time.monotonic()
+        try:
+            return step.fn(*[results[dep] for dep in step.after])
+        finally:
+            timings[step.name] = time.monotonic() - step_started
+
+    def skip(step: PipelineStep) -> None:
+        # Must be called with the lock held
+        outstanding[0] -= 1
+        for dependent in dependents[step.name]:
+            if dependent.name in waiting_on:
+                del waiting_on[dependent.name]
+                skip(dependent)
+
+    def done(step: PipelineStep, future: Future) -> None:
+        ready = []
+        with lock:
+            outstanding[0] -= 1
+            error = future.exception()
+            if error is not None:
+                errors[step.name] = error
+                for dependent in dependents[step.name]:
+                    if waiting_on.pop(dependent.name, None) is not None:
+                        skip(dependent)
+            else:
+                results[step.name] = future.result()
+                for dependent in dependents[step.name]:
+                    pending = waiting_on.get(dependent.name)
+                    if pending is None:
+                        continue
+                    pending.discard(step.name)
+                    if not pending:
+                        del waiting_on[dependent.name]
+                        ready.append(dependent)
+            if outstanding[0] == 0:
+                finished.set()
+        for dependent in ready:
+            launch(dependent)
+
+    def launch(step: PipelineStep) -> None:
+        future = executor.submit(call, step)
+        future.add_done_callback(lambda f, s=step: done(s, f))
+
+    with lock:
+        roots = [step for step in steps if not waiting_on[step.name]]
+        for step in roots:
+            del waiting_on[step.name]
+    for step in roots:
+        launch(step)
+
+    if steps:
+        finished.wait()
+    total = time.monotonic() - started
+
+    logger.debug(
+        "Pipeline timings: "
+        + ", ".join(f"{name}={seconds:.3f}s" for name, seconds in timings.items())
+        + f", total={total:.3f}s"
+    )
+
+    for step in steps:
+        if step.name in errors:
+            raise errors[step.name]
+    return PipelineResult(results, timings, total)
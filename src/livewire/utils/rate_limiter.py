@@ -0,0 +1,145 @@
+"""
+Client-side rate limiting for the LiveWire demo app.
+Provides a token bucket per SignalWire project, shared by every client in
+the process, so bursts are paced before they turn into 429 responses.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bucket tuning (overridable through the environment; a rate of 0 disables limiting)
+RATE_LIMIT_PER_SECOND: float = float(os.environ.get("SIGNALWIRE_RATE_LIMIT", 10))
+RATE_LIMIT_BURST: int = int(os.environ.get("SIGNALWIRE_RATE_BURST", 20))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``; each
+    request takes one token.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate (float): Tokens added per second
+            burst (int): Maximum number of tokens the bucket holds
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._throttled = 0
+
+    def _refill(self, now: float) -> None:
+        """
+        Add the tokens earned since the last update. Must be called with the lock held.
+
+        Args:
+            now (float): Current monotonic time
+        """
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available, without waiting.
+
+        Returns:
+            float: 0.0 if a token was taken, otherwise seconds until one is available
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._acquired += 1
+                return 0.0
+            self._throttled += 1
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Take a token, waiting for one to become available if needed.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            bool: True if a token was taken, False if the timeout would be exceeded
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the bucket's current occupancy and counters.
+
+        Returns:
+            Dict[str, Any]: Bucket metrics
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "tokens": round(self._tokens, 3),
+                "occupancy": round(self._tokens / self.burst, 3) if self.burst else 0,
+                "acquired": self._acquired,
+                "throttled": self._throttled,
+            }
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(project_id: str) -> Optional[TokenBucket]:
+    """
+    Get the shared token bucket for a SignalWire project.
+
+    Args:
+        project_id (str): SignalWire project ID
+
+    Returns:
+        Optional[TokenBucket]: The project's bucket, or None if rate limiting is disabled
+    """
+    if RATE_LIMIT_PER_SECOND <= 0:
+        return None
+
+    with _buckets_lock:
+        bucket = _buckets.get(project_id)
+        if bucket is None:
+            bucket = TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+            _buckets[project_id] = bucket
+            logger.debug(f"Created rate limiter for project {project_id}")
+        return bucket
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Report occupancy and counters for every project bucket.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Bucket metrics keyed by project ID
+    """
+    with _buckets_lock:
+        buckets = list(_buckets.items())
+    return {project_id: bucket.stats() for project_id, bucket in buckets}
@@ -0,0 +1,172 @@
+"""
+Retry scheduling helpers for the LiveWire demo app.
+Provides full-jitter backoff, Retry-After parsing, and a timer-driven
+scheduler that runs retries without parking the calling thread in sleep.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Scheduler tuning (overridable through the environment)
+RETRY_WORKERS: int = int(os.environ.get("SIGNALWIRE_RETRY_WORKERS", 8))
+
+
+def full_jitter_delay(base: float, attempt: int, cap: float) -> float:
+    """
+    Calculate a full-jitter exponential backoff delay.
+
+    Args:
+        base (float): Base delay in seconds
+        attempt (int): Zero-based retry attempt number
+        cap (float): Maximum delay in seconds
+
+    Returns:
+        float: A delay drawn uniformly from [0, min(cap, base * 2**attempt)]
+    """
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value (Optional[str]): Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if missing or unparseable
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+class RetryScheduler:
+    """
+    Timer-driven scheduler for retry attempts.
+
+    A single timer thread keeps a heap of due callbacks and hands each one to a
+    small worker pool when its time comes, so waiting out a backoff never
+    occupies a thread.
+    """
+
+    def __init__(self, max_workers: int = RETRY_WORKERS) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers (int): Number of threads that run due attempts
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="signalwire-retry"
+        )
+        self._heap: List[Tuple[float, int, Callable[..., Any], tuple]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="signalwire-retry-timer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        """
+        Run a callback on the worker pool as soon as possible.
+
+        Args:
+            fn (Callable[..., Any]): Callback to run
+            *args: Positional arguments for the callback
+        """
+        self._executor.submit(self._run_callback, fn, args)
+
+    def call_later(self, delay: float, fn: Callable[..., Any], *args: Any) -> None:
+        """
+        Run a callback on the worker pool after a delay.
+
+        Args:
+            delay (float): Seconds to wait before running the callback
+            fn (Callable[..., Any]): Callback to run
+            *args: Positional arguments for the callback
+        """
+        due = time.monotonic() + max(delay, 0.0)
+        with self._condition:
+            heapq.heappush(self._heap, (due, next(self._counter), fn, args))
+            self._condition.notify()
+
+    def pending(self) -> int:
+        """
+        Get the number of callbacks waiting for their due time.
+
+        Returns:
+            int: Number of scheduled callbacks
+        """
+        with self._condition:
+            return len(self._heap)
+
+    def _run(self) -> None:
+        """
+        Timer loop: wait for the earliest due callback and dispatch it.
+        """
+        while True:
+            with self._condition:
+                while not self._heap:
+                    self._condition.wait()
+                due, _, fn, args = self._heap[0]
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self._condition.wait(timeout=wait)
+                    continue
+                heapq.heappop(self._heap)
+            self.submit(fn, *args)
+
+    @staticmethod
+    def _run_callback(fn: Callable[..., Any], args: tuple) -> None:
+        """
+        Run a callback, logging anything it raises.
+        """
+        try:
+            fn(*args)
+        except Exception as e:
+            logger.exception(f"Error in scheduled retry callback: {e}")
+
+
+_scheduler: Optional[RetryScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_retry_scheduler() -> RetryScheduler:
+    """
+    Get the process-wide retry scheduler, starting it on first use.
+
+    Returns:
+        RetryScheduler: The shared scheduler
+    """
+    global _scheduler
+
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = RetryScheduler()
+        return _scheduler
@@ -8,6 +8,7 @@ from typing import Any, Dict, Optional
 
 from flask import session as flask_session
 
+from livewire.utils.client_registry import get_client, invalidate_client
 from livewire.utils.signalwire_client import SignalWireClient
 
 logger = logging.getLogger(__name__)
@@ -132,8 +133,9 @@ def set_sw_credentials(project_id: str, auth_token: str, space_name: str) -> boo
 
 def get_rest_client() -> Optional[SignalWireClient]:
     """
-    Create a SignalWireClient instance using credentials from the session.
-    The client is created fresh each time to avoid serialization issues.
+    Get the SignalWireClient for the credentials in the session.
+    Clients live in a shared registry (not in the session) to avoid
+    serialization issues, so repeated calls reuse the same warm client.
 
     Returns:
         Optional[SignalWireClient]: The client instance or None if credentials are missing
@@ -143,16 +145,12 @@ def get_rest_client() -> Optional[SignalWireClient]:
         logger.warning("Cannot create SignalWireClient - missing credentials")
         return None
 
-    # Get credentials and create a new client
+    # Get credentials and look up the registered client
     project_id = flask_session.get(SW_PROJECT_ID)
     auth_token = flask_session.get(SW_AUTH_TOKEN)
     space_name = flask_session.get(SW_SPACE_NAME)
 
-    # Create the client (but don't store it in the session)
-    client = SignalWireClient(project_id, auth_token, space_name)
-    logger.debug(f"Created new SignalWireClient for {project_id} in {space_name}")
-
-    return client
+    return get_client(project_id, auth_token, space_name)
 
 
 def set_subscriber_login(email: str) -> bool:
@@ -256,6 +254,13 @@ def clear_session() -> bool:
     # Log what we're clearing
     logger.info(f"Clearing session with keys: {list(flask_session.keys())}")
 
+    # Drop the registered client for these credentials
+    project_id = flask_session.get(SW_PROJECT_ID)
+    auth_token = flask_session.get(SW_AUTH_TOKEN)
+    space_name = flask_session.get(SW_SPACE_NAME)
+    if project_id and auth_token and space_name:
+        invalidate_client(project_id, auth_token, space_name)
+
     # Clear everything
     flask_session.clear()
 
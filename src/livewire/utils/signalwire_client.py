@@ -4,16 +4,48 @@ Provides a consistent interface for interacting with SignalWire APIs.
 """
 
 import base64
+import hashlib
 import logging
+import os
+import threading
 import time
-from typing import Any, Dict, Optional
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
 
-import requests
 from requests.exceptions import (ConnectionError, HTTPError, RequestException,
                                  Timeout)
 
+from livewire.utils.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from livewire.utils.connection_pool import get_session
+from livewire.utils.handler_address_cache import invalidate_handler_addresses
+from livewire.utils.pipeline import PipelineResult, PipelineStep, run_pipeline
+from livewire.utils.rate_limiter import get_rate_limiter
+from livewire.utils.retry_scheduler import (full_jitter_delay,
+                                            get_retry_scheduler,
+                                            parse_retry_after)
+from livewire.utils.single_flight import coalesce_read
+from livewire.utils.subscriber_index import (SUBSCRIBER_INDEX_PAGE_SIZE,
+                                             SubscriberIndex,
+                                             get_subscriber_index)
+
 logger = logging.getLogger(__name__)
 
+# Constants
+REQUEST_TIMEOUT_SECONDS: float = 10.0
+DEFAULT_CALL_TIMEOUT_SECONDS: float = 30.0
+MAX_BACKOFF_SECONDS: float = 8.0
+GUEST_TOKEN_EXPIRES_SECONDS: int = 3600
+# Overrides the https://{space}.signalwire.com/api base URL, e.g. to use the
+# local simulator (python -m livewire.simulator)
+API_BASE_URL: Optional[str] = os.environ.get("SIGNALWIRE_API_BASE_URL") or None
+
+# Rate limit modes: wait for a token, or fail immediately when none is available
+RATE_LIMIT_WAIT: str = "wait"
+RATE_LIMIT_FAIL_FAST: str = "fail_fast"
+
 
 class SignalWireAPIError(Exception):
     """
@@ -23,9 +55,10 @@ class SignalWireAPIError(Exception):
         message (str): Error message from the API or error handler
         status_code (int, optional): HTTP status code from the API response
         is_retryable (bool): Indicates whether the error is potentially retryable
+        retry_after (float, optional): Seconds the server asked us to wait before retrying
     """
 
-    def __init__(self, message, status_code=None, is_retryable=False):
+    def __init__(self, message, status_code=None, is_retryable=False, retry_after=None):
         """
         Initialize the SignalWire API error.
 
@@ -33,26 +66,30 @@ class SignalWireAPIError(Exception):
             message (str): Error message
             status_code (int, optional): HTTP status code
             is_retryable (bool): Whether this error can be retried
+            retry_after (float, optional): Server-requested retry delay in seconds
         """
         self.message = message
         self.status_code = status_code
         self.is_retryable = is_retryable
+        self.retry_after = retry_after
         super().__init__(self.message)
 
 
-class SignalWireClient:
+class CircuitOpenError(SignalWireAPIError):
+    """
+    Exception raised without contacting SignalWire because the circuit breaker
+    for the endpoint family is open. Retryable once the breaker starts probing.
     """
-    Client for interacting with SignalWire APIs.
 
-    This class provides a consistent interface for all SignalWire API operations,
-    including SWML handlers, subscriber management, and call control.
 
-    Features:
-    - Consistent error handling with custom exceptions
-    - Automatic retry for transient errors
-    - Exponential backoff for rate limiting
-    - Detailed logging for debugging
-    - Helper methods for common operations
+class BaseSignalWireClient(ABC):
+    """
+    Transport-independent base for the SignalWire API clients.
+
+    Holds credentials, request building, and the API method surface. Each
+    method delegates to ``_request``, so it returns the response directly on
+    the sync client and an awaitable on the async client. Methods that
+    post-process a response are implemented by each subclass.
     """
 
     def __init__(
@@ -62,6 +99,9 @@ class SignalWireClient:
         space_name: str,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        call_timeout: float = DEFAULT_CALL_TIMEOUT_SECONDS,
+        rate_limit_mode: str = RATE_LIMIT_WAIT,
+        base_url: Optional[str] = None,
     ) -> None:
         """
         Initialize the SignalWire client with credentials.
@@ -72,14 +112,27 @@ class SignalWireClient:
             space_name (str): SignalWire space name (domain part of the URL)
             max_retries (int): Maximum number of retries for retryable errors
             retry_delay (float): Base delay in seconds between retries (increases exponentially)
+            call_timeout (float): Total time budget in seconds for a call, including retries
+            rate_limit_mode (str): RATE_LIMIT_WAIT to wait for a rate limit token,
+                RATE_LIMIT_FAIL_FAST to raise immediately when none is available
+            base_url (Optional[str]): API base URL (defaults to SIGNALWIRE_API_BASE_URL,
+                then to the space's own URL)
         """
         self.project_id = project_id
         self.auth_token = auth_token
         self.space_name = space_name
-        self.base_url = f"https://{space_name}.signalwire.com/api"
+        self.base_url = (
+            base_url or API_BASE_URL or f"https://{space_name}.signalwire.com/api"
+        ).rstrip("/")
         self._headers = self._get_auth_headers()
+        # Identifies the credentials without keeping another copy of the token
+        self._auth_key = hashlib.sha256(
+            self._headers["Authorization"].encode()
+        ).hexdigest()
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.call_timeout = call_timeout
+        self.rate_limit_mode = rate_limit_mode
 
     def _get_auth_headers(self) -> Dict[str, str]:
         """
@@ -110,137 +163,179 @@ class SignalWireClient:
         # 429 (too many requests), 500, 502, 503, 504 (server errors) are retryable
         return status_code in (429, 500, 502, 503, 504)
 
-    def _request(
-        self,
-        method: str,
-        endpoint: str,
-        data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None,
-        retries_left: Optional[int] = None,
-    ) -> Dict[str, Any]:
+    def _build_url(self, endpoint: str) -> str:
         """
-        Make a request to the SignalWire API with retry logic.
+        Build the full API URL for an endpoint path.
 
         Args:
-            method (str): HTTP method (GET, POST, PATCH, etc.)
             endpoint (str): API endpoint path
-            data (Optional[Dict[str, Any]]): Optional JSON payload
-            params (Optional[Dict[str, Any]]): Optional URL parameters
-            retries_left (Optional[int]): Number of retries left (used internally)
 
         Returns:
-            Dict[str, Any]: Response data on success
+            str: Absolute URL for the request
+        """
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
 
-        Raises:
-            SignalWireAPIError: On API error
+    def _next_page(
+        self, response: Dict[str, Any]
+    ) -> Optional[Tuple[str, Dict[str, str]]]:
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        Get the request for the next page of a paginated list response.
 
-        # Set initial retries if not specified
-        if retries_left is None:
-            retries_left = self.max_retries
+        Args:
+            response (Dict[str, Any]): One page of a list response
 
-        try:
-            logger.debug(f"SignalWire API request: {method} {url}")
+        Returns:
+            Optional[Tuple[str, Dict[str, str]]]: (endpoint, params) for the next
+                page, or None on the last page
+        """
+        next_url = (response.get("links") or {}).get("next")
+        if not next_url:
+            return None
 
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=self._headers,
-                json=data,
-                params=params,
-                timeout=10,  # Set a reasonable timeout
-            )
+        parts = urlsplit(next_url)
+        base_path = urlsplit(self.base_url).path
+        endpoint = parts.path
+        if endpoint.startswith(base_path):
+            endpoint = endpoint[len(base_path) :]
+        return endpoint.lstrip("/"), dict(parse_qsl(parts.query))
 
-            # Raise exception for non-2xx responses
-            response.raise_for_status()
+    def _retry_delay(
+        self, error: SignalWireAPIError, attempt: int, deadline: float
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt should be retried and how long to wait.
+        Honors Retry-After when the server sent one, otherwise uses full-jitter
+        exponential backoff. Never schedules a retry past the call deadline.
 
-            # Return JSON data if present
-            if response.text:
-                return response.json()
-            else:
-                return {"status": "success"}
+        Args:
+            error (SignalWireAPIError): The error raised by the attempt
+            attempt (int): Zero-based number of the attempt that failed
+            deadline (float): Monotonic time by which the call must finish
 
-        except HTTPError as e:
-            # Handle API errors
-            error_text = e.response.text
-            status_code = e.response.status_code
+        Returns:
+            Optional[float]: Delay in seconds, or None if the call should not be retried
+        """
+        if (
+            not error.is_retryable
+            or isinstance(error, CircuitOpenError)
+            or attempt >= self.max_retries
+        ):
+            return None
 
-            # Check retry conditions for appropriate status codes
-            if retries_left > 0 and self._is_retryable_error(status_code):
-                # Calculate backoff time with exponential backoff
-                backoff = self.retry_delay * (2 ** (self.max_retries - retries_left))
+        if error.retry_after is not None:
+            delay = error.retry_after
+        else:
+            delay = full_jitter_delay(self.retry_delay, attempt, MAX_BACKOFF_SECONDS)
 
-                # Log retry attempt
-                logger.warning(
-                    f"Retryable error encountered: {status_code}. "
-                    f"Retrying in {backoff:.2f}s. Attempts left: {retries_left}"
-                )
+        # Leave room for the next attempt to actually run before the deadline
+        if time.monotonic() + delay >= deadline:
+            logger.warning(
+                f"Not retrying: backoff of {delay:.2f}s would exceed the call deadline"
+            )
+            return None
+        return delay
 
-                # Wait before retry
-                time.sleep(backoff)
+    def _take_rate_token(self) -> float:
+        """
+        Take a token from the project's shared rate limiter without waiting.
 
-                # Recurse with one fewer retry
-                return self._request(method, endpoint, data, params, retries_left - 1)
+        Returns:
+            float: 0.0 if the request may proceed, otherwise seconds until a token is available
+        """
+        bucket = get_rate_limiter(self.project_id)
+        return 0.0 if bucket is None else bucket.try_acquire()
 
-            # Parse error response
-            try:
-                error_data = e.response.json()
-                error_msg = error_data.get("message", str(e))
-            except:
-                error_msg = error_text or str(e)
+    def _rate_limited_error(self, wait: float) -> SignalWireAPIError:
+        """
+        Build the error raised when the client-side rate limit blocks a request.
 
-            # Enhanced logging for different error types
-            if status_code == 429:
-                logger.error(f"Rate limit exceeded: {method} {url} - {error_msg}")
-            elif status_code >= 500:
-                logger.error(
-                    f"SignalWire server error: {method} {url} - {status_code} - {error_msg}"
-                )
-            else:
-                logger.error(
-                    f"SignalWire API error: {method} {url} - {status_code} - {error_msg}"
-                )
+        Args:
+            wait (float): Seconds until a token is available
 
-            # Determine if the error would be retryable for the caller
-            is_retryable = self._is_retryable_error(status_code)
+        Returns:
+            SignalWireAPIError: A retryable 429 error
+        """
+        logger.warning(
+            f"Client-side rate limit reached for project {self.project_id}, "
+            f"next token in {wait:.2f}s"
+        )
+        return SignalWireAPIError(
+            "Client-side rate limit exceeded",
+            429,
+            is_retryable=True,
+            retry_after=wait,
+        )
 
-            raise SignalWireAPIError(error_msg, status_code, is_retryable)
+    def _guard_circuit(self, breaker: CircuitBreaker) -> None:
+        """
+        Fail fast if the circuit breaker for the endpoint family is open.
 
-        except Timeout as e:
-            # Handle timeout errors specifically
-            logger.error(f"SignalWire API timeout: {method} {url} - {str(e)}")
+        Args:
+            breaker (CircuitBreaker): Breaker guarding the endpoint family
 
-            # Retry on timeout if we have retries left
-            if retries_left > 0:
-                backoff = self.retry_delay * (2 ** (self.max_retries - retries_left))
-                logger.warning(
-                    f"Retrying after timeout in {backoff:.2f}s. Attempts left: {retries_left}"
-                )
-                time.sleep(backoff)
-                return self._request(method, endpoint, data, params, retries_left - 1)
+        Raises:
+            CircuitOpenError: If the breaker rejects the call
+        """
+        if not breaker.allow_request():
+            logger.warning(f"Circuit breaker {breaker.name} is open, failing fast")
+            raise CircuitOpenError(
+                f"SignalWire endpoint temporarily unavailable ({breaker.name})",
+                503,
+                is_retryable=True,
+                retry_after=breaker.retry_after(),
+            )
 
-            raise SignalWireAPIError(f"Request timed out: {str(e)}", is_retryable=True)
+    def _record_outcome(
+        self, breaker: CircuitBreaker, error: Optional[SignalWireAPIError] = None
+    ) -> None:
+        """
+        Record an attempt's outcome on its circuit breaker. Only transient
+        failures count against the endpoint; client errors show it is up.
 
-        except ConnectionError as e:
-            # Handle connection errors
-            logger.error(f"SignalWire API connection error: {method} {url} - {str(e)}")
+        Args:
+            breaker (CircuitBreaker): Breaker guarding the endpoint family
+            error (Optional[SignalWireAPIError]): The attempt's error, if it failed
+        """
+        if error is not None and error.is_retryable:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
 
-            # Retry on connection error if we have retries left
-            if retries_left > 0:
-                backoff = self.retry_delay * (2 ** (self.max_retries - retries_left))
-                logger.warning(
-                    f"Retrying after connection error in {backoff:.2f}s. Attempts left: {retries_left}"
-                )
-                time.sleep(backoff)
-                return self._request(method, endpoint, data, params, retries_left - 1)
+    def _log_api_error(
+        self, method: str, url: str, status_code: int, error_msg: str
+    ) -> None:
+        """
+        Log a non-2xx API response with a level message matching its type.
 
-            raise SignalWireAPIError(f"Connection error: {str(e)}", is_retryable=True)
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            status_code (int): HTTP status code
+            error_msg (str): Parsed error message
+        """
+        if status_code == 429:
+            logger.error(f"Rate limit exceeded: {method} {url} - {error_msg}")
+        elif status_code >= 500:
+            logger.error(
+                f"SignalWire server error: {method} {url} - {status_code} - {error_msg}"
+            )
+        else:
+            logger.error(
+                f"SignalWire API error: {method} {url} - {status_code} - {error_msg}"
+            )
 
-        except RequestException as e:
-            # Handle all other request errors
-            logger.exception(f"SignalWire request failed: {method} {url} - {str(e)}")
-            raise SignalWireAPIError(f"Request failed: {str(e)}")
+    @abstractmethod
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Make a request to the SignalWire API. Implemented by subclasses.
+        """
 
     # SWML Handler methods
 
@@ -344,31 +439,6 @@ class SignalWireClient:
         """
         return self._request("GET", "fabric/resources/subscribers")
 
-    def get_subscriber_by_email(self, email):
-        """
-        Find a subscriber by email.
-
-        Args:
-            email (str): Email address to search for (case-insensitive)
-
-        Returns:
-            tuple: (subscriber_data, subscriber_id) or (None, None) if not found
-        """
-        try:
-            response = self.get_subscribers()
-
-            # Check all subscribers for matching email
-            for sub in response.get("data", []):
-                if sub.get("subscriber", {}).get("email", "").lower() == email.lower():
-                    return sub.get("subscriber"), sub.get("id")
-
-            # No match found
-            return None, None
-
-        except SignalWireAPIError:
-            # Log and return None, None on API error
-            return None, None
-
     def create_subscriber(self, subscriber_data):
         """Create a new subscriber"""
         return self._request("POST", "fabric/resources/subscribers", subscriber_data)
@@ -394,59 +464,6 @@ class SignalWireClient:
             "GET", f"fabric/resources/subscribers/{subscriber_id}/addresses"
         )
 
-    def create_subscriber_token(self, reference):
-        """
-        Create a subscriber authentication token.
-
-        Args:
-            reference (str): Reference string (typically email) for the token
-
-        Returns:
-            str: The subscriber token
-        """
-        payload = {"reference": reference}
-        response = self._request("POST", "fabric/subscribers/tokens", data=payload)
-        return response.get("token")
-
-    def fetch_subscriber_address(self, subscriber_id: str) -> Optional[str]:
-        """
-        Fetch the address for a given subscriber ID.
-        Args:
-            subscriber_id (str): The subscriber's ID
-        Returns:
-            Optional[str]: The address if found, None otherwise
-        """
-        try:
-            # Get addresses for the subscriber
-            addresses_response = self.get_subscriber_addresses(subscriber_id)
-
-            # Extract audio address
-            data = addresses_response.get("data", [])
-            if not data:
-                logger.warning(f"No addresses found for subscriber {subscriber_id}")
-                return None
-
-            address_obj = data[0]
-            channels = address_obj.get("channels") or address_obj.get("channel")
-
-            if not channels or "audio" not in channels:
-                logger.warning(f"No audio channel found for subscriber {subscriber_id}")
-                return None
-
-            audio_path = channels["audio"]
-            address = audio_path.split("?")[0]
-
-            logger.debug(f"Found subscriber address: {address}")
-            return address
-
-        except SignalWireAPIError as e:
-            logger.warning(f"Error fetching subscriber address: {e.message}")
-            return None
-
-        except Exception as e:
-            logger.exception(f"Unexpected error fetching subscriber address: {str(e)}")
-            return None
-
     # Call control methods
 
     def send_ai_message(self, call_id, role, message_text):
@@ -487,27 +504,6 @@ class SignalWireClient:
         payload = {"id": call_id, "command": "calling.ai_unhold"}
         return self._request("POST", "calling/calls", payload)
 
-    def notify_ai_about_new_member(self, call_id, message_text):
-        """
-        Notify an AI agent about a new member and unhold the agent.
-        This is a convenience method that combines send_ai_message and unhold_ai_agent.
-
-        Args:
-            call_id (str): The ID of the active call
-            message_text (str): The message text to send to the AI agent
-
-        Returns:
-            dict: The response from the unhold request
-
-        Raises:
-            SignalWireAPIError: If either the message sending or unhold operation fails
-        """
-        # First, send the message
-        self.send_ai_message(call_id, "system", message_text)
-
-        # Then, unhold the agent
-        return self.unhold_ai_agent(call_id)
-
     # Guest token methods
 
     def create_guest_token(self, allowed_address):
@@ -525,12 +521,44 @@ class SignalWireClient:
         """
         payload = {
             "allowed_address": allowed_address,
-            "expires_seconds": 3600,  # Token valid for 1 hour
+            "expires_seconds": GUEST_TOKEN_EXPIRES_SECONDS,  # Token valid for 1 hour
         }
         return self._request("POST", "fabric/guests/tokens", payload)
 
     # Helper methods
 
+    def _parse_subscriber_address(
+        self, subscriber_id: str, addresses_response: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Extract a subscriber's audio address from an addresses response.
+
+        Args:
+            subscriber_id (str): The subscriber's ID (used for logging)
+            addresses_response (Dict[str, Any]): Response from get_subscriber_addresses
+
+        Returns:
+            Optional[str]: The address if found, None otherwise
+        """
+        # Extract audio address
+        data = addresses_response.get("data", [])
+        if not data:
+            logger.warning(f"No addresses found for subscriber {subscriber_id}")
+            return None
+
+        address_obj = data[0]
+        channels = address_obj.get("channels") or address_obj.get("channel")
+
+        if not channels or "audio" not in channels:
+            logger.warning(f"No audio channel found for subscriber {subscriber_id}")
+            return None
+
+        audio_path = channels["audio"]
+        address = audio_path.split("?")[0]
+
+        logger.debug(f"Found subscriber address: {address}")
+        return address
+
     def extract_audio_destination(self, addresses_response):
         """
         Extract the audio destination from an addresses response.
@@ -551,3 +579,640 @@ class SignalWireClient:
 
         audio_path = channels["audio"]
         return audio_path.split("?")[0]
+
+
+class SignalWireClient(BaseSignalWireClient):
+    """
+    Client for interacting with SignalWire APIs.
+
+    This class provides a consistent interface for all SignalWire API operations,
+    including SWML handlers, subscriber management, and call control.
+
+    Features:
+    - Consistent error handling with custom exceptions
+    - Shared keep-alive connection pool per space and project
+    - Automatic retry for transient errors
+    - Full-jitter backoff honoring Retry-After, bounded by a per-call deadline
+    - Optional background retries that never sleep on the calling thread
+    - Per-project client-side rate limiting shared across clients
+    - Circuit breakers per space and endpoint family that fail fast while open
+    - Lazy paginated iterators over list endpoints with optional prefetch
+    - Pipelined execution that overlaps independent calls, with per-step timing
+    - Single-flight coalescing of concurrent identical GETs
+    - Email lookups served from a paginated, periodically refreshed subscriber index
+    - Detailed logging for debugging
+    - Helper methods for common operations
+    """
+
+    def _wait_for_rate_token(self, deadline: float) -> None:
+        """
+        Take a rate limit token, waiting for one if the client is in wait mode.
+
+        Args:
+            deadline (float): Monotonic time by which the call must finish
+
+        Raises:
+            SignalWireAPIError: If failing fast or no token is available before the deadline
+        """
+        while True:
+            wait = self._take_rate_token()
+            if wait <= 0:
+                return
+            if (
+                self.rate_limit_mode == RATE_LIMIT_FAIL_FAST
+                or time.monotonic() + wait >= deadline
+            ):
+                raise self._rate_limited_error(wait)
+            time.sleep(wait)
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch a paginated list lazily, one page at a time, following ``links.next``.
+
+        Args:
+            endpoint (str): API endpoint path of the list
+            params (Optional[Dict[str, Any]]): URL parameters for the first page
+            prefetch (bool): Fetch the next page in the background while the
+                caller consumes the current one (at most one page ahead)
+
+        Yields:
+            Dict[str, Any]: Each page of the list response
+
+        Raises:
+            SignalWireAPIError: If fetching a page fails
+        """
+        request: Tuple[str, Optional[Dict[str, Any]]] = (endpoint, params)
+        pending: Optional[Future] = None
+        page = self._request("GET", endpoint, params=params)
+        try:
+            while True:
+                next_request = self._next_page(page)
+                # Guard against a server that keeps returning the same link
+                if next_request == request:
+                    next_request = None
+                if next_request is not None and prefetch:
+                    pending = self.request_in_background(
+                        "GET", next_request[0], params=next_request[1]
+                    )
+
+                yield page
+
+                if next_request is None:
+                    return
+                request = next_request
+                if pending is not None:
+                    page, pending = self._prefetched_page(pending), None
+                else:
+                    page = self._request("GET", request[0], params=request[1])
+        finally:
+            # The caller stopped early; drop the page nobody will read
+            if pending is not None:
+                pending.cancel()
+
+    def _prefetched_page(self, pending: Future) -> Dict[str, Any]:
+        """
+        Wait for a page fetched by request_in_background. The request gives up
+        at its own deadline, so waiting longer than the call timeout means it
+        was lost.
+
+        Args:
+            pending (Future): The background request
+
+        Returns:
+            Dict[str, Any]: The page
+
+        Raises:
+            SignalWireAPIError: If the request failed or never completed
+        """
+        try:
+            return pending.result(timeout=self.call_timeout + REQUEST_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            raise SignalWireAPIError(
+                "Request failed: timed out waiting for the next page",
+                is_retryable=True,
+            )
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        deadline: float,
+    ) -> Dict[str, Any]:
+        """
+        Make a single attempt at a SignalWire API request.
+
+        Args:
+            method (str): HTTP method (GET, POST, PATCH, etc.)
+            url (str): Absolute request URL
+            data (Optional[Dict[str, Any]]): Optional JSON payload
+            params (Optional[Dict[str, Any]]): Optional URL parameters
+            deadline (float): Monotonic time by which the call must finish
+
+        Returns:
+            Dict[str, Any]: Response data on success
+
+        Raises:
+            SignalWireAPIError: On API error, timeout, or connection failure
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise SignalWireAPIError("Call deadline exceeded", is_retryable=True)
+
+        try:
+            logger.debug(f"SignalWire API request: {method} {url}")
+
+            # Reuse pooled keep-alive connections instead of a fresh handshake
+            session = get_session(self.space_name, self.project_id)
+            response = session.request(
+                method=method,
+                url=url,
+                headers=self._headers,
+                json=data,
+                params=params,
+                timeout=min(REQUEST_TIMEOUT_SECONDS, remaining),
+            )
+
+            # Raise exception for non-2xx responses
+            response.raise_for_status()
+
+            # Return JSON data if present
+            if response.text:
+                return response.json()
+            else:
+                return {"status": "success"}
+
+        except HTTPError as e:
+            # Parse error response
+            error_text = e.response.text
+            status_code = e.response.status_code
+            try:
+                error_data = e.response.json()
+                error_msg = error_data.get("message", str(e))
+            except:
+                error_msg = error_text or str(e)
+
+            raise SignalWireAPIError(
+                error_msg,
+                status_code,
+                self._is_retryable_error(status_code),
+                parse_retry_after(e.response.headers.get("Retry-After")),
+            )
+
+        except Timeout as e:
+            # Handle timeout errors specifically
+            logger.error(f"SignalWire API timeout: {method} {url} - {str(e)}")
+            raise SignalWireAPIError(f"Request timed out: {str(e)}", is_retryable=True)
+
+        except ConnectionError as e:
+            # Handle connection errors
+            logger.error(f"SignalWire API connection error: {method} {url} - {str(e)}")
+            raise SignalWireAPIError(f"Connection error: {str(e)}", is_retryable=True)
+
+        except RequestException as e:
+            # Handle all other request errors
+            logger.exception(f"SignalWire request failed: {method} {url} - {str(e)}")
+            raise SignalWireAPIError(f"Request failed: {str(e)}")
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the SignalWire API with retry logic.
+        Concurrent identical GETs for the same project share one outbound call.
+
+        Args:
+            method (str): HTTP method (GET, POST, PATCH, etc.)
+            endpoint (str): API endpoint path
+            data (Optional[Dict[str, Any]]): Optional JSON payload
+            params (Optional[Dict[str, Any]]): Optional URL parameters
+            timeout (Optional[float]): Total time budget in seconds (defaults to call_timeout)
+
+        Returns:
+            Dict[str, Any]: Response data on success
+
+        Raises:
+            SignalWireAPIError: On API error
+        """
+        if method == "GET":
+            # Only merge reads made with the same credentials, so nobody gets
+            # a result (or a 401) meant for another token
+            key = (
+                self._auth_key,
+                self._build_url(endpoint),
+                tuple(sorted((params or {}).items())),
+            )
+            return coalesce_read(
+                key,
+                lambda: self._request_with_retries(
+                    method, endpoint, data, params, timeout
+                ),
+            )
+        return self._request_with_retries(method, endpoint, data, params, timeout)
+
+    def _request_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the SignalWire API, retrying retryable errors.
+
+        Args:
+            method (str): HTTP method (GET, POST, PATCH, etc.)
+            endpoint (str): API endpoint path
+            data (Optional[Dict[str, Any]]): Optional JSON payload
+            params (Optional[Dict[str, Any]]): Optional URL parameters
+            timeout (Optional[float]): Total time budget in seconds (defaults to call_timeout)
+
+        Returns:
+            Dict[str, Any]: Response data on success
+
+        Raises:
+            SignalWireAPIError: On API error
+        """
+        url = self._build_url(endpoint)
+        deadline = time.monotonic() + (timeout or self.call_timeout)
+        breaker = get_circuit_breaker(self.space_name, endpoint)
+
+        attempt = 0
+        while True:
+            # Pace outbound traffic and fail fast while the endpoint family is
+            # down; neither is retried
+            self._wait_for_rate_token(deadline)
+            self._guard_circuit(breaker)
+            recorded = False
+            try:
+                result = self._send_once(method, url, data, params, deadline)
+                self._record_outcome(breaker)
+                recorded = True
+                return result
+            except SignalWireAPIError as e:
+                self._record_outcome(breaker, e)
+                recorded = True
+                backoff = self._retry_delay(e, attempt, deadline)
+                if backoff is None:
+                    if e.status_code:
+                        self._log_api_error(method, url, e.status_code, e.message)
+                    raise
+
+                # Log retry attempt
+                logger.warning(
+                    f"Retryable error encountered: {e.status_code or e.message}. "
+                    f"Retrying in {backoff:.2f}s. Attempts left: {self.max_retries - attempt}"
+                )
+
+                # Wait before retry
+                time.sleep(backoff)
+                attempt += 1
+            finally:
+                # Failed unexpectedly: free a half-open probe slot anyway
+                if not recorded:
+                    breaker.release()
+
+    def request_in_background(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """
+        Make a request to the SignalWire API without blocking the caller.
+        Attempts run on the shared retry scheduler and backoff is timer-driven,
+        so no thread sleeps between retries.
+
+        Args:
+            method (str): HTTP method (GET, POST, PATCH, etc.)
+            endpoint (str): API endpoint path
+            data (Optional[Dict[str, Any]]): Optional JSON payload
+            params (Optional[Dict[str, Any]]): Optional URL parameters
+            timeout (Optional[float]): Total time budget in seconds (defaults to call_timeout)
+
+        Returns:
+            Future: Resolves to the response data or a SignalWireAPIError
+        """
+        url = self._build_url(endpoint)
+        deadline = time.monotonic() + (timeout or self.call_timeout)
+        breaker = get_circuit_breaker(self.space_name, endpoint)
+        scheduler = get_retry_scheduler()
+        future: Future = Future()
+
+        def start() -> None:
+            # Skip the request entirely if the caller gave up on the result
+            if future.set_running_or_notify_cancel():
+                attempt(0)
+
+        def attempt(number: int) -> None:
+            # Wait for a rate limit token on the timer rather than a thread
+            wait = self._take_rate_token()
+            if wait > 0:
+                if (
+                    self.rate_limit_mode == RATE_LIMIT_FAIL_FAST
+                    or time.monotonic() + wait >= deadline
+                ):
+                    future.set_exception(self._rate_limited_error(wait))
+                else:
+                    scheduler.call_later(wait, attempt, number)
+                return
+
+            try:
+                self._guard_circuit(breaker)
+            except CircuitOpenError as e:
+                future.set_exception(e)
+                return
+
+            try:
+                result = self._send_once(method, url, data, params, deadline)
+                self._record_outcome(breaker)
+            except SignalWireAPIError as e:
+                self._record_outcome(breaker, e)
+                backoff = self._retry_delay(e, number, deadline)
+                if backoff is None:
+                    if e.status_code:
+                        self._log_api_error(method, url, e.status_code, e.message)
+                    future.set_exception(e)
+                    return
+                logger.warning(
+                    f"Retryable error encountered: {e.status_code or e.message}. "
+                    f"Scheduling retry in {backoff:.2f}s."
+                )
+                scheduler.call_later(backoff, attempt, number + 1)
+                return
+            except Exception as e:
+                breaker.release()
+                future.set_exception(e)
+                return
+            future.set_result(result)
+
+        scheduler.submit(start)
+        return future
+
+    def run_pipeline(self, steps: List[PipelineStep]) -> PipelineResult:
+        """
+        Run a set of calls, overlapping the independent ones and keeping the
+        order given by each step's ``after`` dependencies.
+
+        Args:
+            steps (List[PipelineStep]): The calls to make
+
+        Returns:
+            PipelineResult: Step results and per-step timings
+
+        Raises:
+            SignalWireAPIError: The first API error raised by a step
+        """
+        return run_pipeline(steps)
+
+    # Subscriber methods
+
+    def get_subscriber_by_email(self, email):
+        """
+        Find a subscriber by email.
+
+        Args:
+            email (str): Email address to search for (case-insensitive)
+
+        Returns:
+            tuple: (subscriber_data, subscriber_id) or (None, None) if not found
+        """
+        index = get_subscriber_index(self.space_name, self.project_id)
+        try:
+            if not index.is_built:
+                # Only one caller builds the index; the others wait and reuse it
+                with index.build_lock:
+                    if not index.is_built:
+                        self._scan_subscribers(index)
+
+            generation = index.scan_generation
+            subscriber, subscriber_id = index.lookup(email)
+            if subscriber_id is None:
+                # The subscriber may have been created elsewhere (the dashboard
+                # or another worker) since the last scan, so scan again before
+                # reporting a miss, unless another caller's scan started since
+                with index.build_lock:
+                    if index.scan_generation == generation:
+                        self._scan_subscribers(index)
+                subscriber, subscriber_id = index.lookup(email)
+
+        except SignalWireAPIError as e:
+            logger.warning(f"Failed to look up subscriber by email: {e.message}")
+            return None, None
+
+        if index.claim_refresh():
+            threading.Thread(
+                target=self._refresh_subscriber_index,
+                args=(index,),
+                name="subscriber-index-refresh",
+                daemon=True,
+            ).start()
+
+        return subscriber, subscriber_id
+
+    def _scan_subscribers(self, index: SubscriberIndex) -> None:
+        """
+        Rebuild a subscriber index from the paginated subscribers list.
+
+        Args:
+            index (SubscriberIndex): The index to fill
+
+        Raises:
+            SignalWireAPIError: If fetching a page fails
+        """
+        index.scan(
+            self._iter_pages(
+                "fabric/resources/subscribers",
+                {"page_size": SUBSCRIBER_INDEX_PAGE_SIZE},
+                prefetch=True,
+            )
+        )
+
+    def _refresh_subscriber_index(self, index: SubscriberIndex) -> None:
+        """
+        Refresh a subscriber index in the background, keeping the current
+        entries if the scan fails.
+
+        Args:
+            index (SubscriberIndex): The index to refresh
+        """
+        try:
+            with index.build_lock:
+                self._scan_subscribers(index)
+        except SignalWireAPIError as e:
+            logger.warning(
+                f"Failed to refresh subscriber index {index.name}: {e.message}"
+            )
+
+    def iter_subscribers(
+        self, page_size: Optional[int] = None, prefetch: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every subscriber, fetching pages lazily as they are needed.
+        Stopping early (breaking out of the loop) fetches no further pages.
+
+        Args:
+            page_size (Optional[int]): Page size hint sent to the API
+            prefetch (bool): Fetch the next page while the current one is consumed
+
+        Yields:
+            Dict[str, Any]: Each subscriber resource
+
+        Raises:
+            SignalWireAPIError: If fetching a page fails
+        """
+        params = {"page_size": page_size} if page_size else None
+        for page in self._iter_pages("fabric/resources/subscribers", params, prefetch):
+            yield from page.get("data", [])
+
+    def iter_handler_addresses(
+        self, handler_id: str, page_size: Optional[int] = None, prefetch: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every address of a SWML handler, fetching pages lazily.
+
+        Args:
+            handler_id (str): The ID of the SWML handler
+            page_size (Optional[int]): Page size hint sent to the API
+            prefetch (bool): Fetch the next page while the current one is consumed
+
+        Yields:
+            Dict[str, Any]: Each address resource
+
+        Raises:
+            SignalWireAPIError: If fetching a page fails
+        """
+        params = {"page_size": page_size} if page_size else None
+        for page in self._iter_pages(
+            f"fabric/resources/external_swml_handlers/{handler_id}/addresses",
+            params,
+            prefetch,
+        ):
+            yield from page.get("data", [])
+
+    def update_swml_handler(self, handler_id, name, request_url):
+        """
+        Update an existing SWML handler and drop its cached addresses.
+
+        Args:
+            handler_id (str): The ID of the SWML handler to update
+            name (str): New name for the SWML handler
+            request_url (str): New URL that SignalWire will send requests to
+
+        Returns:
+            dict: Updated handler details
+
+        Raises:
+            SignalWireAPIError: If update fails or handler doesn't exist
+        """
+        response = super().update_swml_handler(handler_id, name, request_url)
+        # Only once the write is done: a read racing the update could otherwise
+        # cache the old addresses again under the new generation
+        invalidate_handler_addresses(self.space_name, self.project_id, handler_id)
+        return response
+
+    def create_subscriber(self, subscriber_data):
+        """
+        Create a new subscriber and add it to the email index.
+
+        Args:
+            subscriber_data (dict): Subscriber fields, including email
+
+        Returns:
+            dict: The created subscriber resource
+        """
+        response = super().create_subscriber(subscriber_data)
+        # Only the API's view is indexed; the submitted payload has the password
+        get_subscriber_index(self.space_name, self.project_id).record(
+            response.get("id"), response.get("subscriber")
+        )
+        return response
+
+    def update_subscriber(self, subscriber_id, update_data):
+        """
+        Update an existing subscriber and apply the change to the email index.
+
+        Args:
+            subscriber_id (str): The subscriber ID to update
+            update_data (dict): Fields to update
+
+        Returns:
+            dict: Updated subscriber data
+        """
+        response = super().update_subscriber(subscriber_id, update_data)
+        index = get_subscriber_index(self.space_name, self.project_id)
+        if response.get("subscriber"):
+            index.record(subscriber_id, response["subscriber"])
+        else:
+            index.merge(subscriber_id, update_data)
+        return response
+
+    def create_subscriber_token(self, reference):
+        """
+        Create a subscriber authentication token.
+
+        Args:
+            reference (str): Reference string (typically email) for the token
+
+        Returns:
+            str: The subscriber token
+        """
+        payload = {"reference": reference}
+        response = self._request("POST", "fabric/subscribers/tokens", data=payload)
+        return response.get("token")
+
+    def fetch_subscriber_address(self, subscriber_id: str) -> Optional[str]:
+        """
+        Fetch the address for a given subscriber ID.
+        Args:
+            subscriber_id (str): The subscriber's ID
+        Returns:
+            Optional[str]: The address if found, None otherwise
+        """
+        try:
+            # Get addresses for the subscriber
+            addresses_response = self.get_subscriber_addresses(subscriber_id)
+            return self._parse_subscriber_address(subscriber_id, addresses_response)
+
+        except SignalWireAPIError as e:
+            logger.warning(f"Error fetching subscriber address: {e.message}")
+            return None
+
+        except Exception as e:
+            logger.exception(f"Unexpected error fetching subscriber address: {str(e)}")
+            return None
+
+    # Call control methods
+
+    def notify_ai_about_new_member(self, call_id, message_text):
+        """
+        Notify an AI agent about a new member and unhold the agent.
+        This is a convenience method that combines send_ai_message and unhold_ai_agent.
+
+        Args:
+            call_id (str): The ID of the active call
+            message_text (str): The message text to send to the AI agent
+
+        Returns:
+            dict: The response from the unhold request
+
+        Raises:
+            SignalWireAPIError: If either the message sending or unhold operation fails
+        """
+        # The message must land before the agent resumes
+        self.send_ai_message(call_id, "system", message_text)
+        return self.unhold_ai_agent(call_id)
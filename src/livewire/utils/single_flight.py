@@ -0,0 +1,127 @@
+"""
+Request coalescing for the LiveWire demo app.
+Collapses concurrent identical reads onto one outbound call whose result is
+shared by every waiting caller.
+"""
+
+import copy
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group.
+
+    The first caller for a key (the leader) runs the call; callers arriving
+    with the same key while it is in flight wait for the leader and receive
+    a copy of its result, or the same exception. Nothing is cached once the
+    call completes.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty group.
+        """
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._leaders = 0
+        self._collapsed = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run ``fn`` unless an identical call is already in flight, in which
+        case wait for that call instead.
+
+        Args:
+            key (Hashable): Identity of the call
+            fn (Callable[[], Any]): The call to make if this caller leads
+
+        Returns:
+            Any: The call's result (a deep copy for callers that did not lead)
+
+        Raises:
+            Exception: Whatever the call raised
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._collapsed += 1
+                leader = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                self._leaders += 1
+                leader = True
+
+        if not leader:
+            # Copy so one caller mutating its response can't affect another
+            return copy.deepcopy(future.result())
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._release(key)
+            future.set_exception(e)
+            raise
+        self._release(key)
+        future.set_result(result)
+        return result
+
+    def _release(self, key: Hashable) -> None:
+        """
+        Stop collapsing new callers onto a finished call.
+
+        Args:
+            key (Hashable): Identity of the call
+        """
+        with self._lock:
+            del self._in_flight[key]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report leader and collapse counters.
+
+        Returns:
+            Dict[str, int]: Coalescing metrics
+        """
+        with self._lock:
+            return {
+                "leaders": self._leaders,
+                "collapsed": self._collapsed,
+                "in_flight": len(self._in_flight),
+            }
+
+
+_reads = SingleFlight()
+
+
+def coalesce_read(key: Hashable, fn: Callable[[], Any]) -> Any:
+    """
+    Run an idempotent read through the process-wide single-flight group.
+
+    Args:
+        key (Hashable): Identity of the read
+        fn (Callable[[], Any]): The read to make if no identical one is in flight
+
+    Returns:
+        Any: The read's result
+
+    Raises:
+        Exception: Whatever the read raised
+    """
+    return _reads.do(key, fn)
+
+
+def get_single_flight_stats() -> Dict[str, int]:
+    """
+    Report counters for the process-wide single-flight group.
+
+    Returns:
+        Dict[str, int]: Coalescing metrics
+    """
+    return _reads.stats()
@@ -0,0 +1,314 @@
+"""
+Subscriber email index for the LiveWire demo app.
+Maps lowercased subscriber emails to subscriber IDs per SignalWire project so
+signup lookups don't scan the full subscriber list on every request.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, AsyncIterable, Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Index tuning (overridable through the environment)
+SUBSCRIBER_INDEX_REFRESH_SECONDS: float = float(
+    os.environ.get("SUBSCRIBER_INDEX_REFRESH_SECONDS", 300)
+)
+SUBSCRIBER_INDEX_PAGE_SIZE: int = int(os.environ.get("SUBSCRIBER_INDEX_PAGE_SIZE", 100))
+
+# Fields never kept in the index, even if a response or update carries them
+UNINDEXED_FIELDS = frozenset({"password"})
+
+# (subscriber_data, subscriber_id)
+IndexEntry = Tuple[Dict[str, Any], str]
+
+
+class SubscriberIndex:
+    """
+    Email to subscriber index for one (space, project).
+
+    Filled by paginated scans of the subscribers list and kept current by
+    ``record`` on every create or update made through the client. Scans apply
+    each page as it arrives, then drop entries that were neither seen in the
+    scan nor recorded while it ran.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize an empty, unbuilt index.
+
+        Args:
+            name (str): Name used in logs and metrics
+        """
+        self.name = name
+        self._by_email: Dict[str, IndexEntry] = {}
+        self._email_by_id: Dict[str, str] = {}
+        # Subscriber IDs recorded since the current scan started
+        self._recorded: Set[str] = set()
+        self._lock = threading.Lock()
+        # Serializes scans so concurrent cold lookups trigger a single build
+        self.build_lock = threading.Lock()
+        self._built_at: Optional[float] = None
+        self._refreshing = False
+        self._scans_started = 0
+        self._scans = 0
+        self._hits = 0
+        self._misses = 0
+
+    def _put(self, subscriber_id: str, subscriber: Dict[str, Any]) -> None:
+        """
+        Insert or replace one subscriber. Must be called with the lock held.
+
+        Args:
+            subscriber_id (str): The subscriber ID
+            subscriber (Dict[str, Any]): The subscriber fields, including email
+        """
+        old_email = self._email_by_id.pop(subscriber_id, None)
+        if old_email is not None:
+            self._by_email.pop(old_email, None)
+
+        email = (subscriber.get("email") or "").lower()
+        if email:
+            if not UNINDEXED_FIELDS.isdisjoint(subscriber):
+                subscriber = {
+                    k: v for k, v in subscriber.items() if k not in UNINDEXED_FIELDS
+                }
+            self._by_email[email] = (subscriber, subscriber_id)
+            self._email_by_id[subscriber_id] = email
+
+    @property
+    def is_built(self) -> bool:
+        """
+        Check whether at least one full scan has completed.
+
+        Returns:
+            bool: True once the index can answer lookups
+        """
+        with self._lock:
+            return self._built_at is not None
+
+    @property
+    def scan_generation(self) -> int:
+        """
+        Count the scans started so far, so a caller can tell whether a scan
+        started after a given point.
+
+        Returns:
+            int: Number of scans started
+        """
+        with self._lock:
+            return self._scans_started
+
+    def claim_refresh(self) -> bool:
+        """
+        Claim the periodic refresh if the index is due for one and no refresh
+        is already running.
+
+        Returns:
+            bool: True if the caller should run a refresh scan
+        """
+        with self._lock:
+            if self._refreshing or self._built_at is None:
+                return False
+            if time.monotonic() - self._built_at < SUBSCRIBER_INDEX_REFRESH_SECONDS:
+                return False
+            self._refreshing = True
+            return True
+
+    def lookup(self, email: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Find a subscriber by email.
+
+        Args:
+            email (str): Email address to search for (case-insensitive)
+
+        Returns:
+            tuple: (subscriber_data, subscriber_id) or (None, None) if not found
+        """
+        with self._lock:
+            entry = self._by_email.get(email.lower())
+            if entry is None:
+                self._misses += 1
+                return None, None
+            self._hits += 1
+            return entry
+
+    def record(
+        self, subscriber_id: Optional[str], subscriber: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Record a subscriber created or updated through the client.
+
+        Args:
+            subscriber_id (Optional[str]): The subscriber ID (ignored if missing)
+            subscriber (Optional[Dict[str, Any]]): The subscriber's current fields
+        """
+        if not subscriber_id or not subscriber:
+            return
+        with self._lock:
+            self._put(subscriber_id, subscriber)
+            self._recorded.add(subscriber_id)
+
+    def merge(self, subscriber_id: str, fields: Dict[str, Any]) -> None:
+        """
+        Apply updated fields to an indexed subscriber.
+
+        Args:
+            subscriber_id (str): The subscriber ID
+            fields (Dict[str, Any]): Fields that were changed
+        """
+        with self._lock:
+            email = self._email_by_id.get(subscriber_id)
+            current = self._by_email[email][0] if email else {}
+            self._put(subscriber_id, {**current, **fields})
+            self._recorded.add(subscriber_id)
+
+    def begin_scan(self) -> Set[str]:
+        """
+        Start a scan of the subscribers list.
+
+        Returns:
+            Set[str]: Collector for the subscriber IDs seen by the scan
+        """
+        with self._lock:
+            self._recorded.clear()
+            self._scans_started += 1
+        return set()
+
+    def add_page(self, page: Dict[str, Any], seen: Set[str]) -> None:
+        """
+        Apply one page of the subscribers list.
+
+        Args:
+            page (Dict[str, Any]): One page of the subscribers list response
+            seen (Set[str]): Collector returned by begin_scan
+        """
+        with self._lock:
+            for item in page.get("data", []):
+                subscriber_id = item.get("id")
+                if not subscriber_id:
+                    continue
+                seen.add(subscriber_id)
+                # Keep writes made while the scan ran over possibly older page data
+                if subscriber_id not in self._recorded:
+                    self._put(subscriber_id, item.get("subscriber") or {})
+
+    def finish_scan(self, seen: Set[str]) -> None:
+        """
+        Complete a scan, dropping subscribers that no longer exist.
+
+        Args:
+            seen (Set[str]): Collector returned by begin_scan
+        """
+        with self._lock:
+            keep = seen | self._recorded
+            for subscriber_id in [i for i in self._email_by_id if i not in keep]:
+                self._by_email.pop(self._email_by_id.pop(subscriber_id), None)
+            self._built_at = time.monotonic()
+            self._refreshing = False
+            self._scans += 1
+        logger.debug(f"Indexed {len(seen)} subscribers for {self.name}")
+
+    def abort_scan(self) -> None:
+        """
+        Give up on a failed scan, keeping the existing entries.
+        """
+        with self._lock:
+            self._refreshing = False
+
+    def scan(self, pages: Iterable[Dict[str, Any]]) -> None:
+        """
+        Run a full scan over an iterable of subscriber list pages.
+
+        Args:
+            pages (Iterable[Dict[str, Any]]): Pages of the subscribers list
+
+        Raises:
+            SignalWireAPIError: If fetching a page fails
+        """
+        seen = self.begin_scan()
+        try:
+            for page in pages:
+                self.add_page(page, seen)
+        except Exception:
+            self.abort_scan()
+            raise
+        self.finish_scan(seen)
+
+    async def scan_async(self, pages: AsyncIterable[Dict[str, Any]]) -> None:
+        """
+        Run a full scan over an async iterable of subscriber list pages, as
+        ``scan`` does. A cancelled scan keeps the existing entries.
+
+        Args:
+            pages (AsyncIterable[Dict[str, Any]]): Pages of the subscribers list
+
+        Raises:
+            SignalWireAPIError: If fetching a page fails
+        """
+        seen = self.begin_scan()
+        try:
+            async for page in pages:
+                self.add_page(page, seen)
+        except BaseException:
+            self.abort_scan()
+            raise
+        self.finish_scan(seen)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the index size and counters.
+
+        Returns:
+            Dict[str, Any]: Index metrics
+        """
+        with self._lock:
+            return {
+                "size": len(self._by_email),
+                "age": (
+                    round(time.monotonic() - self._built_at, 3)
+                    if self._built_at is not None
+                    else None
+                ),
+                "scans": self._scans,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+_indexes: Dict[Tuple[str, str], SubscriberIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_subscriber_index(space_name: str, project_id: str) -> SubscriberIndex:
+    """
+    Get the shared subscriber index for a space and project.
+
+    Args:
+        space_name (str): SignalWire space name
+        project_id (str): SignalWire project ID
+
+    Returns:
+        SubscriberIndex: The project's index (possibly not yet built)
+    """
+    key = (space_name, project_id)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = SubscriberIndex(f"{space_name}:{project_id}")
+            _indexes[key] = index
+        return index
+
+
+def get_subscriber_index_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Report size and counters for every subscriber index.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Index metrics keyed by "space:project"
+    """
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    return {index.name: index.stats() for index in indexes}
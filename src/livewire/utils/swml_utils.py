@@ -1,18 +1,329 @@
 """
 SWML utility functions for the LiveWire demo app.
 Provides helpers for loading and formatting SWML files.
+
+YAML templates are compiled once into a prebuilt structure with slots where
+the ``{placeholders}`` were, so rendering substitutes values directly with no
+file I/O or YAML parse. Compiled templates are reloaded when the file's mtime
+changes. Values that YAML would have read differently than plain text (quotes
+or backslashes in a quoted string, newlines, YAML syntax in an unquoted value)
+are rendered through the original format-then-parse path instead, so the
+output is always the same.
+
+Documents served as JSON are also cached as serialized bytes per (template,
+variables), with a strong content hash for ETags.
 """
 
+import base64
+import hashlib
 import json
 import logging
-from typing import Any, Dict, Optional
+import os
+import re
+import string
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import yaml
 
+logger = logging.getLogger(__name__)
 
-def load_swml_with_vars(swml_file: str, **kwargs: Any) -> Optional[Dict[str, Any]]:
+# Seconds between mtime checks of a compiled template
+SWML_TEMPLATE_CHECK_INTERVAL: float = float(
+    os.environ.get("SWML_TEMPLATE_CHECK_INTERVAL", 1.0)
+)
+
+# Serialized documents kept by render_swml_json
+SWML_RESPONSE_CACHE_SIZE: int = int(os.environ.get("SWML_RESPONSE_CACHE_SIZE", 64))
+
+# Stand-in for placeholders while the template is parsed
+_SLOT_TOKEN = "__swml_slot_{}__"
+_SLOT_RE = re.compile(r"__swml_slot_(\d+)__")
+# Unquoted text that YAML reads back as the same plain string
+_PLAIN_SAFE_RE = re.compile(
+    r"(?!.*: |.* #)[^\s\-?:,\[\]{}#&*!|>'\"%@`](?:[^\n,\[\]{}]*[^\s:,\[\]{}])?"
+)
+_STR_TAG = "tag:yaml.org,2002:str"
+_resolver = yaml.resolver.Resolver()
+
+
+class _Fallback(Exception):
     """
-    Load a SWML file and format with variables.
+    Raised while rendering when a value can't be substituted directly.
+    """
+
+
+class _Slot:
+    """
+    A scalar of the template containing placeholders.
+    """
+
+    __slots__ = ("pieces", "style", "in_flow")
+
+    def __init__(self, pieces: List[str], style: Optional[str], in_flow: bool) -> None:
+        """
+        Initialize a slot.
+
+        Args:
+            pieces (List[str]): Literal text at even indexes, placeholder
+                names at odd indexes
+            style (Optional[str]): YAML scalar style; None for plain scalars
+            in_flow (bool): Whether the scalar is inside a flow collection
+        """
+        self.pieces = pieces
+        self.style = style
+        self.in_flow = in_flow
+
+    def render(self, values: Dict[str, Any]) -> Any:
+        """
+        Substitute values into the slot.
+
+        Args:
+            values (Dict[str, Any]): Template variables
+
+        Returns:
+            Any: The scalar's value
+
+        Raises:
+            _Fallback: If the value must go through the original path
+        """
+        pieces = self.pieces
+        whole = len(pieces) == 3 and not pieces[0] and not pieces[2]
+        try:
+            if whole:
+                value = values[pieces[1]]
+                if self.style is None and not isinstance(value, str):
+                    # Structured values (e.g. a list of transfer targets) are
+                    # inserted as they are instead of being formatted and reparsed
+                    return value
+                inserted = [format(value)]
+            else:
+                inserted = [format(values[name]) for name in pieces[1::2]]
+        except KeyError:
+            raise _Fallback
+        if any("\n" in text for text in inserted):
+            # Would change the indentation of the lines that follow
+            raise _Fallback
+        text = pieces[0]
+        for value_text, literal in zip(inserted, pieces[2::2]):
+            text += value_text + literal
+        return self._parse(text, inserted, whole)
+
+    def _parse(self, text: str, inserted: List[str], whole: bool) -> Any:
+        """
+        Give substituted text the meaning YAML would have given it in place.
+
+        Args:
+            text (str): The scalar's text after substitution
+            inserted (List[str]): The substituted values
+            whole (bool): Whether the scalar was a single placeholder
+
+        Returns:
+            Any: The scalar's value
+
+        Raises:
+            _Fallback: If only a full parse of the template is reliable
+        """
+        if self.style == '"':
+            if any('"' in value or "\\" in value for value in inserted):
+                raise _Fallback
+            return text
+        if self.style == "'":
+            if any("'" in value for value in inserted):
+                raise _Fallback
+            return text
+        if self.style is not None:
+            # Block scalars
+            return text
+        if _PLAIN_SAFE_RE.fullmatch(text):
+            if _resolver.resolve(yaml.ScalarNode, text, (True, False)) == _STR_TAG:
+                return text
+            # Numbers, booleans, null and the like
+            return yaml.safe_load(text)
+        if self.in_flow:
+            raise _Fallback
+        if text == "":
+            return None
+        if whole and text[0] in "[{":
+            # A flow collection substituted as a whole value
+            return yaml.safe_load(text)
+        raise _Fallback
+
+
+def _build(value: Any, slots: List[str], styles: Dict[str, Tuple[Any, bool]]) -> Any:
+    """
+    Turn parsed template data into a render tree.
+
+    Args:
+        value (Any): Parsed data
+        slots (List[str]): Placeholder name of each slot number
+        styles (Dict[str, Tuple[Any, bool]]): Scalar style of each slot
+            scalar and whether it is inside a flow collection
+
+    Returns:
+        Any: Constants as they are, dicts and lists of subtrees, and _Slots
+    """
+    if isinstance(value, dict):
+        return {k: _build(v, slots, styles) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_build(v, slots, styles) for v in value]
+    if isinstance(value, str) and _SLOT_RE.search(value):
+        pieces = _SLOT_RE.split(value)
+        for i in range(1, len(pieces), 2):
+            pieces[i] = slots[int(pieces[i])]
+        return _Slot(pieces, *styles[value])
+    return value
+
+
+def _render(node: Any, values: Dict[str, Any]) -> Any:
+    """
+    Render a tree into fresh containers, so callers may modify the result.
+
+    Args:
+        node (Any): Render tree node
+        values (Dict[str, Any]): Template variables
+
+    Returns:
+        Any: The rendered data
+    """
+    if isinstance(node, dict):
+        return {k: _render(v, values) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_render(v, values) for v in node]
+    if isinstance(node, _Slot):
+        return node.render(values)
+    return node
+
+
+def compile_swml_template(text: str) -> Any:
+    """
+    Compile YAML template text into a render tree.
+
+    Args:
+        text (str): Template text with ``{name}`` placeholders
+
+    Returns:
+        Any: The render tree
+
+    Raises:
+        ValueError: If the template uses placeholders that can't be slotted
+            (format specs, conversions, indexing, or placeholders in keys)
+        yaml.YAMLError: If the template is not valid YAML
+    """
+    parts = []
+    slots: List[str] = []
+    # parse() also turns "{{" and "}}" into literal braces, as format() does
+    for literal, field, spec, conversion in string.Formatter().parse(text):
+        parts.append(literal)
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            raise ValueError(f"Unsupported placeholder {{{field}}}")
+        parts.append(_SLOT_TOKEN.format(len(slots)))
+        slots.append(field)
+
+    loader = yaml.SafeLoader("".join(parts))
+    try:
+        root = loader.get_single_node()
+        styles: Dict[str, Tuple[Any, bool]] = {}
+        pending = [(root, False)] if root is not None else []
+        while pending:
+            node, in_flow = pending.pop()
+            if isinstance(node, yaml.ScalarNode):
+                if _SLOT_RE.search(node.value):
+                    styles[node.value] = (node.style, in_flow)
+                continue
+            in_flow = in_flow or bool(node.flow_style)
+            if isinstance(node, yaml.MappingNode):
+                for key, value in node.value:
+                    if isinstance(key, yaml.ScalarNode) and _SLOT_RE.search(key.value):
+                        raise ValueError("Placeholders in keys are not supported")
+                    pending.extend(((key, in_flow), (value, in_flow)))
+            else:
+                pending.extend((child, in_flow) for child in node.value)
+        data = loader.construct_document(root) if root is not None else None
+    finally:
+        loader.dispose()
+    return _build(data, slots, styles)
+
+
+class _CompiledTemplate:
+    """
+    Cache entry for one template file.
+    """
+
+    __slots__ = ("signature", "tree", "checked_at")
+
+    def __init__(self, signature: Tuple[int, int], tree: Any, checked_at: float):
+        self.signature = signature
+        # None when the file can't be compiled and always takes the original path
+        self.tree = tree
+        self.checked_at = checked_at
+
+
+_templates: Dict[str, _CompiledTemplate] = {}
+_templates_lock = threading.Lock()
+_template_stats: Dict[str, int] = {"renders": 0, "compiles": 0, "fallbacks": 0}
+
+
+def _file_signature(path: str) -> Tuple[int, int]:
+    """
+    Get a file's modification time and size.
+
+    Args:
+        path (str): File path
+
+    Returns:
+        Tuple[int, int]: (mtime in nanoseconds, size)
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _get_template(swml_file: str) -> _CompiledTemplate:
+    """
+    Get a file's compiled template, compiling it on first use or after the
+    file changed.
+
+    Args:
+        swml_file (str): Path to the YAML template
+
+    Returns:
+        _CompiledTemplate: The cache entry
+    """
+    now = time.monotonic()
+    template = _templates.get(swml_file)
+    if template and now - template.checked_at < SWML_TEMPLATE_CHECK_INTERVAL:
+        return template
+
+    with _templates_lock:
+        template = _templates.get(swml_file)
+        if template and now - template.checked_at < SWML_TEMPLATE_CHECK_INTERVAL:
+            return template
+        signature = _file_signature(swml_file)
+        if template is not None and template.signature == signature:
+            template.checked_at = now
+            return template
+
+        with open(swml_file, "r") as f:
+            text = f.read()
+        try:
+            tree = compile_swml_template(text)
+        except Exception as e:
+            logger.warning(f"Can't compile {swml_file}, loading it uncached: {e}")
+            tree = None
+        template = _CompiledTemplate(signature, tree, now)
+        _templates[swml_file] = template
+        _template_stats["compiles"] += 1
+        return template
+
+
+def _load_swml_uncached(swml_file: str, **kwargs: Any) -> Optional[Dict[str, Any]]:
+    """
+    Load a SWML file and format with variables by formatting and parsing the
+    whole file.
 
     Args:
         swml_file (str): Path to the SWML file
@@ -35,5 +346,134 @@ def load_swml_with_vars(swml_file: str, **kwargs: Any) -> Optional[Dict[str, Any
         return None
 
 
+def load_swml_with_vars(swml_file: str, **kwargs: Any) -> Optional[Dict[str, Any]]:
+    """
+    Load a SWML file and format with variables.
+
+    Args:
+        swml_file (str): Path to the SWML file
+        **kwargs: Variables to format into the file. For a placeholder that is
+            a whole unquoted YAML value, non-string values (e.g. lists) are
+            inserted as they are.
+
+    Returns:
+        Optional[Dict[str, Any]]: Parsed SWML content or None on error
+    """
+    if not swml_file.endswith((".yml", ".yaml")):
+        return _load_swml_uncached(swml_file, **kwargs)
+    try:
+        template = _get_template(swml_file)
+        if template.tree is not None:
+            result = _render(template.tree, kwargs)
+            _template_stats["renders"] += 1
+            return result
+    except _Fallback:
+        pass
+    except Exception as e:
+        logger.warning(f"Error rendering {swml_file}, loading it uncached: {e}")
+    _template_stats["fallbacks"] += 1
+    return _load_swml_uncached(swml_file, **kwargs)
+
+
+class SWMLDocument(NamedTuple):
+    """
+    A rendered SWML document serialized as JSON.
+    """
+
+    body: bytes
+    # Hex SHA-256 of body, used as a strong ETag
+    etag: str
+    # Base64 SHA-256 of body, for a Repr-Digest header
+    digest: str
+
+
+# (file, variables) -> (template the document was rendered from, document)
+_documents: "OrderedDict[Tuple, Tuple[_CompiledTemplate, SWMLDocument]]" = OrderedDict()
+_documents_lock = threading.Lock()
+_document_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def _serialize_swml(data: Any) -> SWMLDocument:
+    """
+    Serialize a SWML document the way Flask's jsonify does outside debug mode.
+
+    Args:
+        data (Any): The SWML document
+
+    Returns:
+        SWMLDocument: The JSON bytes and their hashes
+    """
+    body = (json.dumps(data, separators=(",", ":"), sort_keys=True) + "\n").encode()
+    sha256 = hashlib.sha256(body)
+    return SWMLDocument(
+        body, sha256.hexdigest(), base64.b64encode(sha256.digest()).decode()
+    )
+
+
+def render_swml_json(swml_file: str, **kwargs: Any) -> Optional[SWMLDocument]:
+    """
+    Load a SWML file formatted with variables as serialized JSON.
+
+    The bytes are cached per (file, variables) and rebuilt when the template
+    is recompiled, so repeated calls with the same variables don't render or
+    serialize anything.
+
+    Args:
+        swml_file (str): Path to the SWML file
+        **kwargs: Variables to format into the file
+
+    Returns:
+        Optional[SWMLDocument]: The serialized document or None on error
+    """
+    key: Optional[Tuple] = (swml_file, tuple(sorted(kwargs.items())))
+    template = None
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable variables (e.g. lists) aren't cached
+        key = None
+    if key is not None and swml_file.endswith((".yml", ".yaml")):
+        try:
+            template = _get_template(swml_file)
+        except OSError:
+            # Reported by load_swml_with_vars below
+            pass
+
+    if key is not None and template is not None:
+        cached = _documents.get(key)
+        if cached is not None and cached[0] is template:
+            _document_stats["hits"] += 1
+            return cached[1]
+
+    data = load_swml_with_vars(swml_file, **kwargs)
+    if data is None:
+        return None
+    document = _serialize_swml(data)
+    _document_stats["misses"] += 1
+    if key is not None and template is not None:
+        with _documents_lock:
+            _documents[key] = (template, document)
+            _documents.move_to_end(key)
+            while len(_documents) > SWML_RESPONSE_CACHE_SIZE:
+                _documents.popitem(last=False)
+    return document
+
+
+def get_swml_template_stats() -> Dict[str, Any]:
+    """
+    Report compiled template and serialized document counters.
+
+    Returns:
+        Dict[str, Any]: Template cache metrics
+    """
+    return {
+        "templates": len(_templates),
+        **_template_stats,
+        "documents": len(_documents),
+        "document_hits": _document_stats["hits"],
+        "document_misses": _document_stats["misses"],
+    }
+
+
 # Note: The fetch_subscriber_address function has been moved to utils/signalwire_client.py
 # Please use SignalWireClient.fetch_subscriber_address() instead.
@@ -12,6 +12,12 @@ import { showSpinner, hideSpinner, fetchAPI } from '../../utils.js';
 // Constants
 const MAX_ATTEMPTS = 3;
 const RETRY_DELAY_MS = 1500;
+const DEFAULT_HEARTBEAT_INTERVAL_MS = 30000; // Until the server sends its interval
+
+// Heartbeat timer state
+let heartbeatTimer = null;
+let heartbeatSubscriberId = null;
+let heartbeatIntervalMs = DEFAULT_HEARTBEAT_INTERVAL_MS;
 
 // Initialize the client and attach event listeners
 export async function createClientAndAttachListeners(host, token, handleIncomingCall) {
@@ -157,6 +163,48 @@ export async function goOffline() {
   return false;
 }
 
+// Send one heartbeat and schedule the next
+async function sendHeartbeat() {
+  if (!heartbeatSubscriberId) return;
+  try {
+    const data = await fetchAPI(`/api/subscriber_heartbeat/${heartbeatSubscriberId}`, {
+      method: 'POST',
+      body: JSON.stringify({})
+    });
+    if (data && data.interval) heartbeatIntervalMs = data.interval * 1000;
+  } catch (error) {
+    console.error('Error sending heartbeat:', error);
+  }
+  if (heartbeatSubscriberId) {
+    clearTimeout(heartbeatTimer);
+    heartbeatTimer = setTimeout(sendHeartbeat, heartbeatIntervalMs);
+  }
+}
+
+// Send heartbeats right away when the network comes back, e.g. after sleep
+function handleNetworkOnline() {
+  clearTimeout(heartbeatTimer);
+  sendHeartbeat();
+}
+
+// Keep the subscriber online on the server while the dashboard is open.
+// Without heartbeats the server marks the subscriber offline after a timeout.
+export function startHeartbeat(subscriberId) {
+  if (!subscriberId || subscriberId === 'unknown') return;
+  stopHeartbeat();
+  heartbeatSubscriberId = subscriberId;
+  window.addEventListener('online', handleNetworkOnline);
+  sendHeartbeat();
+}
+
+// Stop sending heartbeats
+export function stopHeartbeat() {
+  heartbeatSubscriberId = null;
+  clearTimeout(heartbeatTimer);
+  heartbeatTimer = null;
+  window.removeEventListener('online', handleNetworkOnline);
+}
+
 // Handle call acceptance
 export async function acceptCall() {
   if (!DashboardState.invite) return null;
@@ -200,6 +248,8 @@ export async function hangupCall() {
 
 // Clean up resources before page unload
 export function cleanupBeforeUnload() {
+  stopHeartbeat();
+
   // Hangup any active call
   if (DashboardState.call && typeof DashboardState.call.hangup === 'function') {
     try { DashboardState.call.hangup(); } catch (err) {}
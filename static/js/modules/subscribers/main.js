@@ -23,7 +23,9 @@ import {
   acceptCall as clientAcceptCall,
   rejectCall as clientRejectCall,
   hangupCall as clientHangupCall,
-  cleanupBeforeUnload
+  cleanupBeforeUnload,
+  startHeartbeat,
+  stopHeartbeat
 } from './client.js';
 import { hideSpinner } from '../../utils.js';
 
@@ -81,6 +83,7 @@ export async function handleGoOnline() {
   hideSpinner(goOnlineSpinner);
   if (onlineSuccess) {
     setDashboardStatus('online');
+    startHeartbeat(DashboardState.subscriberInfo && DashboardState.subscriberInfo.id);
     if (goOfflineBtn) goOfflineBtn.classList.remove('hidden');
     goOnlineBtn.classList.add('hidden');
   } else {
@@ -92,6 +95,7 @@ export async function handleGoOnline() {
 
 // Handler: Go offline button click
 export async function handleGoOffline() {
+  stopHeartbeat();
   await goOffline();
   setDashboardStatus('offline');
   goOfflineBtn.classList.add('hidden');
@@ -0,0 +1,106 @@
+"""
+Presence store tests: per-subscriber entries, heartbeats and expiry.
+"""
+
+import itertools
+import time
+from datetime import UTC, datetime
+
+import pytest
+
+from livewire.stores import ACTIVE_SUBSCRIBERS_STORE, ONLINE_SUBSCRIBERS_STORE
+from livewire.stores import active_subscribers_store as presence
+from livewire.stores import get_store
+from livewire.stores.records import PresenceRecord
+from livewire.utils.session_utils import SW_PROJECT_ID
+
+_projects = itertools.count()
+
+
+@pytest.fixture
+def session() -> dict:
+    # Stores are process-wide, so each test gets its own project
+    return {SW_PROJECT_ID: f"project-{next(_projects)}"}
+
+
+def test_heartbeat_rewrites_only_its_own_entry(session):
+    project_id = session[SW_PROJECT_ID]
+    store = get_store(ACTIVE_SUBSCRIBERS_STORE)
+    assert presence.set_active_subscriber("sub-a", "/private/a", session)
+    assert presence.set_active_subscriber("sub-b", "/private/b", session)
+    other = store[f"{project_id}/sub-b"]
+
+    assert presence.heartbeat_subscriber("sub-a", session)
+    assert store[f"{project_id}/sub-b"] == other
+    assert project_id not in store
+
+
+def test_heartbeat_for_unknown_subscriber_creates_nothing(session):
+    project_id = session[SW_PROJECT_ID]
+    assert not presence.heartbeat_subscriber("sub-x", session)
+    assert f"{project_id}/sub-x" not in get_store(ACTIVE_SUBSCRIBERS_STORE)
+
+
+def test_expiry_and_revival(session):
+    project_id = session[SW_PROJECT_ID]
+    presence.set_active_subscriber("sub-a", "/private/a", session)
+    presence.set_active_subscriber("sub-b", "/private/b", session)
+    assert presence.get_online_addresses(project_id) == ("/private/a", "/private/b")
+
+    later = time.time() + presence.SUBSCRIBER_PRESENCE_TIMEOUT + 1
+    assert presence.expire_subscribers(later) >= 2
+    assert presence.get_online_addresses(project_id) == ()
+    # The address is kept, so a heartbeat brings the subscriber back
+    assert presence.heartbeat_subscriber("sub-a", session)
+    assert set(presence.get_active_subscribers(session)) == {"sub-a"}
+
+
+def test_set_inactive(session):
+    presence.set_active_subscriber("sub-a", "/private/a", session)
+    assert presence.set_inactive_subscriber("sub-a", session)
+    assert presence.get_active_subscribers(session) == {}
+    assert not presence.set_inactive_subscriber("sub-missing", session)
+
+
+def _write_foreign_presence(project_id, subscriber_id, address, expires_at):
+    """
+    Write presence the way another worker (or a previous run) would have,
+    leaving this process's expiry heap unaware of it.
+    """
+    get_store(ACTIVE_SUBSCRIBERS_STORE)[f"{project_id}/{subscriber_id}"] = (
+        PresenceRecord(
+            address=address,
+            online=True,
+            last_seen=datetime.now(UTC),
+            expires_at=expires_at,
+        )
+    )
+    presence._sync_online(project_id, subscriber_id)
+
+
+def test_online_addresses_skip_expired_foreign_entries(session):
+    project_id = session[SW_PROJECT_ID]
+    presence.set_active_subscriber("sub-a", "/private/a", session)
+    _write_foreign_presence(project_id, "sub-gone", "/private/gone", time.time() - 1)
+
+    assert presence.get_online_addresses(project_id) == ("/private/a",)
+    assert set(presence.get_active_subscribers(session)) == {"sub-a"}
+    # The stale entry was marked offline and dropped from the index
+    online = get_store(ONLINE_SUBSCRIBERS_STORE)[project_id]
+    assert set(online.members) == {"sub-a"}
+
+
+def test_expiry_heap_is_rebuilt_from_the_store(session, monkeypatch):
+    project_id = session[SW_PROJECT_ID]
+    expires_at = time.time() + 5
+    _write_foreign_presence(project_id, "sub-old", "/private/old", expires_at)
+
+    # A fresh process has an empty heap
+    monkeypatch.setattr(presence, "_expiry_heap", [])
+    monkeypatch.setattr(presence, "_deadlines", {})
+    monkeypatch.setattr(presence, "_expiry_loaded", False)
+
+    presence.expire_subscribers(expires_at + 1)
+    entry = get_store(ACTIVE_SUBSCRIBERS_STORE)[f"{project_id}/sub-old"]
+    assert not entry.get("online")
+    assert project_id not in get_store(ONLINE_SUBSCRIBERS_STORE)
@@ -0,0 +1,53 @@
+"""
+Change feed socket tests: stale socket cleanup and permissions.
+"""
+
+import os
+import socket
+import stat
+
+import pytest
+
+from livewire.stores import change_feed
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    path = str(tmp_path / "feed.sock")
+    yield path
+    with change_feed._socket_lock:
+        server = change_feed._socket_servers.pop(path, None)
+    if server is not None:
+        server.close()
+
+
+def test_serves_with_owner_only_permissions(socket_path):
+    assert change_feed.serve_change_feed(socket_path) == socket_path
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+
+def test_replaces_a_stale_socket(socket_path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    assert change_feed.serve_change_feed(socket_path) == socket_path
+
+
+def test_leaves_a_live_socket_alone(socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as other:
+        other.bind(socket_path)
+        other.listen()
+
+        assert change_feed.serve_change_feed(socket_path) is None
+        assert os.path.exists(socket_path)
+        assert socket_path not in change_feed._socket_servers
+
+
+def test_leaves_other_files_alone(socket_path):
+    with open(socket_path, "w") as f:
+        f.write("not a socket")
+
+    assert change_feed.serve_change_feed(socket_path) is None
+    with open(socket_path) as f:
+        assert f.read() == "not a socket"
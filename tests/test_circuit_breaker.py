@@ -0,0 +1,171 @@
+"""
+Circuit breaker tests: probe slots claimed while half-open must always be
+given back, however the call ends.
+"""
+
+import asyncio
+import itertools
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from livewire.utils.async_signalwire_client import AsyncSignalWireClient
+from livewire.utils.circuit_breaker import (STATE_CLOSED, STATE_HALF_OPEN,
+                                            STATE_OPEN, CircuitBreaker,
+                                            get_circuit_breaker)
+from livewire.utils.signalwire_client import (SignalWireAPIError,
+                                              SignalWireClient)
+
+ENDPOINT = "fabric/resources/subscribers"
+
+_spaces = itertools.count()
+
+
+def half_open_breaker(breaker: CircuitBreaker) -> CircuitBreaker:
+    """
+    Trip a breaker and let its open period lapse, so the next call probes.
+    """
+    breaker.open_seconds = 0
+    for _ in range(breaker.min_calls):
+        breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    return breaker
+
+
+@pytest.fixture
+def space_name() -> str:
+    # Breakers are shared per space, so each test gets its own
+    return f"test-space-{next(_spaces)}"
+
+
+def test_opens_at_failure_rate():
+    breaker = CircuitBreaker("test", min_calls=4, failure_rate=0.5)
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow_request()
+
+
+def test_half_open_probe_success_closes():
+    breaker = half_open_breaker(CircuitBreaker("test"))
+    assert breaker.allow_request()
+    assert breaker.state == STATE_HALF_OPEN
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow_request()
+
+
+def test_half_open_probe_failure_reopens():
+    breaker = half_open_breaker(CircuitBreaker("test"))
+    assert breaker.allow_request()
+    breaker.open_seconds = 60
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow_request()
+
+
+def test_release_frees_probe_slot():
+    breaker = half_open_breaker(CircuitBreaker("test"))
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.release()
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.allow_request()
+
+
+def test_release_outside_half_open_is_a_no_op():
+    breaker = CircuitBreaker("test")
+    assert breaker.allow_request()
+    breaker.release()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.stats()["calls_in_window"] == 0
+
+
+def test_async_cancelled_probe_releases_slot(space_name):
+    breaker = half_open_breaker(get_circuit_breaker(space_name, ENDPOINT))
+
+    async def scenario() -> None:
+        client = AsyncSignalWireClient(
+            "project", "token", space_name, base_url="http://127.0.0.1:9"
+        )
+        started = asyncio.Event()
+
+        async def hang(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(60)
+
+        client._send_once = hang
+        task = asyncio.create_task(client._request("GET", ENDPOINT))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await client.close()
+
+    asyncio.run(scenario())
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.allow_request()
+
+
+def test_async_timed_out_probe_releases_slot(space_name):
+    breaker = half_open_breaker(get_circuit_breaker(space_name, ENDPOINT))
+
+    async def scenario() -> None:
+        client = AsyncSignalWireClient(
+            "project", "token", space_name, base_url="http://127.0.0.1:9"
+        )
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(60)
+
+        client._send_once = hang
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client._request("GET", ENDPOINT), 0.05)
+        await client.close()
+
+    asyncio.run(scenario())
+    assert breaker.allow_request()
+
+
+def test_async_malformed_body_raises_api_error(space_name):
+    breaker = half_open_breaker(get_circuit_breaker(space_name, ENDPOINT))
+
+    async def malformed(request: web.Request) -> web.Response:
+        return web.Response(text="{not json", content_type="application/json")
+
+    async def scenario() -> None:
+        app = web.Application()
+        app.router.add_get(f"/{ENDPOINT}", malformed)
+        async with TestServer(app) as server:
+            client = AsyncSignalWireClient(
+                "project", "token", space_name, base_url=str(server.make_url(""))
+            )
+            async with client:
+                with pytest.raises(SignalWireAPIError) as raised:
+                    await client._request("GET", ENDPOINT)
+        assert not raised.value.is_retryable
+
+    asyncio.run(scenario())
+    # The endpoint answered, so the probe counts as a success
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow_request()
+
+
+def test_sync_unexpected_error_releases_slot(space_name):
+    breaker = half_open_breaker(get_circuit_breaker(space_name, ENDPOINT))
+    client = SignalWireClient(
+        "project", "token", space_name, base_url="http://127.0.0.1:9"
+    )
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    client._send_once = fail
+    with pytest.raises(RuntimeError):
+        client._request("GET", ENDPOINT)
+    assert breaker.allow_request()
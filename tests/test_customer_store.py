@@ -0,0 +1,46 @@
+"""
+Customer store tests: index lookups and one-time initialization.
+"""
+
+import itertools
+
+from livewire.stores import CUSTOMER_INDEX_STORE, customer_store, get_store
+
+_members = itertools.count()
+
+
+def add_member(**fields) -> str:
+    member_id = f"CS{next(_members):05d}"
+    assert customer_store.add_customer({"member_id": member_id, **fields})
+    return member_id
+
+
+def test_lookups_by_email_and_phone():
+    member_id = add_member(email="Lookup@Example.com", phone="+1 (555) 010-0001")
+    assert customer_store.get_customer_by_email(" lookup@example.com")["member_id"] == (
+        member_id
+    )
+    assert customer_store.get_customer_by_phone("15550100001")["member_id"] == member_id
+    assert customer_store.get_customer(member_id.lower())["member_id"] == member_id
+
+
+def test_stale_index_entry_is_a_miss():
+    add_member(email="stale@example.com")
+    other_id = add_member(email="other@example.com")
+    # An entry left pointing at a member whose email has since changed
+    get_store(CUSTOMER_INDEX_STORE)["email:stale@example.com"] = other_id
+
+    assert customer_store.get_customer_by_email("stale@example.com") is None
+    assert customer_store.get_customer_by_email("other@example.com")["member_id"] == (
+        other_id
+    )
+
+
+def test_lookups_do_not_check_store_size(monkeypatch):
+    add_member(email="sized@example.com")
+
+    def count(self):
+        raise AssertionError("the store was counted on a lookup")
+
+    monkeypatch.setattr(type(customer_store.get_customer_store()), "__len__", count)
+    assert customer_store.get_customer_by_email("sized@example.com") is not None
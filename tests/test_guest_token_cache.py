@@ -0,0 +1,53 @@
+"""
+Guest token cache tests: background refills follow the client registry.
+"""
+
+import itertools
+
+from livewire.utils import guest_token_cache
+from livewire.utils.client_registry import get_client, invalidate_client
+
+_projects = itertools.count()
+
+
+def minting_client(credentials, minted):
+    client = get_client(*credentials)
+    tokens = itertools.count()
+
+    def create_guest_token(address_id):
+        minted.append(client)
+        return {"token": f"token-{next(tokens)}"}
+
+    client.create_guest_token = create_guest_token
+    return client
+
+
+def test_refill_uses_the_current_registry_client():
+    credentials = (f"guest-project-{next(_projects)}", "token", "guest-space")
+    address_id = f"address-{credentials[0]}"
+    minted = []
+    old = minting_client(credentials, minted)
+    guest_token_cache.get_guest_token(old, address_id)
+
+    invalidate_client(*credentials)
+    new = minting_client(credentials, minted)
+    minted.clear()
+    guest_token_cache.refill_pools()
+
+    assert minted and all(client is new for client in minted)
+    guest_token_cache.invalidate_guest_tokens(address_id)
+
+
+def test_no_refill_without_a_live_client():
+    credentials = (f"guest-project-{next(_projects)}", "token", "guest-space")
+    address_id = f"address-{credentials[0]}"
+    minted = []
+    client = minting_client(credentials, minted)
+    guest_token_cache.get_guest_token(client, address_id)
+
+    invalidate_client(*credentials)
+    minted.clear()
+    guest_token_cache.refill_pools()
+
+    assert minted == []
+    guest_token_cache.invalidate_guest_tokens(address_id)
@@ -0,0 +1,50 @@
+"""
+Handler address cache tests: updates must not leave old addresses cached.
+"""
+
+import itertools
+
+from livewire.utils.handler_address_cache import get_handler_address_info
+from livewire.utils.signalwire_client import SignalWireClient
+
+_spaces = itertools.count()
+
+
+class FakeHandlerClient(SignalWireClient):
+    """
+    Serves one handler whose address changes when it is updated. While the
+    update is in flight, a read of the addresses runs and sees the old ones.
+    """
+
+    def __init__(self) -> None:
+        super().__init__("project", "token", f"test-space-{next(_spaces)}")
+        self.audio = "/public/old"
+        self.fetches = 0
+
+    def _request(self, method, endpoint, data=None, params=None, timeout=None):
+        if method == "PATCH":
+            # A concurrent call reads the handler before the update applies
+            get_handler_address_info(self, "handler-1")
+            self.audio = "/public/new"
+            return {"id": "handler-1"}
+        if method == "POST":
+            return {"id": "handler-2"}
+        self.fetches += 1
+        return {"data": [{"id": "address-1", "channels": {"audio": self.audio}}]}
+
+
+def test_update_drops_addresses_read_during_the_write():
+    client = FakeHandlerClient()
+    assert get_handler_address_info(client, "handler-1")["destination"] == "/public/old"
+
+    client.update_swml_handler("handler-1", "name", "https://example.com/swml")
+    assert get_handler_address_info(client, "handler-1")["destination"] == "/public/new"
+
+
+def test_create_keeps_other_handlers_cached():
+    client = FakeHandlerClient()
+    get_handler_address_info(client, "handler-1")
+    client.create_swml_handler("name", "https://example.com/swml")
+
+    get_handler_address_info(client, "handler-1")
+    assert client.fetches == 1
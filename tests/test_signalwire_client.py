@@ -0,0 +1,84 @@
+"""
+Sync client tests: background requests and pagination.
+"""
+
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from livewire.utils.rate_limiter import get_rate_limiter
+from livewire.utils.signalwire_client import SignalWireClient
+
+_projects = itertools.count()
+BASE_URL = "http://127.0.0.1:9/api"
+
+
+def make_client() -> SignalWireClient:
+    return SignalWireClient(
+        f"client-project-{next(_projects)}",
+        "token",
+        "client-space",
+        base_url=BASE_URL,
+    )
+
+
+def drain(client: SignalWireClient) -> None:
+    bucket = get_rate_limiter(client.project_id)
+    while bucket.try_acquire() == 0:
+        pass
+
+
+def test_background_request_waits_for_a_rate_token():
+    client = make_client()
+    client._send_once = lambda *args: {"ok": True}
+    drain(client)
+
+    future = client.request_in_background("GET", "fabric/resources")
+    assert future.result(timeout=4) == {"ok": True}
+
+
+def test_prefetched_pages_wait_for_a_rate_token():
+    client = make_client()
+    pages = {
+        "/api/fabric/resources": {"data": [1], "links": {"next": "/api/fabric/r?p=2"}},
+        "/api/fabric/r": {"data": [2], "links": {}},
+    }
+    client._send_once = lambda method, url, *args: pages[
+        url[len("http://127.0.0.1:9") :]
+    ]
+
+    listed = client._iter_pages("fabric/resources", prefetch=True)
+    assert next(listed)["data"] == [1]
+    drain(client)
+    assert [page["data"] for page in listed] == [[2]]
+
+
+def test_reads_with_different_credentials_are_not_merged():
+    project_id = f"client-project-{next(_projects)}"
+    started = threading.Event()
+    release = threading.Event()
+    tokens = []
+
+    def make(token: str) -> SignalWireClient:
+        client = SignalWireClient(project_id, token, "client-space", base_url=BASE_URL)
+
+        def send(*args):
+            tokens.append(token)
+            started.set()
+            release.wait(4)
+            return {"token": token}
+
+        client._send_once = send
+        return client
+
+    good, revoked = make("good"), make("revoked")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(good._request, "GET", "fabric/resources")
+        started.wait(4)
+        second = pool.submit(revoked._request, "GET", "fabric/resources")
+        time.sleep(0.1)
+        release.set()
+        assert first.result(timeout=4) == {"token": "good"}
+        assert second.result(timeout=4) == {"token": "revoked"}
+    assert sorted(tokens) == ["good", "revoked"]
@@ -0,0 +1,40 @@
+"""
+SignalWire API simulator tests: list pagination.
+"""
+
+import pytest
+
+from livewire.simulator import MAX_PAGE_SIZE, create_simulator_app
+
+SUBSCRIBERS_PATH = "/api/fabric/resources/subscribers"
+HEADERS = {"Authorization": "Basic dGVzdDp0ZXN0"}
+
+
+@pytest.fixture
+def client():
+    return create_simulator_app(subscribers=5).test_client()
+
+
+def test_pages_follow_next_links(client):
+    ids = []
+    url = f"{SUBSCRIBERS_PATH}?page_size=2"
+    while url:
+        response = client.get(url, headers=HEADERS)
+        assert response.status_code == 200
+        ids += [item["id"] for item in response.json["data"]]
+        url = response.json["links"].get("next")
+    assert len(ids) == len(set(ids)) == 5
+
+
+def test_page_size_is_capped(client):
+    response = client.get(
+        f"{SUBSCRIBERS_PATH}?page_size={MAX_PAGE_SIZE + 1}", headers=HEADERS
+    )
+    assert f"page_size={MAX_PAGE_SIZE}&" in response.json["links"]["self"]
+
+
+@pytest.mark.parametrize("page_size", ["ten", "0", "-1"])
+def test_invalid_page_size_is_a_bad_request(client, page_size):
+    response = client.get(f"{SUBSCRIBERS_PATH}?page_size={page_size}", headers=HEADERS)
+    assert response.status_code == 400
+    assert "page_size" in response.json["message"]
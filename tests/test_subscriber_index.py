@@ -0,0 +1,133 @@
+"""
+Subscriber index tests: cold builds, refreshes and misses.
+"""
+
+import asyncio
+import itertools
+
+from livewire.utils import subscriber_index
+from livewire.utils.async_signalwire_client import AsyncSignalWireClient
+from livewire.utils.signalwire_client import SignalWireClient
+from livewire.utils.subscriber_index import get_subscriber_index
+
+_spaces = itertools.count()
+
+
+def _page(*subscribers):
+    return {
+        "data": [
+            {"id": subscriber_id, "subscriber": {"email": email}}
+            for subscriber_id, email in subscribers
+        ]
+    }
+
+
+class FakePagesClient(AsyncSignalWireClient):
+    """
+    Serves the subscribers list from ``pages`` and counts scans.
+    """
+
+    def __init__(self, pages):
+        super().__init__(
+            "project", "token", f"index-space-{next(_spaces)}", base_url="http://x"
+        )
+        self.pages = pages
+        self.scans = 0
+
+    async def _iter_pages(self, endpoint, params=None, prefetch=False):
+        self.scans += 1
+        for page in list(self.pages):
+            await asyncio.sleep(0)
+            yield page
+
+
+def test_concurrent_cold_lookups_build_once():
+    async def scenario():
+        client = FakePagesClient([_page(("sub-a", "A@example.com"))])
+        results = await asyncio.gather(
+            *(client.get_subscriber_by_email("a@example.com") for _ in range(5))
+        )
+        await client.close()
+        return client, results
+
+    client, results = asyncio.run(scenario())
+    assert client.scans == 1
+    assert all(subscriber_id == "sub-a" for _, subscriber_id in results)
+
+
+def test_refresh_updates_the_index_in_place(monkeypatch):
+    monkeypatch.setattr(subscriber_index, "SUBSCRIBER_INDEX_REFRESH_SECONDS", 0)
+
+    async def scenario():
+        client = FakePagesClient(
+            [_page(("sub-a", "a@example.com"), ("sub-b", "b@example.com"))]
+        )
+        assert (await client.get_subscriber_by_email("b@example.com"))[1] == "sub-b"
+        index = get_subscriber_index(client.space_name, client.project_id)
+
+        client.pages = [_page(("sub-a", "a@example.com"), ("sub-c", "c@example.com"))]
+        # Served from the existing entries while the refresh runs
+        assert (await client.get_subscriber_by_email("a@example.com"))[1] == "sub-a"
+        while index.stats()["scans"] < 2:
+            await asyncio.sleep(0)
+        await client.close()
+        return index
+
+    index = asyncio.run(scenario())
+    assert index.lookup("c@example.com")[1] == "sub-c"
+    assert index.lookup("b@example.com") == (None, None)
+
+
+def test_async_miss_rescans_for_subscribers_created_elsewhere():
+    async def scenario():
+        client = FakePagesClient([_page(("sub-a", "a@example.com"))])
+        assert (await client.get_subscriber_by_email("a@example.com"))[1] == "sub-a"
+        client.pages = [_page(("sub-a", "a@example.com"), ("sub-b", "b@example.com"))]
+        found = await client.get_subscriber_by_email("b@example.com")
+        await client.close()
+        return client, found
+
+    client, found = asyncio.run(scenario())
+    assert found[1] == "sub-b"
+    assert client.scans == 2
+
+
+class FakeSyncPagesClient(SignalWireClient):
+    """
+    Serves the subscribers list from ``pages`` and counts scans.
+    """
+
+    def __init__(self, pages):
+        super().__init__(
+            "project", "token", f"index-space-{next(_spaces)}", base_url="http://x"
+        )
+        self.pages = pages
+        self.scans = 0
+
+    def _iter_pages(self, endpoint, params=None, prefetch=False):
+        self.scans += 1
+        yield from list(self.pages)
+
+
+def test_miss_rescans_for_subscribers_created_elsewhere():
+    client = FakeSyncPagesClient([_page(("sub-a", "a@example.com"))])
+    assert client.get_subscriber_by_email("a@example.com")[1] == "sub-a"
+
+    client.pages = [_page(("sub-a", "a@example.com"), ("sub-b", "b@example.com"))]
+    assert client.get_subscriber_by_email("b@example.com")[1] == "sub-b"
+    assert client.get_subscriber_by_email("c@example.com") == (None, None)
+    assert client.scans == 3
+
+
+def test_created_subscribers_are_indexed_without_the_password():
+    client = FakeSyncPagesClient([])
+    client._request = lambda *args, **kwargs: {
+        "id": "sub-new",
+        "subscriber": {"email": "new@example.com", "password": "secret"},
+    }
+    client.create_subscriber({"email": "new@example.com", "password": "secret"})
+
+    index = get_subscriber_index(client.space_name, client.project_id)
+    subscriber, subscriber_id = index.lookup("new@example.com")
+    assert subscriber_id == "sub-new"
+    assert "password" not in subscriber